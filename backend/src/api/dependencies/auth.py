@@ -37,21 +37,26 @@ async def get_current_user(
 
 
 async def get_current_user_id(
-    user: AuthenticatedUser = Depends(get_current_user),
+    authorization: str | None = Header(None, alias="Authorization"),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> UUID:
     """
     Get current user ID as UUID.
 
-    Lightweight dependency that extracts UUID from authenticated user.
-    No additional token validation needed.
+    Lightweight dependency that reads the subject claim directly from the
+    validated token without constructing an AuthenticatedUser.
 
     Args:
-        user: Authenticated user from get_current_user dependency
+        authorization: Authorization header value
+        auth_service: Authentication service instance
 
     Returns:
         User ID as UUID
+
+    Raises:
+        HTTPException: If authentication fails
     """
-    return user.id
+    return auth_service.authenticate_user_id_only(authorization)
 
 
 async def get_current_user_session(
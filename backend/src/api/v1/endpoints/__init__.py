@@ -5,10 +5,13 @@ from src.api.v1.endpoints import (
     alliances,
     analytics,
     copper_mines,
+    donations,
     events,
     hegemony_weights,
+    linebot,
     periods,
     seasons,
+    subscriptions,
     uploads,
 )
 
@@ -17,9 +20,12 @@ __all__ = [
     "alliances",
     "analytics",
     "copper_mines",
+    "donations",
     "events",
     "hegemony_weights",
+    "linebot",
     "periods",
     "seasons",
+    "subscriptions",
     "uploads",
 ]
@@ -10,16 +10,18 @@ Alliance Collaborators API Endpoints
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response
 
 from src.core.dependencies import (
     AllianceCollaboratorServiceDep,
     PermissionServiceDep,
     UserIdDep,
 )
+from src.core.utils import conditional_json_response
 from src.models.alliance_collaborator import (
     AllianceCollaboratorCreate,
     AllianceCollaboratorListResponse,
+    ProcessInvitationsResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,7 +31,7 @@ router = APIRouter(tags=["alliance-collaborators"])
 
 @router.post(
     "/alliances/{alliance_id}/collaborators",
-    status_code=status.HTTP_201_CREATED,
+    status_code=201,
     summary="Add collaborator to alliance",
 )
 async def add_alliance_collaborator(
@@ -66,6 +68,7 @@ async def add_alliance_collaborator(
     summary="Get alliance collaborators",
 )
 async def get_alliance_collaborators(
+    request: Request,
     alliance_id: UUID,
     current_user_id: UserIdDep,
     service: AllianceCollaboratorServiceDep,
@@ -73,8 +76,12 @@ async def get_alliance_collaborators(
     """
     Get all collaborators of an alliance.
 
+    Responses carry an ETag and a short private Cache-Control so polling
+    clients can reuse or revalidate them.
+
     Returns:
     - 200: List of collaborators
+    - 304: Not modified (If-None-Match matched)
     - 403: Not a collaborator of alliance
 
     符合 CLAUDE.md 🔴: API layer delegates to service
@@ -82,14 +89,17 @@ async def get_alliance_collaborators(
     collaborators = await service.get_alliance_collaborators(
         current_user_id, alliance_id
     )
-    return AllianceCollaboratorListResponse(
-        collaborators=collaborators, total=len(collaborators)
+    return conditional_json_response(
+        request,
+        AllianceCollaboratorListResponse(
+            collaborators=collaborators, total=len(collaborators)
+        ),
     )
 
 
 @router.delete(
     "/alliances/{alliance_id}/collaborators/{user_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
+    status_code=204,
     summary="Remove collaborator from alliance",
 )
 async def remove_alliance_collaborator(
@@ -97,7 +107,7 @@ async def remove_alliance_collaborator(
     user_id: UUID,
     current_user_id: UserIdDep,
     service: AllianceCollaboratorServiceDep,
-):
+) -> Response:
     """
     Remove a collaborator from alliance.
 
@@ -113,18 +123,18 @@ async def remove_alliance_collaborator(
     符合 CLAUDE.md 🔴: API layer delegates to service
     """
     await service.remove_collaborator(current_user_id, alliance_id, user_id)
-    return None
+    return Response(status_code=204)
 
 
 @router.post(
     "/collaborators/process-invitations",
-    status_code=status.HTTP_200_OK,
+    response_model=ProcessInvitationsResponse,
     summary="Process pending invitations for current user",
 )
 async def process_pending_invitations(
     current_user_id: UserIdDep,
     service: AllianceCollaboratorServiceDep,
-):
+) -> dict:
     """
     Process all pending invitations for the authenticated user.
 
@@ -156,7 +166,6 @@ async def process_pending_invitations(
 
 @router.patch(
     "/alliances/{alliance_id}/collaborators/{user_id}/role",
-    status_code=status.HTTP_200_OK,
     summary="Update collaborator role",
 )
 async def update_collaborator_role(
@@ -189,10 +198,10 @@ async def update_collaborator_role(
 
 @router.get(
     "/alliances/{alliance_id}/my-role",
-    status_code=status.HTTP_200_OK,
     summary="Get current user's role in alliance",
 )
 async def get_my_role(
+    request: Request,
     alliance_id: UUID,
     current_user_id: UserIdDep,
     permission_service: PermissionServiceDep,
@@ -200,8 +209,12 @@ async def get_my_role(
     """
     Get current user's role in alliance.
 
+    Responses carry an ETag and a short private Cache-Control so polling
+    clients can reuse or revalidate them.
+
     Returns:
     - 200: {"role": "owner|collaborator|member"}
+    - 304: Not modified (If-None-Match matched)
 
     Raises:
     - ValueError: User is not a member of this alliance
@@ -214,4 +227,4 @@ async def get_my_role(
     if role is None:
         raise ValueError("You are not a member of this alliance")
 
-    return {"role": role}
+    return conditional_json_response(request, {"role": role})
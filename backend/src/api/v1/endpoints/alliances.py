@@ -11,7 +11,7 @@ Alliance API Endpoints
 - Type-safe dependency injection with reusable aliases
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from src.core.dependencies import AllianceServiceDep, UserIdDep
 from src.models.alliance import Alliance, AllianceCreate, AllianceUpdate
@@ -96,7 +96,7 @@ async def update_alliance(
 async def delete_alliance(
     service: AllianceServiceDep,
     user_id: UserIdDep,
-):
+) -> Response:
     """
     Delete current user's alliance
 
@@ -111,3 +111,4 @@ async def delete_alliance(
     符合 CLAUDE.md 🟡: No try/except needed - global handler converts exceptions
     """
     await service.delete_alliance(user_id)
+    return Response(status_code=204)
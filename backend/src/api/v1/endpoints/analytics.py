@@ -10,6 +10,7 @@ Follows CLAUDE.md:
 - Typed response models for OpenAPI docs
 """
 
+from urllib.parse import unquote
 from uuid import UUID
 
 from fastapi import APIRouter, Query
@@ -326,8 +327,6 @@ async def get_group_analytics(
     Returns:
         Complete group analytics response
     """
-    from urllib.parse import unquote
-
     await season_service.verify_user_access(user_id, season_id)
 
     # Decode URL-encoded group name
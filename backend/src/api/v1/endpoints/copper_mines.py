@@ -12,13 +12,14 @@ API layer for copper mine rules and ownership management (Dashboard).
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Response
 
 from src.core.dependencies import (
-    AllianceServiceDep,
     CopperMineRuleServiceDep,
     CopperMineServiceDep,
+    SeasonIdQuery,
     SeasonServiceDep,
+    UserAllianceDep,
     UserIdDep,
 )
 from src.models.copper_mine import (
@@ -42,15 +43,13 @@ router = APIRouter(prefix="/copper-mines", tags=["copper-mines"])
 @router.get("/rules", response_model=list[CopperMineRuleResponse])
 async def get_rules(
     rule_service: CopperMineRuleServiceDep,
-    alliance_service: AllianceServiceDep,
-    user_id: UserIdDep,
+    alliance: UserAllianceDep,
 ):
     """
     Get all copper mine rules for current user's alliance.
 
     Returns rules sorted by tier (ascending).
     """
-    alliance = await alliance_service.get_user_alliance(user_id)
     return await rule_service.get_rules(alliance.id)
 
 
@@ -58,8 +57,7 @@ async def get_rules(
 async def create_rule(
     data: CopperMineRuleCreate,
     rule_service: CopperMineRuleServiceDep,
-    alliance_service: AllianceServiceDep,
-    user_id: UserIdDep,
+    alliance: UserAllianceDep,
 ):
     """
     Create a new copper mine rule.
@@ -68,7 +66,6 @@ async def create_rule(
     - Tier must be sequential (next available tier)
     - Required merit must be greater than previous tier
     """
-    alliance = await alliance_service.get_user_alliance(user_id)
     return await rule_service.create_rule(
         alliance_id=alliance.id,
         tier=data.tier,
@@ -82,8 +79,7 @@ async def update_rule(
     rule_id: UUID,
     data: CopperMineRuleUpdate,
     rule_service: CopperMineRuleServiceDep,
-    alliance_service: AllianceServiceDep,
-    user_id: UserIdDep,
+    alliance: UserAllianceDep,
 ):
     """
     Update a copper mine rule.
@@ -91,7 +87,6 @@ async def update_rule(
     Validates:
     - Required merit must be > previous tier and < next tier
     """
-    alliance = await alliance_service.get_user_alliance(user_id)
     return await rule_service.update_rule(
         rule_id=rule_id,
         alliance_id=alliance.id,
@@ -104,16 +99,15 @@ async def update_rule(
 async def delete_rule(
     rule_id: UUID,
     rule_service: CopperMineRuleServiceDep,
-    alliance_service: AllianceServiceDep,
-    user_id: UserIdDep,
-):
+    alliance: UserAllianceDep,
+) -> Response:
     """
     Delete a copper mine rule.
 
     Only allows deleting the highest tier rule to maintain sequence.
     """
-    alliance = await alliance_service.get_user_alliance(user_id)
     await rule_service.delete_rule(rule_id=rule_id, alliance_id=alliance.id)
+    return Response(status_code=204)
 
 
 # =============================================================================
@@ -124,10 +118,10 @@ async def delete_rule(
 @router.get("/ownerships", response_model=CopperMineOwnershipListResponse)
 async def get_ownerships(
     mine_service: CopperMineServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     season_service: SeasonServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
     """
     Get copper mine ownerships for a season.
@@ -137,7 +131,6 @@ async def get_ownerships(
     # Verify user access to season
     await season_service.verify_user_access(user_id, season_id)
 
-    alliance = await alliance_service.get_user_alliance(user_id)
     ownerships = await mine_service.get_ownerships_by_season(
         season_id=season_id,
         alliance_id=alliance.id,
@@ -153,10 +146,10 @@ async def get_ownerships(
 async def create_ownership(
     data: CopperMineOwnershipCreate,
     mine_service: CopperMineServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     season_service: SeasonServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
     """
     Create a copper mine ownership.
@@ -168,10 +161,8 @@ async def create_ownership(
     # Verify user access to season
     await season_service.verify_user_access(user_id, season_id)
 
-    alliance = await alliance_service.get_user_alliance(user_id)
-
     # Handle reserved copper mines (use None for member_id)
-    member_uuid = None if data.member_id == "reserved" else UUID(data.member_id)
+    member_uuid = None if data.member_id == "reserved" else data.member_id
 
     return await mine_service.create_ownership(
         season_id=season_id,
@@ -188,19 +179,18 @@ async def create_ownership(
 async def delete_ownership(
     ownership_id: UUID,
     mine_service: CopperMineServiceDep,
-    alliance_service: AllianceServiceDep,
-    user_id: UserIdDep,
-):
+    alliance: UserAllianceDep,
+) -> Response:
     """
     Delete a copper mine ownership.
 
     Verifies the ownership belongs to user's alliance.
     """
-    alliance = await alliance_service.get_user_alliance(user_id)
     await mine_service.delete_ownership(
         ownership_id=ownership_id,
         alliance_id=alliance.id,
     )
+    return Response(status_code=204)
 
 
 @router.patch("/ownerships/{ownership_id}", response_model=CopperMineOwnershipResponse)
@@ -208,10 +198,10 @@ async def update_ownership(
     ownership_id: UUID,
     data: CopperMineOwnershipUpdate,
     mine_service: CopperMineServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     season_service: SeasonServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
     """
     Update a copper mine ownership (for transferring reserved mines to members).
@@ -223,14 +213,9 @@ async def update_ownership(
     # Verify user access to season
     await season_service.verify_user_access(user_id, season_id)
 
-    alliance = await alliance_service.get_user_alliance(user_id)
-
-    # Convert member_id string to UUID
-    member_uuid = UUID(data.member_id)
-
     return await mine_service.update_ownership(
         ownership_id=ownership_id,
         season_id=season_id,
         alliance_id=alliance.id,
-        member_id=member_uuid,
+        member_id=data.member_id,
     )
@@ -13,18 +13,18 @@ Follows CLAUDE.md:
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 
 from src.api.v1.schemas.donations import (
+    BulkDonationTargetOverrideRequest,
     CreateDonationRequest,
     DonationDetailResponse,
     DonationListResponse,
     DonationMemberInfoResponse,
     DonationTargetOverrideRequest,
 )
-from src.core.dependencies import UserIdDep
+from src.core.dependencies import DonationServiceDep, UserIdDep
 from src.models.donation import DonationCreate
-from src.services.donation_service import DonationService
 
 router = APIRouter(prefix="/donations", tags=["donations"])
 
@@ -34,12 +34,17 @@ router = APIRouter(prefix="/donations", tags=["donations"])
 # ============================================================================
 
 
-def get_donation_service() -> DonationService:
-    """Get donation service instance"""
-    return DonationService()
-
+async def require_alliance_access(
+    alliance_id: Annotated[UUID, Query()],
+    user_id: UserIdDep,
+    service: DonationServiceDep,
+) -> None:
+    """
+    Verify write access to the alliance given in the query string
 
-DonationServiceDep = Annotated[DonationService, Depends(get_donation_service)]
+    Shared route dependency so the permission check runs once per request.
+    """
+    await service.require_alliance_access(user_id, alliance_id)
 
 
 # ============================================================================
@@ -49,8 +54,8 @@ DonationServiceDep = Annotated[DonationService, Depends(get_donation_service)]
 
 @router.get("", response_model=list[DonationListResponse])
 async def get_donations(
-    alliance_id: UUID,
-    season_id: UUID,
+    alliance_id: Annotated[UUID, Query()],
+    season_id: Annotated[UUID, Query()],
     user_id: UserIdDep,
     service: DonationServiceDep,
 ) -> list[DonationListResponse]:
@@ -64,17 +69,19 @@ async def get_donations(
     Returns:
         List of donation events ordered by creation time (newest first)
     """
-    await service.require_alliance_access(user_id, alliance_id)
-    donations = await service.get_donations_by_alliance_and_season(
-        alliance_id, season_id
-    )
-    return [DonationListResponse.model_validate(d) for d in donations]
+    donations = await service.get_donations_for_user(user_id, alliance_id, season_id)
+    # Donations are already validated models; skip re-validation on the way out
+    return [DonationListResponse.model_construct(**dict(d)) for d in donations]
 
 
-@router.post("", response_model=DonationListResponse)
+@router.post(
+    "",
+    response_model=DonationListResponse,
+    dependencies=[Depends(require_alliance_access)],
+)
 async def create_donation(
-    alliance_id: UUID,
-    season_id: UUID,
+    alliance_id: Annotated[UUID, Query()],
+    season_id: Annotated[UUID, Query()],
     body: CreateDonationRequest,
     user_id: UserIdDep,
     service: DonationServiceDep,
@@ -96,21 +103,16 @@ async def create_donation(
     Returns:
         Created donation event
     """
-    await service.require_alliance_access(user_id, alliance_id)
-
-    donation_data = DonationCreate(
+    # body is already validated by CreateDonationRequest; skip a second pass
+    donation_data = DonationCreate.model_construct(
+        **dict(body),
         season_id=season_id,
         alliance_id=alliance_id,
-        title=body.title,
-        type=body.type,
-        deadline=body.deadline,
-        target_amount=body.target_amount,
-        description=body.description,
         created_by=user_id,
     )
 
     donation = await service.create_donation(donation_data)
-    return DonationListResponse.model_validate(donation)
+    return DonationListResponse.model_construct(**dict(donation))
 
 
 @router.get("/{donation_id}", response_model=DonationDetailResponse)
@@ -118,7 +120,7 @@ async def get_donation_detail(
     donation_id: UUID,
     user_id: UserIdDep,
     service: DonationServiceDep,
-    target_amount: int | None = None,
+    target_amount: Annotated[int | None, Query()] = None,
 ) -> DonationDetailResponse:
     """
     Get donation event with member donation details
@@ -136,31 +138,18 @@ async def get_donation_detail(
     Returns:
         Donation event with member donation info
     """
-    # Verify user has access (🔴 CRITICAL: was missing in original PR)
-    await service.verify_donation_access(user_id, donation_id)
-
-    donation_with_info = await service.get_donation_with_info(
-        donation_id, target_amount
+    # Access check (🔴 CRITICAL) runs alongside the snapshot queries
+    donation_with_info = await service.get_donation_with_info_for_user(
+        user_id, donation_id, target_amount
     )
 
-    return DonationDetailResponse(
-        id=donation_with_info.id,
-        season_id=donation_with_info.season_id,
-        alliance_id=donation_with_info.alliance_id,
-        title=donation_with_info.title,
-        type=donation_with_info.type,
-        deadline=donation_with_info.deadline,
-        target_amount=donation_with_info.target_amount,
-        description=donation_with_info.description,
-        status=donation_with_info.status,
-        created_at=donation_with_info.created_at,
-        created_by=donation_with_info.created_by,
-        updated_at=donation_with_info.updated_at,
-        member_info=[
-            DonationMemberInfoResponse(**info.model_dump())
-            for info in donation_with_info.member_info
-        ],
-    )
+    # Service output is already validated; copy it without a second pass
+    fields = dict(donation_with_info)
+    fields["member_info"] = [
+        DonationMemberInfoResponse.model_construct(**dict(info))
+        for info in donation_with_info.member_info
+    ]
+    return DonationDetailResponse.model_construct(**fields)
 
 
 @router.post("/{donation_id}/targets", status_code=204)
@@ -169,7 +158,7 @@ async def upsert_member_target_override(
     body: DonationTargetOverrideRequest,
     user_id: UserIdDep,
     service: DonationServiceDep,
-) -> None:
+) -> Response:
     """
     Insert or update a per-member target override for a donation.
 
@@ -189,6 +178,34 @@ async def upsert_member_target_override(
         target_amount=body.target_amount,
         user_id=user_id,
     )
+    return Response(status_code=204)
+
+
+@router.post("/{donation_id}/targets/bulk", status_code=204)
+async def upsert_member_target_overrides(
+    donation_id: UUID,
+    body: BulkDonationTargetOverrideRequest,
+    user_id: UserIdDep,
+    service: DonationServiceDep,
+) -> Response:
+    """
+    Insert or update many per-member target overrides in a single request.
+
+    Path Parameters:
+        donation_id: Donation UUID
+
+    Body:
+        overrides: List of {member_id, target_amount}
+
+    Returns:
+        No content on success (204)
+    """
+    await service.set_member_target_overrides(
+        donation_id=donation_id,
+        targets=[(o.member_id, o.target_amount) for o in body.overrides],
+        user_id=user_id,
+    )
+    return Response(status_code=204)
 
 
 @router.delete("/{donation_id}", status_code=204)
@@ -196,9 +213,10 @@ async def delete_donation(
     donation_id: UUID,
     user_id: UserIdDep,
     service: DonationServiceDep,
-) -> None:
+) -> Response:
     """Delete a donation event"""
     await service.delete_donation(donation_id, user_id)
+    return Response(status_code=204)
 
 
 @router.delete("/{donation_id}/targets/{member_id}", status_code=204)
@@ -207,6 +225,7 @@ async def delete_member_target_override(
     member_id: UUID,
     user_id: UserIdDep,
     service: DonationServiceDep,
-) -> None:
+) -> Response:
     """Delete a member's target override for a donation"""
     await service.delete_member_target_override(donation_id, member_id, user_id)
+    return Response(status_code=204)
@@ -10,12 +10,15 @@ Follows CLAUDE.md:
 - Typed response models for OpenAPI docs
 """
 
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, File, Form, UploadFile
+from fastapi import APIRouter, Depends, Form, Response
+from pydantic import TypeAdapter
 
 from src.api.v1.schemas.events import (
+    BatchEventAnalyticsRequest,
     CreateEventRequest,
     DistributionBinResponse,
     EventAnalyticsResponse,
@@ -28,22 +31,67 @@ from src.api.v1.schemas.events import (
 )
 from src.core.dependencies import (
     BattleEventServiceDep,
+    CsvFileDep,
     CSVUploadServiceDep,
     SeasonServiceDep,
     UserIdDep,
 )
-from src.models.battle_event import BattleEventCreate
+from src.models.battle_event import BattleEvent, BattleEventCreate
+from src.models.battle_event_metrics import BattleEventMetricsWithMember, EventSummary
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+# List validators compiled once; rows are validated in a single core call
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventListItemResponse])
+_EVENT_METRICS_ADAPTER = TypeAdapter(list[EventMemberMetricResponse])
+
+
+# ============================================================================
+# Dependency Injection
+# ============================================================================
+
+
+async def verify_season_access(
+    season_id: UUID,
+    user_id: UserIdDep,
+    season_service: SeasonServiceDep,
+) -> UUID:
+    """
+    Verify membership of the season's alliance and return its alliance_id
+
+    Module-level route dependency so FastAPI resolves it once per request.
+    """
+    return await season_service.verify_user_access(user_id, season_id)
+
+
+async def verify_event_access(
+    event_id: UUID,
+    user_id: UserIdDep,
+    service: BattleEventServiceDep,
+) -> UUID:
+    """
+    Verify membership of the event's alliance and return its alliance_id
+
+    Module-level route dependency so FastAPI resolves it once per request.
+    """
+    return await service.verify_user_access(user_id, event_id)
+
+
+SeasonAllianceIdDep = Annotated[UUID, Depends(verify_season_access)]
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
 
 @router.post("/upload-csv", response_model=EventUploadResponse)
 async def upload_event_csv(
     user_id: UserIdDep,
     csv_service: CSVUploadServiceDep,
     season_service: SeasonServiceDep,
-    season_id: Annotated[str, Form()],
-    file: Annotated[UploadFile, File()],
+    season_id: Annotated[UUID, Form()],
+    file: CsvFileDep,
     snapshot_date: Annotated[str | None, Form()] = None,
 ) -> EventUploadResponse:
     """
@@ -55,27 +103,22 @@ async def upload_event_csv(
     - Are stored separately from regular uploads
 
     Args:
-        season_id: Season UUID (as string from form)
+        season_id: Season UUID (form field)
         file: CSV file upload
         snapshot_date: Optional custom snapshot datetime (ISO format)
 
     Returns:
         Upload result with upload_id and statistics
     """
-    season_uuid = UUID(season_id)
-
     # Verify user access to season
-    await season_service.verify_user_access(user_id, season_uuid)
-
-    if not file.filename or not file.filename.endswith(".csv"):
-        raise ValueError("File must be a CSV file")
+    await season_service.verify_user_access(user_id, season_id)
 
-    content = await file.read()
-    csv_content = content.decode("utf-8")
+    # Decode without keeping a reference to the raw bytes
+    csv_content = (await file.read()).decode("utf-8")
 
     result = await csv_service.upload_csv(
         user_id=user_id,
-        season_id=season_uuid,
+        season_id=season_id,
         filename=file.filename,
         csv_content=csv_content,
         custom_snapshot_date=snapshot_date,
@@ -91,12 +134,14 @@ async def upload_event_csv(
     )
 
 
-@router.get("", response_model=list[EventListItemResponse])
+@router.get(
+    "",
+    response_model=list[EventListItemResponse],
+    dependencies=[Depends(verify_season_access)],
+)
 async def list_events(
     season_id: UUID,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
-    season_service: SeasonServiceDep,
 ) -> list[EventListItemResponse]:
     """
     Get all events for a season.
@@ -107,18 +152,17 @@ async def list_events(
     Returns:
         List of events with basic info and computed stats
     """
-    await season_service.verify_user_access(user_id, season_id)
     events = await service.get_events_by_season(season_id)
-    return [EventListItemResponse.model_validate(e) for e in events]
+    return _EVENT_LIST_ADAPTER.validate_python(events)
 
 
 @router.post("", response_model=EventDetailResponse, status_code=201)
 async def create_event(
     season_id: UUID,
+    alliance_id: SeasonAllianceIdDep,
     body: CreateEventRequest,
     user_id: UserIdDep,
     service: BattleEventServiceDep,
-    season_service: SeasonServiceDep,
 ) -> EventDetailResponse:
     """
     Create a new battle event.
@@ -134,14 +178,11 @@ async def create_event(
     Returns:
         Created event details
     """
-    alliance_id = await season_service.verify_user_access(user_id, season_id)
-
-    event_data = BattleEventCreate(
+    # body is already validated by CreateEventRequest; skip a second pass
+    event_data = BattleEventCreate.model_construct(
+        **dict(body),
         season_id=season_id,
         alliance_id=alliance_id,
-        name=body.name,
-        event_type=body.event_type,
-        description=body.description,
         created_by=user_id,
     )
 
@@ -166,21 +207,21 @@ async def get_event(
 
     Raises:
         ValueError: Event not found
+        PermissionError: User is not a member of the event's alliance
     """
-    await service.verify_user_access(user_id, event_id)
-    event = await service.get_event(event_id)
-
-    if not event:
-        raise ValueError("Event not found")
-
+    # The access check reuses the event row it loads, so this is one read
+    event = await service.get_event_for_user(user_id, event_id)
     return EventDetailResponse.model_validate(event)
 
 
-@router.post("/{event_id}/process", response_model=EventDetailResponse)
+@router.post(
+    "/{event_id}/process",
+    response_model=EventDetailResponse,
+    dependencies=[Depends(verify_event_access)],
+)
 async def process_event(
     event_id: UUID,
     body: ProcessEventRequest,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
 ) -> EventDetailResponse:
     """
@@ -201,18 +242,19 @@ async def process_event(
 
     符合 CLAUDE.md 🟡: Global exception handlers eliminate try/except boilerplate
     """
-    await service.verify_user_access(user_id, event_id)
-
     event = await service.process_event_snapshots(
         event_id, body.before_upload_id, body.after_upload_id
     )
     return EventDetailResponse.model_validate(event)
 
 
-@router.get("/{event_id}/summary", response_model=EventSummaryResponse)
+@router.get(
+    "/{event_id}/summary",
+    response_model=EventSummaryResponse,
+    dependencies=[Depends(verify_event_access)],
+)
 async def get_event_summary(
     event_id: UUID,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
 ) -> EventSummaryResponse:
     """
@@ -224,15 +266,17 @@ async def get_event_summary(
     Returns:
         Event summary with participation stats and aggregates
     """
-    await service.verify_user_access(user_id, event_id)
     summary = await service.get_event_summary(event_id)
     return EventSummaryResponse.model_validate(summary)
 
 
-@router.get("/{event_id}/metrics", response_model=list[EventMemberMetricResponse])
+@router.get(
+    "/{event_id}/metrics",
+    response_model=list[EventMemberMetricResponse],
+    dependencies=[Depends(verify_event_access)],
+)
 async def get_event_metrics(
     event_id: UUID,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
 ) -> list[EventMemberMetricResponse]:
     """
@@ -244,15 +288,17 @@ async def get_event_metrics(
     Returns:
         List of member metrics ordered by merit_diff descending
     """
-    await service.verify_user_access(user_id, event_id)
     metrics = await service.get_event_metrics(event_id)
-    return [EventMemberMetricResponse.model_validate(m) for m in metrics]
+    return _EVENT_METRICS_ADAPTER.validate_python(metrics)
 
 
-@router.get("/{event_id}/analytics", response_model=EventAnalyticsResponse)
+@router.get(
+    "/{event_id}/analytics",
+    response_model=EventAnalyticsResponse,
+    dependencies=[Depends(verify_event_access)],
+)
 async def get_event_analytics(
     event_id: UUID,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
 ) -> EventAnalyticsResponse:
     """
@@ -267,40 +313,75 @@ async def get_event_analytics(
     Raises:
         ValueError: Event not found
     """
-    await service.verify_user_access(user_id, event_id)
-
-    event = await service.get_event(event_id)
+    event, summary, metrics = await service.get_event_analytics_data(event_id)
     if not event:
         raise ValueError("Event not found")
 
-    summary = await service.get_event_summary(event_id)
-    metrics = await service.get_event_metrics(event_id)
+    return _build_analytics_response(event, summary, metrics)
 
-    # Calculate merit distribution
-    merit_distribution = _calculate_merit_distribution([m.merit_diff for m in metrics])
 
-    return EventAnalyticsResponse(
-        event=EventDetailResponse.model_validate(event),
-        summary=EventSummaryResponse.model_validate(summary),
-        metrics=[EventMemberMetricResponse.model_validate(m) for m in metrics],
-        merit_distribution=merit_distribution,
-    )
+@router.post("/analytics/batch", response_model=list[EventAnalyticsResponse])
+async def get_events_analytics_batch(
+    body: BatchEventAnalyticsRequest,
+    user_id: UserIdDep,
+    service: BattleEventServiceDep,
+) -> list[EventAnalyticsResponse]:
+    """
+    Get complete analytics for several events in one request.
 
+    Events and metrics are loaded with one query each for the whole batch
+    instead of one request (and access check) per event.
 
-@router.delete("/{event_id}", status_code=204)
+    Returns:
+        Analytics for each requested event, in request order
+
+    Raises:
+        ValueError: Any event not found
+        PermissionError: User is not a member of an event's alliance
+    """
+    analytics = await service.get_events_analytics_data_for_user(user_id, body.event_ids)
+    return [
+        _build_analytics_response(event, summary, metrics)
+        for event, summary, metrics in analytics
+    ]
+
+
+@router.delete(
+    "/{event_id}",
+    status_code=204,
+    dependencies=[Depends(verify_event_access)],
+)
 async def delete_event(
     event_id: UUID,
-    user_id: UserIdDep,
     service: BattleEventServiceDep,
-) -> None:
+) -> Response:
     """
     Delete an event.
 
     Path Parameters:
         event_id: Event UUID
     """
-    await service.verify_user_access(user_id, event_id)
     await service.delete_event(event_id)
+    return Response(status_code=204)
+
+
+def _build_analytics_response(
+    event: BattleEvent,
+    summary: EventSummary,
+    metrics: list[BattleEventMetricsWithMember],
+) -> EventAnalyticsResponse:
+    """Assemble the analytics response, including the merit distribution."""
+    merit_distribution = _calculate_merit_distribution([m.merit_diff for m in metrics])
+
+    # Validate the whole object graph in one pass; nested models read attributes
+    return EventAnalyticsResponse.model_validate(
+        {
+            "event": event,
+            "summary": summary,
+            "metrics": metrics,
+            "merit_distribution": merit_distribution,
+        }
+    )
 
 
 def _calculate_merit_distribution(merits: list[int]) -> list[DistributionBinResponse]:
@@ -332,50 +413,51 @@ def _calculate_merit_distribution(merits: list[int]) -> list[DistributionBinResp
     data_range = max_val - min_val
     raw_bin_width = data_range / 5  # Target 5 bins
 
-    # Round to nice numbers
+    # Round to the nearest nice number (1/2/5/10 x magnitude, ties go down);
+    # raw_bin_width / magnitude is below 10, so larger steps never win
     magnitude = 10 ** max(0, len(str(int(raw_bin_width))) - 1) if raw_bin_width >= 1 else 1
-    nice_widths = [1, 2, 5, 10, 20, 50, 100]
-    bin_width = int(magnitude * min(nice_widths, key=lambda x: abs(x * magnitude - raw_bin_width)))
+    if raw_bin_width <= 1.5 * magnitude:
+        bin_width = magnitude
+    elif raw_bin_width <= 3.5 * magnitude:
+        bin_width = 2 * magnitude
+    elif raw_bin_width <= 7.5 * magnitude:
+        bin_width = 5 * magnitude
+    else:
+        bin_width = 10 * magnitude
     bin_width = max(bin_width, 1000)  # Minimum 1K bins
 
-    # Calculate bin start
+    # Calculate bin start and number of bins covering [bin_start, max_val)
     bin_start = (min_val // bin_width) * bin_width
+    bin_count = -(-(max_val - bin_start) // bin_width)
 
-    # Create bins
-    bins: list[dict] = []
-    current = bin_start
-    while current < max_val:
-        next_val = current + bin_width
-        bins.append({
-            "range": f"{_format_value(current)}-{_format_value(next_val)}",
-            "min_value": current,
-            "max_value": next_val,
-            "count": 0,
-        })
-        current = next_val
-
-    # Count values in each bin
+    # Bins are uniform, so each value maps to its bin by integer division;
+    # values at the upper edge fall into the last bin
+    counts = [0] * bin_count
+    last_bin = bin_count - 1
     for merit in positive_merits:
-        for bin_data in bins:
-            if bin_data["min_value"] <= merit < bin_data["max_value"]:
-                bin_data["count"] += 1
-                break
-        else:
-            if bins and merit >= bins[-1]["min_value"]:
-                bins[-1]["count"] += 1
+        counts[min((merit - bin_start) // bin_width, last_bin)] += 1
 
     # Add zero count if any
-    zero_count = sum(1 for m in merits if m == 0)
+    zero_count = merits.count(0)
     result = []
     if zero_count > 0:
         result.append(DistributionBinResponse(range="0", count=zero_count))
 
-    result.extend([DistributionBinResponse(range=b["range"], count=b["count"]) for b in bins])
+    result.extend(
+        DistributionBinResponse(
+            range=f"{_format_value(lower)}-{_format_value(lower + bin_width)}",
+            count=count,
+        )
+        for lower, count in zip(
+            range(bin_start, bin_start + bin_count * bin_width, bin_width), counts, strict=True
+        )
+    )
     return result
 
 
+@lru_cache(maxsize=4096)
 def _format_value(val: int) -> str:
-    """Format value with K/M suffix."""
+    """Format value with K/M suffix (pure; bin edges repeat across requests)."""
     if val >= 1_000_000:
         return f"{val / 1_000_000:.1f}M" if val % 1_000_000 != 0 else f"{val // 1_000_000}M"
     if val >= 1000:
@@ -11,9 +11,10 @@ API layer for hegemony weight configuration and score calculation.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 
-from src.core.dependencies import HegemonyWeightServiceDep, UserIdDep
+from src.core.dependencies import HegemonyWeightServiceDep, SeasonIdQuery, UserIdDep
+from src.core.utils.http_cache import conditional_json_response
 from src.models.hegemony_weight import (
     HegemonyScorePreview,
     HegemonyWeight,
@@ -36,7 +37,7 @@ router = APIRouter(prefix="/hegemony-weights", tags=["hegemony-weights"])
 async def initialize_season_weights(
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
     """
     Initialize default hegemony weight configurations for all CSV uploads in a season.
@@ -49,19 +50,26 @@ async def initialize_season_weights(
 
 @router.get("/summary", response_model=SnapshotWeightsSummary)
 async def get_weights_summary(
+    request: Request,
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
-    """Get summary of all snapshot weights for a season with validation status."""
-    return await service.get_weights_summary(user_id, season_id)
+    """
+    Get summary of all snapshot weights for a season with validation status.
+
+    Responses carry an ETag; an unchanged summary is answered with 304.
+    """
+    summary = await service.get_weights_summary(user_id, season_id)
+    # Refetched right after edits: revalidate every time instead of max-age reuse
+    return conditional_json_response(request, summary, max_age=0)
 
 
 @router.get("/preview", response_model=list[HegemonyScorePreview])
 async def preview_hegemony_scores(
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
     limit: int = Query(default=20, ge=1, le=500, description="Top N members to return"),
 ):
     """Calculate and preview hegemony scores for top members."""
@@ -75,12 +83,18 @@ async def preview_hegemony_scores(
 
 @router.get("", response_model=list[HegemonyWeightWithSnapshot])
 async def get_season_weights(
+    request: Request,
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
-    """Get all hegemony weight configurations for a season."""
-    return await service.get_season_weights(user_id, season_id)
+    """
+    Get all hegemony weight configurations for a season.
+
+    Responses carry an ETag; an unchanged list is answered with 304.
+    """
+    weights = await service.get_season_weights(user_id, season_id)
+    return conditional_json_response(request, weights, max_age=0)
 
 
 @router.post("", response_model=HegemonyWeight, status_code=201)
@@ -88,12 +102,13 @@ async def create_weight(
     data: HegemonyWeightCreate,
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-    season_id: UUID = Query(..., description="Season UUID"),
+    season_id: SeasonIdQuery,
 ):
-    """Create a new hegemony weight configuration."""
-    if not data.validate_indicator_weights_sum():
-        raise ValueError("Tier 1 weights must sum to 1.0")
+    """
+    Create a new hegemony weight configuration.
 
+    Tier 1 weights must sum to 1.0 (validated by HegemonyWeightCreate, 422 otherwise).
+    """
     return await service.create_weight(user_id, season_id, data)
 
 
@@ -118,6 +133,7 @@ async def delete_weight(
     weight_id: UUID,
     service: HegemonyWeightServiceDep,
     user_id: UserIdDep,
-):
+) -> Response:
     """Delete a hegemony weight configuration."""
     await service.delete_weight(user_id, weight_id)
+    return Response(status_code=204)
@@ -12,24 +12,26 @@ Endpoints for LINE Bot integration:
 3. 觸發條件：被 @ / 新成員加入 / 未註冊者首次發言
 """
 
-import json
+import asyncio
 import logging
 import re
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, BackgroundTasks, Query, Response, status
 
-from src.core.config import Settings, get_settings
+from src.core.config import settings
 from src.core.dependencies import (
     AllianceServiceDep,
     BattleEventServiceDep,
     CopperMineServiceDep,
     LineBindingServiceDep,
     PermissionServiceDep,
+    UserAllianceDep,
     UserIdDep,
 )
 from src.core.line_auth import WebhookBodyDep, create_liff_url, get_group_info, get_line_bot_api
+from src.lib.line_flex_builder import build_event_report_flex, build_liff_entry_flex
 from src.models.copper_mine import (
     CopperMineCreate,
     CopperMineListResponse,
@@ -57,8 +59,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/linebot", tags=["LINE Bot"])
 
-# 綁定碼格式：6 位英數字
-BIND_CODE_PATTERN = re.compile(r"^[A-Z0-9]{6}$")
+# 綁定指令：/綁定 或 /绑定 + 空白；後面剛好是 6 位英數字時才擷取綁定碼
+BIND_COMMAND_PATTERN = re.compile(r"/[綁绑]定 (?:\s*([A-Za-z0-9]{6})\s*$)?")
+CUSTOM_COMMAND_PATTERN = re.compile(r"/\S+")
+
+# 搜尋結果最多列出的筆數（LINE 文字訊息上限 5000 字）
+SEARCH_RESULT_MAX_LINES = 50
+
+# LIFF 端點的 LINE 身分查詢參數
+LineUserIdQuery = Annotated[str, Query(description="LINE user ID")]
+LineGroupIdQuery = Annotated[str, Query(description="LINE group ID")]
+
+# LINE 設定於啟動時讀取一次，事件處理直接使用常數
+_LIFF_ID: str | None = settings.liff_id
+_BOT_USER_ID: str | None = settings.line_bot_user_id
 
 
 # =============================================================================
@@ -76,17 +90,10 @@ BIND_CODE_PATTERN = re.compile(r"^[A-Z0-9]{6}$")
 async def generate_binding_code(
     user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> LineBindingCodeResponse:
     """Generate a new binding code for the user's alliance"""
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "generate LINE binding code"
     )
@@ -129,17 +136,10 @@ async def get_binding_status(
 async def unbind_line_group(
     user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> Response:
     """Unbind LINE group from alliance"""
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "unbind LINE group"
     )
@@ -157,17 +157,10 @@ async def unbind_line_group(
 async def refresh_group_info(
     user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> LineGroupBindingResponse:
     """Refresh LINE group name and picture from LINE API"""
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "refresh LINE group info"
     )
@@ -182,18 +175,10 @@ async def refresh_group_info(
     description="Get list of LINE users who registered game IDs"
 )
 async def get_registered_members(
-    user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
 ) -> RegisteredMembersResponse:
     """Get registered members list for alliance admin view"""
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     return await service.get_registered_members(alliance.id)
 
 
@@ -204,17 +189,9 @@ async def get_registered_members(
     description="Get custom commands for current alliance"
 )
 async def get_custom_commands(
-    user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
 ) -> list[LineCustomCommandResponse]:
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     return await service.list_custom_commands(alliance.id)
 
 
@@ -229,16 +206,9 @@ async def create_custom_command(
     user_id: UserIdDep,
     data: LineCustomCommandCreate,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> LineCustomCommandResponse:
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "create LINE custom command"
     )
@@ -261,16 +231,9 @@ async def update_custom_command(
     user_id: UserIdDep,
     data: LineCustomCommandUpdate,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> LineCustomCommandResponse:
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "update LINE custom command"
     )
@@ -292,16 +255,9 @@ async def delete_custom_command(
     command_id: UUID,
     user_id: UserIdDep,
     service: LineBindingServiceDep,
-    alliance_service: AllianceServiceDep,
+    alliance: UserAllianceDep,
     permission_service: PermissionServiceDep,
 ) -> Response:
-    alliance = await alliance_service.get_user_alliance(user_id)
-    if not alliance:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User has no alliance"
-        )
-
     await permission_service.require_owner_or_collaborator(
         user_id, alliance.id, "delete LINE custom command"
     )
@@ -323,8 +279,8 @@ async def delete_custom_command(
 )
 async def get_member_info(
     service: LineBindingServiceDep,
-    u: Annotated[str, Query(description="LINE user ID")],
-    g: Annotated[str, Query(description="LINE group ID")],
+    u: LineUserIdQuery,
+    g: LineGroupIdQuery,
 ) -> MemberInfoResponse:
     """Get member info for LIFF page"""
     return await service.get_member_info(
@@ -341,8 +297,8 @@ async def get_member_info(
 )
 async def get_member_performance(
     service: LineBindingServiceDep,
-    u: Annotated[str, Query(description="LINE user ID")],
-    g: Annotated[str, Query(description="LINE group ID")],
+    u: LineUserIdQuery,
+    g: LineGroupIdQuery,
     game_id: Annotated[str, Query(description="Game ID to get performance for")],
 ) -> MemberPerformanceResponse:
     """Get member performance analytics for LIFF page"""
@@ -381,8 +337,8 @@ async def register_game_id(
 )
 async def unregister_game_id(
     service: LineBindingServiceDep,
-    u: Annotated[str, Query(description="LINE user ID")],
-    g: Annotated[str, Query(description="LINE group ID")],
+    u: LineUserIdQuery,
+    g: LineGroupIdQuery,
     game_id: Annotated[str, Query(description="Game ID to unregister")],
 ) -> RegisterMemberResponse:
     """Unregister a game ID for a LINE user"""
@@ -405,7 +361,7 @@ async def unregister_game_id(
 )
 async def get_copper_rules(
     service: CopperMineServiceDep,
-    g: Annotated[str, Query(description="LINE group ID")],
+    g: LineGroupIdQuery,
 ) -> list:
     """Get copper mine rules for LIFF page"""
     return await service.get_rules_for_liff(line_group_id=g)
@@ -419,8 +375,8 @@ async def get_copper_rules(
 )
 async def get_copper_mines(
     service: CopperMineServiceDep,
-    u: Annotated[str, Query(description="LINE user ID")],
-    g: Annotated[str, Query(description="LINE group ID")],
+    u: LineUserIdQuery,
+    g: LineGroupIdQuery,
 ) -> CopperMineListResponse:
     """Get copper mines list for LIFF page"""
     return await service.get_mines_list(
@@ -459,15 +415,14 @@ async def register_copper_mine(
     description="Remove a copper mine record"
 )
 async def delete_copper_mine(
-    mine_id: str,
+    mine_id: UUID,
     service: CopperMineServiceDep,
-    u: Annotated[str, Query(description="LINE user ID")],
-    g: Annotated[str, Query(description="LINE group ID")],
+    u: LineUserIdQuery,
+    g: LineGroupIdQuery,
 ) -> Response:
     """Delete a copper mine by ID"""
-    from uuid import UUID
     await service.delete_mine(
-        mine_id=UUID(mine_id),
+        mine_id=mine_id,
         line_group_id=g,
         line_user_id=u
     )
@@ -486,29 +441,68 @@ async def delete_copper_mine(
 )
 async def handle_webhook(
     body: WebhookBodyDep,
+    background_tasks: BackgroundTasks,
     service: LineBindingServiceDep,
     battle_event_service: BattleEventServiceDep,
-    settings: Settings = Depends(get_settings),
 ) -> str:
-    """Handle LINE webhook events"""
+    """
+    Handle LINE webhook events
+
+    LINE expects a fast 200; events are processed after the response is sent
+    so outbound reply latency never delays the acknowledgement.
+    """
     try:
-        data = json.loads(body.decode("utf-8"))
-        webhook_request = LineWebhookRequest(**data)
-    except (json.JSONDecodeError, ValueError) as e:
+        # Parse and validate the raw bytes in one pydantic-core pass
+        webhook_request = LineWebhookRequest.model_validate_json(body)
+    except ValueError as e:
         logger.error(f"Failed to parse webhook request: {e}")
         return "OK"
 
-    for event in webhook_request.events:
-        await _handle_event(event, service, battle_event_service, settings)
+    if webhook_request.events:
+        background_tasks.add_task(
+            _process_webhook_events, webhook_request.events, service, battle_event_service
+        )
 
     return "OK"
 
 
+async def _process_webhook_events(
+    events: list[LineWebhookEvent],
+    service: LineBindingService,
+    battle_event_service: BattleEventService,
+) -> None:
+    """不同群組/用戶的事件並行處理；同一來源的事件維持原順序"""
+    # 同一來源依序處理，避免同一用戶的連續訊息重複觸發 LIFF 提醒
+    events_by_source: dict[str | None, list[LineWebhookEvent]] = {}
+    for event in events:
+        source_key = event.source.get("groupId") or event.source.get("userId")
+        events_by_source.setdefault(source_key, []).append(event)
+
+    await asyncio.gather(
+        *(
+            _handle_events_in_order(source_events, service, battle_event_service)
+            for source_events in events_by_source.values()
+        )
+    )
+
+
+async def _handle_events_in_order(
+    events: list[LineWebhookEvent],
+    service: LineBindingService,
+    battle_event_service: BattleEventService,
+) -> None:
+    """依序處理同一來源的事件；單一事件失敗只記錄，不影響其他事件"""
+    for event in events:
+        try:
+            await _handle_event(event, service, battle_event_service)
+        except Exception as e:
+            logger.error(f"Failed to handle LINE webhook event ({event.type}): {e}")
+
+
 async def _handle_event(
     event: LineWebhookEvent,
     service: LineBindingService,
     battle_event_service: BattleEventService,
-    settings: Settings,
 ) -> None:
     """
     極簡事件處理：
@@ -520,39 +514,45 @@ async def _handle_event(
        - 未註冊者首次發言 → 發送 LIFF 入口（每用戶一次）
     4. follow: 用戶加好友 → 簡短說明
     """
+    # 所有處理皆需回覆；來源欄位只讀取一次再傳給各 handler
+    reply_token = event.reply_token
+    if not reply_token:
+        return
+
     source = event.source
     source_type = source.get("type")
+    line_group_id = source.get("groupId")
 
-    # Bot 加入群組
-    if event.type == "join" and source_type == "group":
-        await _handle_join_event(event)
-        return
-
-    # 新成員加入群組
-    if event.type == "memberJoined" and source_type == "group":
-        await _handle_member_joined(event, service, settings)
-        return
+    match (event.type, source_type):
+        # 群組訊息（最常見，優先判斷）
+        case ("message", "group"):
+            message = event.message or {}
+            if message.get("type") == "text":
+                await _handle_group_message(
+                    message=message,
+                    line_group_id=line_group_id,
+                    line_user_id=source.get("userId"),
+                    reply_token=reply_token,
+                    service=service,
+                    battle_event_service=battle_event_service,
+                )
 
-    # 用戶加好友
-    if event.type == "follow":
-        await _handle_follow_event(event)
-        return
+        # 私聊
+        case ("message", "user"):
+            if (event.message or {}).get("type") == "text":
+                await _handle_private_message(reply_token)
 
-    # 訊息事件
-    if event.type == "message":
-        message = event.message or {}
-        if message.get("type") != "text":
-            return
+        # Bot 加入群組
+        case ("join", "group"):
+            await _handle_join_event(reply_token)
 
-        # 私聊
-        if source_type == "user":
-            await _handle_private_message(event)
-            return
+        # 新成員加入群組
+        case ("memberJoined", "group"):
+            await _handle_member_joined(line_group_id, reply_token, service)
 
-        # 群組訊息
-        if source_type == "group":
-            await _handle_group_message(event, service, battle_event_service, settings)
-            return
+        # 用戶加好友
+        case ("follow", _):
+            await _handle_follow_event(reply_token)
 
 
 # =============================================================================
@@ -560,12 +560,8 @@ async def _handle_event(
 # =============================================================================
 
 
-async def _handle_join_event(event: LineWebhookEvent) -> None:
+async def _handle_join_event(reply_token: str) -> None:
     """Bot 加入群組 → 發送綁定說明"""
-    reply_token = event.reply_token
-    if not reply_token:
-        return
-
     await _reply_text(
         reply_token,
         "👋 我是三國小幫手！\n\n"
@@ -576,16 +572,12 @@ async def _handle_join_event(event: LineWebhookEvent) -> None:
 
 
 async def _handle_member_joined(
-    event: LineWebhookEvent,
+    line_group_id: str | None,
+    reply_token: str,
     service: LineBindingService,
-    settings: Settings,
 ) -> None:
     """新成員加入 → 發送 LIFF 入口（每用戶一次）"""
-    source = event.source
-    line_group_id = source.get("groupId")
-    reply_token = event.reply_token
-
-    if not line_group_id or not reply_token:
+    if not line_group_id:
         return
 
     # 檢查群組是否已綁定
@@ -593,20 +585,16 @@ async def _handle_member_joined(
     if not is_bound:
         return
 
-    if not settings.liff_id:
+    if not _LIFF_ID:
         return
 
     # 發送歡迎訊息
-    liff_url = create_liff_url(settings.liff_id, line_group_id)
+    liff_url = create_liff_url(_LIFF_ID, line_group_id)
     await _send_liff_welcome(reply_token, liff_url)
 
 
-async def _handle_follow_event(event: LineWebhookEvent) -> None:
+async def _handle_follow_event(reply_token: str) -> None:
     """用戶加好友 → 簡短說明"""
-    reply_token = event.reply_token
-    if not reply_token:
-        return
-
     await _reply_text(
         reply_token,
         "👋 嗨！我主要在群組中使用。\n"
@@ -614,12 +602,8 @@ async def _handle_follow_event(event: LineWebhookEvent) -> None:
     )
 
 
-async def _handle_private_message(event: LineWebhookEvent) -> None:
+async def _handle_private_message(reply_token: str) -> None:
     """私聊 → 統一簡短回覆"""
-    reply_token = event.reply_token
-    if not reply_token:
-        return
-
     await _reply_text(
         reply_token,
         "💡 請在同盟群組中 @我 使用功能～"
@@ -627,10 +611,12 @@ async def _handle_private_message(event: LineWebhookEvent) -> None:
 
 
 async def _handle_group_message(
-    event: LineWebhookEvent,
+    message: dict,
+    line_group_id: str | None,
+    line_user_id: str | None,
+    reply_token: str,
     service: LineBindingService,
     battle_event_service: BattleEventService,
-    settings: Settings,
 ) -> None:
     """
     群組訊息處理：
@@ -638,47 +624,37 @@ async def _handle_group_message(
     2. @bot → 發送 LIFF 入口
     3. 未註冊者首次發言 → 發送 LIFF 入口
     """
-    source = event.source
-    message = event.message or {}
     text = message.get("text", "").strip()
-    line_group_id = source.get("groupId")
-    line_user_id = source.get("userId")
-    reply_token = event.reply_token
 
-    if not line_group_id or not line_user_id or not reply_token:
+    if not line_group_id or not line_user_id:
         return
 
-    # 1. 處理綁定指令
-    if _is_bind_command(text):
-        code = _extract_bind_code(text)
-        if code:
+    # 1. 處理綁定指令（格式錯誤的綁定指令同樣不再往下處理）
+    if bind_match := BIND_COMMAND_PATTERN.match(text):
+        if code := bind_match.group(1):
             await _handle_bind_command(
-                code=code,
+                code=code.upper(),
                 line_group_id=line_group_id,
                 line_user_id=line_user_id,
                 reply_token=reply_token,
                 service=service,
-                settings=settings,
             )
         return
 
     # 2. 檢查是否被 @
     mention = message.get("mention", {})
     mentionees = mention.get("mentionees", [])
-    bot_user_id = settings.line_bot_user_id
+    mentionee = _find_bot_mentionee(mentionees, _BOT_USER_ID) if _BOT_USER_ID else None
 
-    if bot_user_id and _is_bot_mentioned(mentionees, bot_user_id):
+    if mentionee is not None:
         # If bot is mentioned, try to extract the text arguments that follow the mention.
         # LINE mention payload usually includes index/length for the mention; use that if available.
-        mentionee = next((m for m in mentionees if m.get("userId") == bot_user_id), None)
-        args_text = ""
-        if mentionee and isinstance(mentionee.get("index"), int) and isinstance(mentionee.get("length"), int):
-            start = mentionee["index"] + mentionee["length"]
-            args_text = text[start:].strip()
-        else:
+        try:
+            args_text = text[mentionee["index"] + mentionee["length"]:].strip()
+        except (KeyError, TypeError):
             # Fallback: remove the first token (likely the mention) if present
-            parts = text.split()
-            args_text = " ".join(parts[1:]).strip() if len(parts) > 1 else ""
+            parts = text.split(maxsplit=1)
+            args_text = parts[1].strip() if len(parts) > 1 else ""
 
         # If arguments start with '/', treat as a command and route to existing command handling
         if args_text.startswith("/"):
@@ -709,7 +685,6 @@ async def _handle_group_message(
             await _send_liff_entry(
                 line_group_id=line_group_id,
                 reply_token=reply_token,
-                settings=settings,
             )
             return
 
@@ -725,19 +700,20 @@ async def _handle_group_message(
                 await _reply_text(reply_token, "搜尋結果 (共0筆):")
                 return
 
-            lines = [f"搜尋結果 (共{len(results)}筆):"]
-            for i, r in enumerate(results, start=1):
-                display = r.line_display_name or ""
-                lines.append(f"{i}. {r.game_id} ({display})")
+            body = "\n".join(
+                f"{i}. {r.game_id} ({r.line_display_name or ''})"
+                for i, r in enumerate(results[:SEARCH_RESULT_MAX_LINES], start=1)
+            )
+            if len(results) > SEARCH_RESULT_MAX_LINES:
+                body += "\n..."
 
-            await _reply_text(reply_token, "\n".join(lines))
+            await _reply_text(reply_token, f"搜尋結果 (共{len(results)}筆):\n{body}")
             return
 
         # No arguments after mention: send LIFF entry
         await _send_liff_entry(
             line_group_id=line_group_id,
             reply_token=reply_token,
-            settings=settings,
         )
         return
 
@@ -756,7 +732,6 @@ async def _handle_group_message(
         await _send_liff_first_message_reminder(
             line_group_id=line_group_id,
             reply_token=reply_token,
-            settings=settings,
         )
 
 
@@ -765,32 +740,19 @@ async def _handle_group_message(
 # =============================================================================
 
 
-def _is_bind_command(text: str) -> bool:
-    """檢查是否為綁定指令"""
-    return text.startswith("/綁定 ") or text.startswith("/绑定 ")
-
-
-def _extract_bind_code(text: str) -> str | None:
-    """從綁定指令中提取綁定碼"""
-    parts = text.split(" ", 1)
-    if len(parts) < 2:
-        return None
-    code = parts[1].strip().upper()
-    if BIND_CODE_PATTERN.match(code):
-        return code
-    return None
-
-
 def _extract_custom_command(text: str) -> str | None:
-    match = re.search(r"/\S+", text)
+    match = CUSTOM_COMMAND_PATTERN.search(text)
     if not match:
         return None
     return match.group(0)
 
 
-def _is_bot_mentioned(mentionees: list, bot_user_id: str) -> bool:
-    """檢查 Bot 是否被 @"""
-    return any(m.get("userId") == bot_user_id for m in mentionees)
+def _find_bot_mentionee(mentionees: list, bot_user_id: str) -> dict | None:
+    """找出 @Bot 的 mentionee（單次掃描，同時判斷是否被 @ 與取得位置）"""
+    for mentionee in mentionees:
+        if mentionee.get("userId") == bot_user_id:
+            return mentionee
+    return None
 
 
 async def _handle_latest_event_report(
@@ -804,14 +766,10 @@ async def _handle_latest_event_report(
 
     查詢該群組綁定同盟的最新已完成戰役，並發送分析報告。
     """
-    from src.lib.line_flex_builder import build_event_report_flex
-
-    # 1. 查詢群組綁定的同盟
-    group_binding = await line_binding_service.repository.get_group_binding_by_line_group_id(
-        line_group_id
-    )
+    # 1. 查詢群組綁定的同盟（使用 service 的群組快取）
+    alliance_id = await line_binding_service.get_bound_alliance_id(line_group_id)
 
-    if not group_binding:
+    if not alliance_id:
         await _reply_text(
             reply_token,
             "❌ 此群組尚未綁定同盟\n\n"
@@ -820,8 +778,6 @@ async def _handle_latest_event_report(
         )
         return
 
-    alliance_id = group_binding.alliance_id
-
     # 2. 查詢最新已完成戰役
     latest_event = await battle_event_service.get_latest_completed_event_for_alliance(
         alliance_id
@@ -835,7 +791,7 @@ async def _handle_latest_event_report(
         )
         return
 
-    # 3. 取得組別分析
+    # 3. 取得組別分析（已完成戰役的分析資料有快取）
     analytics = await battle_event_service.get_event_group_analytics(latest_event.id)
 
     if not analytics:
@@ -881,11 +837,12 @@ async def _handle_latest_event_report(
     try:
         from linebot.v3.messaging import ReplyMessageRequest
 
-        line_bot.reply_message(
+        await asyncio.to_thread(
+            line_bot.reply_message,
             ReplyMessageRequest(
                 reply_token=reply_token,
                 messages=[flex_message],
-            )
+            ),
         )
     except Exception as e:
         logger.error(f"Failed to send event report: {e}")
@@ -897,11 +854,10 @@ async def _handle_bind_command(
     line_user_id: str,
     reply_token: str,
     service: LineBindingService,
-    settings: Settings,
 ) -> None:
     """處理 /綁定 指令"""
-    # 獲取群組資訊
-    group_info = get_group_info(line_group_id)
+    # 獲取群組資訊（同步 LINE API 呼叫，移至 worker thread）
+    group_info = await asyncio.to_thread(get_group_info, line_group_id)
 
     success, message, alliance_id = await service.validate_and_bind_group(
         code=code,
@@ -916,7 +872,7 @@ async def _handle_bind_command(
         return
 
     # 綁定成功 → 發送歡迎訊息 + LIFF
-    if not settings.liff_id:
+    if not _LIFF_ID:
         await _reply_text(
             reply_token,
             "✅ 綁定成功！\n\n"
@@ -924,7 +880,7 @@ async def _handle_bind_command(
         )
         return
 
-    liff_url = create_liff_url(settings.liff_id, line_group_id)
+    liff_url = create_liff_url(_LIFF_ID, line_group_id)
     await _send_bind_success_message(reply_token, liff_url)
 
 
@@ -935,8 +891,6 @@ async def _handle_bind_command(
 
 async def _send_bind_success_message(reply_token: str, liff_url: str) -> None:
     """發送綁定成功訊息（Flex Message - 熱血戰場風）"""
-    from src.lib.line_flex_builder import build_liff_entry_flex
-
     flex_message = build_liff_entry_flex(
         title="🏰 同盟連結成功！",
         subtitle="各位盟友，點擊登記名號！",
@@ -954,16 +908,13 @@ async def _send_bind_success_message(reply_token: str, liff_url: str) -> None:
 async def _send_liff_entry(
     line_group_id: str,
     reply_token: str,
-    settings: Settings,
 ) -> None:
     """發送 LIFF 入口（被 @ 時 - 熱血戰場風）"""
-    from src.lib.line_flex_builder import build_liff_entry_flex
-
-    if not settings.liff_id:
+    if not _LIFF_ID:
         await _reply_text(reply_token, "💡 功能開發中～")
         return
 
-    liff_url = create_liff_url(settings.liff_id, line_group_id)
+    liff_url = create_liff_url(_LIFF_ID, line_group_id)
 
     flex_message = build_liff_entry_flex(
         title="⚔️ 軍情速報",
@@ -982,8 +933,6 @@ async def _send_liff_entry(
 
 async def _send_liff_welcome(reply_token: str, liff_url: str) -> None:
     """發送新成員歡迎訊息（熱血戰場風）"""
-    from src.lib.line_flex_builder import build_liff_entry_flex
-
     flex_message = build_liff_entry_flex(
         title="🔥 盟友來了！",
         subtitle="同盟歡迎你，點擊綁定ID！",
@@ -998,15 +947,12 @@ async def _send_liff_welcome(reply_token: str, liff_url: str) -> None:
 async def _send_liff_first_message_reminder(
     line_group_id: str,
     reply_token: str,
-    settings: Settings,
 ) -> None:
     """發送首次發言提醒（熱血戰場風 - 3 分鐘 CD）"""
-    from src.lib.line_flex_builder import build_liff_entry_flex
-
-    if not settings.liff_id:
+    if not _LIFF_ID:
         return
 
-    liff_url = create_liff_url(settings.liff_id, line_group_id)
+    liff_url = create_liff_url(_LIFF_ID, line_group_id)
 
     flex_message = build_liff_entry_flex(
         title="🔥 還沒登記？",
@@ -1036,11 +982,13 @@ async def _send_flex_message(reply_token: str, flex_message) -> None:
     try:
         from linebot.v3.messaging import ReplyMessageRequest
 
-        line_bot.reply_message(
+        # SDK 為同步 HTTP 呼叫，移至 worker thread 避免阻塞 event loop
+        await asyncio.to_thread(
+            line_bot.reply_message,
             ReplyMessageRequest(
                 reply_token=reply_token,
                 messages=[flex_message],
-            )
+            ),
         )
     except Exception as e:
         logger.error(f"Failed to send flex message: {e}")
@@ -1056,11 +1004,12 @@ async def _reply_text(reply_token: str, text: str) -> None:
     try:
         from linebot.v3.messaging import ReplyMessageRequest, TextMessage
 
-        line_bot.reply_message(
+        await asyncio.to_thread(
+            line_bot.reply_message,
             ReplyMessageRequest(
                 reply_token=reply_token,
                 messages=[TextMessage(text=text)],
-            )
+            ),
         )
     except Exception as e:
         logger.error(f"Failed to reply: {e}")
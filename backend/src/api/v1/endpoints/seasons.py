@@ -17,7 +17,7 @@ Key endpoints:
 
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from src.core.dependencies import SeasonServiceDep, UserIdDep
 from src.models.season import Season, SeasonActivateResponse, SeasonCreate, SeasonUpdate
@@ -171,7 +171,7 @@ async def delete_season(
     season_id: UUID,
     service: SeasonServiceDep,
     user_id: UserIdDep,
-):
+) -> Response:
     """
     Delete season (hard delete, CASCADE will remove related data)
 
@@ -187,6 +187,7 @@ async def delete_season(
     符合 CLAUDE.md 🔴: API layer delegates to service
     """
     await service.delete_season(user_id, season_id)
+    return Response(status_code=204)
 
 
 @router.post("/{season_id}/activate", response_model=SeasonActivateResponse)
@@ -11,26 +11,31 @@ CSV Upload API Endpoints
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, File, Form, UploadFile
+from fastapi import APIRouter, Form
 
-from src.core.dependencies import CSVUploadServiceDep, UserIdDep
+from src.api.v1.schemas.uploads import (
+    DeleteUploadResponse,
+    UploadCsvResponse,
+    UploadListResponse,
+)
+from src.core.dependencies import CsvFileDep, CSVUploadServiceDep, UserIdDep
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
 
 
-@router.post("")
+@router.post("", response_model=UploadCsvResponse)
 async def upload_csv(
     user_id: UserIdDep,
     service: CSVUploadServiceDep,
-    season_id: Annotated[str, Form()],
-    file: Annotated[UploadFile, File()],
+    season_id: Annotated[UUID, Form()],
+    file: CsvFileDep,
     snapshot_date: Annotated[str | None, Form()] = None,
-):
+) -> dict:
     """
     Upload CSV file for a season
 
     Args:
-        season_id: Season UUID (as string from form)
+        season_id: Season UUID (form field)
         file: CSV file upload
         snapshot_date: Optional custom snapshot datetime (ISO format)
         service: CSV upload service (injected)
@@ -42,21 +47,13 @@ async def upload_csv(
     符合 CLAUDE.md 🔴: API layer delegates to service
     符合 CLAUDE.md 🟡: Global exception handlers eliminate try/except boilerplate
     """
-    # Parse season_id string to UUID
-    season_uuid = UUID(season_id)
-
-    # Validate file type
-    if not file.filename or not file.filename.endswith(".csv"):
-        raise ValueError("File must be a CSV file")
-
-    # Read file content
-    content = await file.read()
-    csv_content = content.decode("utf-8")
+    # Read and decode file content; the raw bytes are released right away
+    csv_content = (await file.read()).decode("utf-8")
 
     # Upload CSV
     result = await service.upload_csv(
         user_id=user_id,
-        season_id=season_uuid,
+        season_id=season_id,
         filename=file.filename,
         csv_content=csv_content,
         custom_snapshot_date=snapshot_date,
@@ -64,12 +61,12 @@ async def upload_csv(
     return result
 
 
-@router.get("")
+@router.get("", response_model=UploadListResponse)
 async def list_uploads(
     user_id: UserIdDep,
     service: CSVUploadServiceDep,
     season_id: UUID,
-):
+) -> dict:
     """
     Get all CSV uploads for a season
 
@@ -88,12 +85,12 @@ async def list_uploads(
     return {"uploads": uploads, "total": len(uploads)}
 
 
-@router.delete("/{upload_id}")
+@router.delete("/{upload_id}", response_model=DeleteUploadResponse)
 async def delete_upload(
     user_id: UserIdDep,
     service: CSVUploadServiceDep,
     upload_id: UUID,
-):
+) -> dict:
     """
     Delete a CSV upload (with cascading snapshots)
 
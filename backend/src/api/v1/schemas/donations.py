@@ -42,6 +42,14 @@ class DonationTargetOverrideRequest(BaseModel):
     )
 
 
+class BulkDonationTargetOverrideRequest(BaseModel):
+    """Request body for setting many per-member target overrides at once"""
+
+    overrides: list[DonationTargetOverrideRequest] = Field(
+        ..., min_length=1, max_length=500, description="Per-member target overrides"
+    )
+
+
 # ============================================================================
 # Response Schemas
 # ============================================================================
@@ -36,6 +36,14 @@ class ProcessEventRequest(BaseModel):
     after_upload_id: UUID = Field(..., description="After snapshot upload UUID")
 
 
+class BatchEventAnalyticsRequest(BaseModel):
+    """Request body for loading analytics of several events at once"""
+
+    event_ids: list[UUID] = Field(
+        ..., min_length=1, max_length=50, description="Event UUIDs to load"
+    )
+
+
 # ============================================================================
 # Response Schemas
 # ============================================================================
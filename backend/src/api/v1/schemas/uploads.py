@@ -0,0 +1,61 @@
+"""
+Uploads API Schemas
+
+Response models for CSV upload endpoints.
+
+Follows CLAUDE.md:
+- Pydantic V2 syntax
+- snake_case naming
+- Clear type hints
+"""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.models.csv_upload import UploadType
+
+# ============================================================================
+# Response Schemas
+# ============================================================================
+
+
+class UploadCsvResponse(BaseModel):
+    """Response for CSV upload"""
+
+    upload_id: UUID = Field(..., description="Created upload UUID")
+    season_id: UUID = Field(..., description="Season UUID")
+    alliance_id: UUID = Field(..., description="Alliance UUID")
+    snapshot_date: str = Field(..., description="Snapshot datetime (ISO format)")
+    filename: str = Field(..., description="Original filename")
+    total_members: int = Field(..., description="Total members in this upload")
+    total_snapshots: int = Field(..., description="Snapshots created")
+    total_periods: int = Field(..., description="Periods recalculated")
+    replaced_existing: bool = Field(..., description="Whether a same-date upload was replaced")
+    upload_type: UploadType = Field(..., description="'regular' or 'event'")
+
+
+class UploadListItemResponse(BaseModel):
+    """CSV upload record for list display"""
+
+    id: UUID
+    season_id: UUID
+    alliance_id: UUID
+    snapshot_date: str = Field(..., description="Snapshot datetime (ISO format)")
+    file_name: str
+    total_members: int
+    uploaded_at: str = Field(..., description="Upload datetime (ISO format)")
+
+
+class UploadListResponse(BaseModel):
+    """List of CSV uploads for a season"""
+
+    uploads: list[UploadListItemResponse]
+    total: int
+
+
+class DeleteUploadResponse(BaseModel):
+    """Response for CSV upload deletion"""
+
+    message: str
+    upload_id: UUID
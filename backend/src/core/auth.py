@@ -7,6 +7,8 @@ Authentication utilities for JWT token verification
 - FastAPI dependency injection
 """
 
+import time
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
@@ -20,6 +22,26 @@ from src.core.config import settings
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=1024)
+def _decode_token(token: str) -> dict:
+    """
+    Decode and verify JWT signature (cached per raw token string)
+
+    The token string is itself signed over header + payload, so an identical
+    string always yields an identical payload. Expiration is NOT trusted from
+    the cache - callers must re-check ``exp`` on every lookup.
+
+    Raises:
+        JWTError: If signature, audience or expiration is invalid
+    """
+    return jwt.decode(
+        token,
+        settings.supabase_jwt_secret,
+        algorithms=["HS256"],
+        audience="authenticated",
+    )
+
+
 def verify_supabase_token(token: str) -> dict:
     """
     Verify Supabase JWT token
@@ -36,16 +58,8 @@ def verify_supabase_token(token: str) -> dict:
     Reference: https://supabase.com/docs/guides/auth/server-side/verifying-jwts
     """
     try:
-        # Decode JWT token using Supabase JWT secret
-        payload = jwt.decode(
-            token,
-            settings.supabase_jwt_secret,
-            algorithms=["HS256"],
-            audience="authenticated",
-        )
-
-        return payload
-
+        # Decode JWT token using Supabase JWT secret (signature check is cached)
+        payload = _decode_token(token)
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -53,6 +67,17 @@ def verify_supabase_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    # Expiration is re-evaluated on every call, even on cache hits
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return dict(payload)
+
 
 def get_current_user_id(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
@@ -43,6 +43,9 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    # Database worker threads (Supabase SDK is sync; repositories use asyncio.to_thread)
+    db_thread_pool_size: int = 32
+
     # LINE Bot Configuration
     line_channel_id: str | None = None
     line_channel_secret: str | None = None
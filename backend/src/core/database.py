@@ -4,12 +4,16 @@ Database connection and client management
 符合 CLAUDE.md: Supabase client singleton
 """
 
+import asyncio
+import logging
 from functools import lru_cache
 
 from supabase import Client, create_client
 
 from src.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 @lru_cache
 def get_supabase_client() -> Client:
@@ -29,3 +33,18 @@ def get_supabase_client() -> Client:
 
 # Global client instance
 supabase_client = get_supabase_client()
+
+
+async def warm_supabase_connection() -> None:
+    """
+    Open the pooled PostgREST connection before the first request
+
+    Issues one cheap query so the TCP/TLS handshake is not paid by a user
+    request. Failures are logged only; the app still starts.
+    """
+    try:
+        await asyncio.to_thread(
+            lambda: supabase_client.from_("alliances").select("id").limit(1).execute()
+        )
+    except Exception as e:
+        logger.warning(f"Supabase connection warm-up failed: {e}")
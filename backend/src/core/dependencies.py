@@ -19,14 +19,16 @@ Usage:
         return await service.get_user_alliance(user_id)
 """
 
+from functools import lru_cache
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, File, HTTPException, Query, UploadFile, status
 from supabase import Client
 
 from src.core.auth import get_current_user_id
 from src.core.database import get_supabase_client
+from src.models.alliance import Alliance
 from src.services.alliance_collaborator_service import AllianceCollaboratorService
 from src.services.alliance_service import AllianceService
 from src.services.analytics_service import AnalyticsService
@@ -34,6 +36,7 @@ from src.services.battle_event_service import BattleEventService
 from src.services.copper_mine_rule_service import CopperMineRuleService
 from src.services.copper_mine_service import CopperMineService
 from src.services.csv_upload_service import CSVUploadService
+from src.services.donation_service import DonationService
 from src.services.hegemony_weight_service import HegemonyWeightService
 from src.services.line_binding_service import LineBindingService
 from src.services.period_metrics_service import PeriodMetricsService
@@ -43,6 +46,10 @@ from src.services.subscription_service import SubscriptionService
 
 # ============================================================================
 # Provider Functions (called by Type Aliases)
+#
+# Services are stateless (they only hold repositories around the shared
+# Supabase client), so each provider returns a process-wide singleton
+# instead of rebuilding the service graph on every request.
 # ============================================================================
 
 def get_db() -> Client:
@@ -50,71 +57,102 @@ def get_db() -> Client:
     return get_supabase_client()
 
 
+@lru_cache
 def get_alliance_service() -> AllianceService:
     """Get alliance service instance"""
     return AllianceService()
 
 
+@lru_cache
 def get_csv_upload_service() -> CSVUploadService:
     """Get CSV upload service instance"""
     return CSVUploadService()
 
 
+@lru_cache
 def get_season_service() -> SeasonService:
     """Get season service instance"""
     return SeasonService()
 
 
+@lru_cache
 def get_alliance_collaborator_service() -> AllianceCollaboratorService:
     """Get alliance collaborator service instance"""
     return AllianceCollaboratorService()
 
 
+@lru_cache
 def get_permission_service() -> PermissionService:
     """Get permission service instance"""
     return PermissionService()
 
 
+@lru_cache
 def get_hegemony_weight_service() -> HegemonyWeightService:
     """Get hegemony weight service instance"""
     return HegemonyWeightService()
 
 
+@lru_cache
 def get_period_metrics_service() -> PeriodMetricsService:
     """Get period metrics service instance"""
     return PeriodMetricsService()
 
 
+@lru_cache
 def get_analytics_service() -> AnalyticsService:
     """Get analytics service instance"""
     return AnalyticsService()
 
 
+@lru_cache
 def get_battle_event_service() -> BattleEventService:
     """Get battle event service instance"""
     return BattleEventService()
 
 
+@lru_cache
 def get_line_binding_service() -> LineBindingService:
     """Get LINE binding service instance"""
     return LineBindingService()
 
 
+@lru_cache
 def get_copper_mine_service() -> CopperMineService:
     """Get copper mine service instance"""
     return CopperMineService()
 
 
+@lru_cache
 def get_copper_mine_rule_service() -> CopperMineRuleService:
     """Get copper mine rule service instance"""
     return CopperMineRuleService()
 
 
+@lru_cache
+def get_donation_service() -> DonationService:
+    """Get donation service instance"""
+    return DonationService()
+
+
+@lru_cache
 def get_subscription_service() -> SubscriptionService:
     """Get subscription service instance"""
     return SubscriptionService()
 
 
+def get_csv_file(file: Annotated[UploadFile, File()]) -> UploadFile:
+    """
+    Validate an uploaded file is a CSV before the endpoint reads it
+
+    Raises:
+        ValueError: If the filename does not end with .csv (any case)
+    """
+    if not file.filename or not file.filename.lower().endswith(".csv"):
+        raise ValueError("File must be a CSV file")
+    return file
+
+
 # ============================================================================
 # Type Aliases for Dependency Injection (2025 Standard)
 # 符合 CLAUDE.md 🟡: Annotated[Type, Depends()] pattern
@@ -126,6 +164,12 @@ DbClientDep = Annotated[Client, Depends(get_db)]
 # Authentication
 UserIdDep = Annotated[UUID, Depends(get_current_user_id)]
 
+# Uploads
+CsvFileDep = Annotated[UploadFile, Depends(get_csv_file)]
+
+# Shared query parameters
+SeasonIdQuery = Annotated[UUID, Query(description="Season UUID")]
+
 # Services
 AllianceServiceDep = Annotated[AllianceService, Depends(get_alliance_service)]
 SeasonServiceDep = Annotated[SeasonService, Depends(get_season_service)]
@@ -152,3 +196,29 @@ CopperMineRuleServiceDep = Annotated[
     Depends(get_copper_mine_rule_service)
 ]
 SubscriptionServiceDep = Annotated[SubscriptionService, Depends(get_subscription_service)]
+DonationServiceDep = Annotated[DonationService, Depends(get_donation_service)]
+
+
+# ============================================================================
+# Request-scoped Resources
+# FastAPI caches dependency results per request, so the lookup runs once even
+# when several dependants of the same route need it.
+# ============================================================================
+
+async def get_user_alliance(user_id: UserIdDep, service: AllianceServiceDep) -> Alliance:
+    """
+    Get the current user's alliance
+
+    Raises:
+        HTTPException 404: If the user has no alliance
+    """
+    alliance = await service.get_user_alliance(user_id)
+    if not alliance:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User has no alliance"
+        )
+    return alliance
+
+
+UserAllianceDep = Annotated[Alliance, Depends(get_user_alliance)]
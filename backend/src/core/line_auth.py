@@ -12,6 +12,7 @@ import base64
 import hashlib
 import hmac
 import logging
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, Request, status
@@ -20,6 +21,10 @@ from src.core.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Outbound LINE Messaging API connection pool
+LINE_API_POOL_MAXSIZE = 20
+LINE_API_RETRIES = 2
+
 
 def verify_line_signature(
     body: bytes,
@@ -95,9 +100,14 @@ async def verify_webhook_signature(
 WebhookBodyDep = Annotated[bytes, Depends(verify_webhook_signature)]
 
 
+@lru_cache
 def get_line_bot_api():
     """
-    Get LINE Bot API client (lazy initialization)
+    Get LINE Bot API client (lazy initialization, cached singleton)
+
+    The client is reused so its urllib3 pool keeps connections to
+    api.line.me alive across webhook events instead of paying a TLS
+    handshake per reply.
 
     Returns:
         LineBotApi instance or None if not configured
@@ -120,6 +130,9 @@ def get_line_bot_api():
         configuration = Configuration(
             access_token=settings.line_access_token  # type: ignore
         )
+        configuration.connection_pool_maxsize = LINE_API_POOL_MAXSIZE
+        # Connection errors only; urllib3 does not re-send non-idempotent POSTs on read errors
+        configuration.retries = LINE_API_RETRIES
         api_client = ApiClient(configuration)
         return MessagingApi(api_client)
     except ImportError:
@@ -127,6 +140,17 @@ def get_line_bot_api():
         return None
 
 
+def close_line_bot_api() -> None:
+    """Release pooled LINE API connections (called on application shutdown)"""
+    if get_line_bot_api.cache_info().currsize == 0:
+        return
+
+    line_bot = get_line_bot_api()
+    if line_bot:
+        line_bot.api_client.rest_client.pool_manager.clear()
+    get_line_bot_api.cache_clear()
+
+
 def create_liff_url(liff_id: str, group_id: str) -> str:
     """
     Create LIFF URL with group ID parameter
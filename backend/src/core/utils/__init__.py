@@ -5,5 +5,6 @@ Core utility functions for the application.
 """
 
 from src.core.utils.date_helpers import format_date_key
+from src.core.utils.http_cache import conditional_json_response
 
-__all__ = ["format_date_key"]
+__all__ = ["conditional_json_response", "format_date_key"]
@@ -0,0 +1,76 @@
+"""
+HTTP Cache Helpers
+
+符合 CLAUDE.md 🟢: Pure utility functions for conditional responses.
+Serializes a payload once, derives an ETag from the bytes, and answers
+``If-None-Match`` revalidation with 304 Not Modified.
+"""
+
+from hashlib import blake2b
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic_core import to_json
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong ETag from a serialized response body.
+
+    Args:
+        body: Serialized response bytes
+
+    Returns:
+        Quoted ETag value (e.g., '"3f2a9c0d1b4e5f67"')
+    """
+    return f'"{blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already holds this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def conditional_json_response(
+    request: Request,
+    content: Any,
+    max_age: int = 5,
+) -> Response:
+    """
+    Serialize content to JSON with ETag and private Cache-Control headers.
+
+    Returns 304 Not Modified when the client's If-None-Match matches.
+    Responses are always ``private`` because every payload is user-scoped.
+
+    Args:
+        request: Incoming request
+        content: Pydantic model, dict or list to serialize
+        max_age: Seconds the client may reuse the response without revalidating;
+            0 sends ``no-cache`` so every reuse is revalidated (304 still applies)
+
+    Returns:
+        JSON response, or empty 304 response on ETag match
+    """
+    body = to_json(content)
+    etag = make_etag(body)
+    cache_control = f"private, max-age={max_age}" if max_age > 0 else "private, no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
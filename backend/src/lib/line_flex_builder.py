@@ -9,11 +9,16 @@ This module provides builders for various report types:
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 from src.models.battle_event_metrics import EventGroupAnalytics, GroupEventStats
 
 logger = logging.getLogger(__name__)
 
+# LIFF entry messages differ only by call site and group, so a bounded cache
+# covers every active group
+LIFF_ENTRY_CACHE_SIZE = 1024
+
 
 def format_number(n: int | float) -> str:
     """
@@ -397,6 +402,7 @@ def _build_ranking_row(member):
 # =============================================================================
 
 
+@lru_cache(maxsize=LIFF_ENTRY_CACHE_SIZE)
 def build_liff_entry_flex(
     title: str,
     subtitle: str,
@@ -411,6 +417,9 @@ def build_liff_entry_flex(
     """
     Build a unified LIFF entry Flex Message.
 
+    Results are memoized per argument set; building the SDK model graph costs
+    far more than a cache lookup. Callers must treat the message as read-only.
+
     Args:
         title: Main title text (e.g., "🏰 同盟連結成功！")
         subtitle: Description text (e.g., "各位盟友，點擊登記名號！")
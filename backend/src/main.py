@@ -5,8 +5,14 @@ Three Kingdoms Strategy Manager FastAPI Application
 - redirect_slashes=False (cloud deployment requirement)
 - Proper CORS configuration
 - Global exception handlers (CLAUDE.md 🟡)
+- Lifespan sizes the DB worker thread pool and warms the Supabase connection
 """
 
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -26,7 +32,30 @@ from src.api.v1.endpoints import (
     uploads,
 )
 from src.core.config import settings
+from src.core.database import warm_supabase_connection
 from src.core.exceptions import SubscriptionExpiredError
+from src.core.line_auth import close_line_bot_api
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application startup/shutdown
+
+    Repositories run the sync Supabase SDK via asyncio.to_thread, so the
+    loop's default executor bounds concurrent DB calls. Size it explicitly
+    (the stdlib default is only min(32, cpu + 4)) and warm the connection.
+    On shutdown, release the pooled LINE API connections.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=settings.db_thread_pool_size, thread_name_prefix="supabase"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    await warm_supabase_connection()
+    yield
+    close_line_bot_api()
+    executor.shutdown(wait=False)
+
 
 # Create FastAPI app
 # 符合 CLAUDE.md 🔴: redirect_slashes=False for cloud deployment
@@ -35,6 +64,7 @@ app = FastAPI(
     description="Alliance Member Performance Tracking System",
     version=settings.version,
     redirect_slashes=False,
+    lifespan=lifespan,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
 )
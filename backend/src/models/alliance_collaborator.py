@@ -71,3 +71,10 @@ class AllianceCollaboratorListResponse(BaseModel):
 
     collaborators: list[AllianceCollaboratorResponse]
     total: int
+
+
+class ProcessInvitationsResponse(BaseModel):
+    """Pending invitation processing result"""
+
+    processed_count: int
+    message: str
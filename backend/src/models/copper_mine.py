@@ -185,7 +185,9 @@ class CopperMineRuleResponse(BaseModel):
 class CopperMineOwnershipCreate(BaseModel):
     """Request to create a copper mine ownership (from Dashboard)"""
 
-    member_id: str = Field(..., description="Member UUID")
+    member_id: UUID | Literal["reserved"] = Field(
+        ..., description="Member UUID, or 'reserved' for an alliance-reserved mine"
+    )
     coord_x: int = Field(..., ge=0)
     coord_y: int = Field(..., ge=0)
     level: int = Field(..., ge=9, le=10)
@@ -195,4 +197,4 @@ class CopperMineOwnershipCreate(BaseModel):
 class CopperMineOwnershipUpdate(BaseModel):
     """Request to update a copper mine ownership (for transferring reserved mines)"""
 
-    member_id: str = Field(..., description="Member UUID to transfer to")
+    member_id: UUID = Field(..., description="Member UUID to transfer to")
@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class HegemonyWeightBase(BaseModel):
@@ -65,6 +65,13 @@ class HegemonyWeightCreate(HegemonyWeightBase):
 
     csv_upload_id: UUID = Field(description="CSV upload ID this weight configuration applies to")
 
+    @model_validator(mode="after")
+    def validate_tier1_weights(self) -> "HegemonyWeightCreate":
+        """Validate tier 1 weights sum to 1.0 as part of request parsing"""
+        if not self.validate_indicator_weights_sum():
+            raise ValueError("Tier 1 weights must sum to 1.0")
+        return self
+
 
 class HegemonyWeightUpdate(BaseModel):
     """Model for updating an existing hegemony weight configuration"""
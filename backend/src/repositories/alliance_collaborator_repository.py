@@ -65,6 +65,44 @@ class AllianceCollaboratorRepository(SupabaseRepository[AllianceCollaboratorDB])
         data = self._handle_supabase_result(result, allow_empty=False)
         return self._build_model(data[0])
 
+    async def add_collaborators(
+        self,
+        user_id: UUID,
+        memberships: list[tuple[UUID, str, UUID | None]],
+    ) -> list[AllianceCollaboratorDB]:
+        """
+        Add a user to multiple alliances in a single insert.
+
+        Args:
+            user_id: User UUID to add
+            memberships: (alliance_id, role, invited_by) tuples
+
+        Returns:
+            list[AllianceCollaboratorDB]: Created collaborator records
+
+        Raises:
+            HTTPException: If Supabase operation fails
+        """
+        if not memberships:
+            return []
+
+        rows = [
+            {
+                "alliance_id": str(alliance_id),
+                "user_id": str(user_id),
+                "role": role,
+                "invited_by": str(invited_by) if invited_by else None,
+            }
+            for alliance_id, role, invited_by in memberships
+        ]
+
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name).insert(rows).execute()
+        )
+
+        data = self._handle_supabase_result(result, allow_empty=False)
+        return self._build_models(data)
+
     async def remove_collaborator(self, alliance_id: UUID, user_id: UUID) -> bool:
         """
         Remove a collaborator from alliance.
@@ -153,6 +191,33 @@ class AllianceCollaboratorRepository(SupabaseRepository[AllianceCollaboratorDB])
         data = self._handle_supabase_result(result, allow_empty=True)
         return len(data) > 0
 
+    async def get_member_alliance_ids(
+        self, user_id: UUID, alliance_ids: list[UUID]
+    ) -> set[UUID]:
+        """
+        Get which of the given alliances the user already belongs to.
+
+        Args:
+            user_id: User UUID
+            alliance_ids: Alliance UUIDs to check
+
+        Returns:
+            set[UUID]: Subset of alliance_ids the user is a collaborator of
+        """
+        if not alliance_ids:
+            return set()
+
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
+            .select("alliance_id")
+            .eq("user_id", str(user_id))
+            .in_("alliance_id", [str(alliance_id) for alliance_id in alliance_ids])
+            .execute()
+        )
+
+        data = self._handle_supabase_result(result, allow_empty=True)
+        return {UUID(row["alliance_id"]) for row in data}
+
     async def get_collaborator_role(
         self, alliance_id: UUID, user_id: UUID
     ) -> str | None:
@@ -10,16 +10,28 @@ Base repository with Supabase error handling
 
 import asyncio
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
 from postgrest.types import CountMethod
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from supabase import Client
 
 from src.core.database import get_supabase_client
 
 
+@lru_cache
+def _list_adapter(model_class: type[BaseModel]) -> TypeAdapter:
+    """
+    Get a compiled list validator for a model class (built once per class)
+
+    Validating ``list[Model]`` through a TypeAdapter iterates rows inside
+    pydantic-core instead of calling the model constructor once per row.
+    """
+    return TypeAdapter(list[model_class])
+
+
 class SupabaseRepository[T: BaseModel]:
     """
     Base repository for Supabase data access
@@ -109,7 +121,7 @@ class SupabaseRepository[T: BaseModel]:
         Returns:
             List of validated Pydantic models
         """
-        return [self.model_class(**row) for row in data]
+        return _list_adapter(self.model_class).validate_python(data)
 
     def _build_model(self, data: dict) -> T:
         """
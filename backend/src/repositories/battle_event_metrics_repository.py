@@ -15,6 +15,9 @@ from src.models.battle_event_metrics import (
 )
 from src.repositories.base import SupabaseRepository
 
+# PostgREST caps rows per response; batched reads page through results
+METRICS_PAGE_SIZE = 1000
+
 
 class BattleEventMetricsRepository(SupabaseRepository[BattleEventMetrics]):
     """Repository for battle event metrics data access"""
@@ -112,6 +115,53 @@ class BattleEventMetricsRepository(SupabaseRepository[BattleEventMetrics]):
 
         return metrics_list
 
+    async def get_by_events_with_member_and_group(
+        self, event_ids: list[UUID]
+    ) -> dict[UUID, list[BattleEventMetricsWithMember]]:
+        """
+        Get metrics with member and group info for several events in one query
+
+        Args:
+            event_ids: Battle event UUIDs
+
+        Returns:
+            Dict mapping event_id to its metrics, each ordered by merit_diff desc
+            (events without metrics map to an empty list)
+
+        符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
+        """
+        metrics_by_event: dict[UUID, list[BattleEventMetricsWithMember]] = {
+            event_id: [] for event_id in event_ids
+        }
+        if not event_ids:
+            return metrics_by_event
+
+        event_id_strings = [str(event_id) for event_id in event_ids]
+        offset = 0
+        while True:
+            query = (
+                self.client.from_(self.table_name)
+                .select("*, members!inner(name), member_snapshots!end_snapshot_id(group_name)")
+                .in_("event_id", event_id_strings)
+                .order("merit_diff", desc=True)
+                .order("id")
+                .range(offset, offset + METRICS_PAGE_SIZE - 1)
+            )
+            result = await self._execute_async(query.execute)
+            data = self._handle_supabase_result(result, allow_empty=True)
+
+            for row in data:
+                member_data = row.pop("members", {})
+                snapshot_data = row.pop("member_snapshots", {})
+                row["member_name"] = member_data.get("name", "Unknown")
+                row["group_name"] = snapshot_data.get("group_name") if snapshot_data else None
+                metrics = BattleEventMetricsWithMember(**row)
+                metrics_by_event[metrics.event_id].append(metrics)
+
+            if len(data) < METRICS_PAGE_SIZE:
+                return metrics_by_event
+            offset += METRICS_PAGE_SIZE
+
     async def create_batch(
         self, metrics_list: list[BattleEventMetricsCreate]
     ) -> list[BattleEventMetrics]:
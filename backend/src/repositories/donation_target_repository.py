@@ -43,6 +43,33 @@ class DonationTargetRepository(SupabaseRepository[DonationTarget]):
         data = self._handle_supabase_result(result, expect_single=True)
         return self._build_model(data)
 
+    async def upsert_targets(
+        self,
+        donation_event_id: UUID,
+        alliance_id: UUID,
+        targets: list[tuple[UUID, int]],
+    ) -> list[DonationTarget]:
+        """Insert or update many member target overrides in a single upsert"""
+        if not targets:
+            return []
+
+        payload = [
+            {
+                "donation_event_id": str(donation_event_id),
+                "alliance_id": str(alliance_id),
+                "member_id": str(member_id),
+                "target_amount": target_amount,
+            }
+            for member_id, target_amount in targets
+        ]
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
+            .upsert(payload, on_conflict="donation_event_id,member_id")
+            .execute()
+        )
+        data = self._handle_supabase_result(result, allow_empty=True)
+        return self._build_models(data)
+
     async def delete_target(self, donation_event_id: UUID, member_id: UUID) -> None:
         """Delete a member's target override for a donation event"""
         await self._execute_async(
@@ -584,6 +584,7 @@ class LineBindingRepository(SupabaseRepository[LineBindingCode]):
             .eq("line_group_id", line_group_id)
             .eq("line_user_id", line_user_id)
             .gte("sent_at", since.isoformat())
+            .limit(1)
             .execute()
         )
 
@@ -614,18 +615,21 @@ class LineBindingRepository(SupabaseRepository[LineBindingCode]):
             .execute()
         )
 
-    async def is_user_registered_in_group(
+    async def is_user_registered_in_alliance(
         self,
-        line_group_id: str,
+        alliance_id: UUID,
         line_user_id: str
     ) -> bool:
-        """Check if a LINE user has any registered game IDs in the group's alliance"""
-        group_binding = await self.get_group_binding_by_line_group_id(line_group_id)
-        if not group_binding:
-            return False
-
-        bindings = await self.get_member_bindings_by_line_user(
-            alliance_id=group_binding.alliance_id,
-            line_user_id=line_user_id
+        """Check if a LINE user has any registered game IDs in the alliance"""
+        result = await self._execute_async(
+            lambda: self.client
+            .from_("member_line_bindings")
+            .select("id")
+            .eq("alliance_id", str(alliance_id))
+            .eq("line_user_id", line_user_id)
+            .limit(1)
+            .execute()
         )
-        return len(bindings) > 0
+
+        data = self._handle_supabase_result(result, allow_empty=True)
+        return len(data) > 0
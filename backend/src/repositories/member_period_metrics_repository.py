@@ -31,8 +31,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("*")
             .eq("period_id", str(period_id))
             .order("daily_contribution", desc=True)
@@ -54,8 +54,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("*, members(name)")
             .eq("period_id", str(period_id))
             .order("daily_contribution", desc=True)
@@ -101,7 +101,7 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         if season_id:
             query = query.eq("periods.season_id", str(season_id))
 
-        result = query.order("created_at").execute()
+        result = await self._execute_async(lambda: query.order("created_at").execute())
 
         data = self._handle_supabase_result(result, allow_empty=True)
         return self._build_models(data)
@@ -121,7 +121,9 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         if not metrics_data:
             return []
 
-        result = self.client.from_(self.table_name).insert(metrics_data).execute()
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name).insert(metrics_data).execute()
+        )
         data = self._handle_supabase_result(result, allow_empty=False)
         return self._build_models(data)
 
@@ -137,8 +139,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .delete()
             .eq("period_id", str(period_id))
             .execute()
@@ -158,8 +160,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .delete()
             .eq("alliance_id", str(alliance_id))
             .execute()
@@ -189,8 +191,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         from statistics import median
 
         # Query all metrics for these periods
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("period_id, daily_contribution, daily_merit, daily_assist, daily_donation, end_power")
             .in_("period_id", [str(pid) for pid in period_ids])
             .execute()
@@ -249,8 +251,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         Note: This is a simplified version. For complex aggregations,
               consider using a Postgres function.
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("end_group, daily_contribution, daily_merit, daily_assist, daily_donation")
             .eq("period_id", str(period_id))
             .execute()
@@ -305,8 +307,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("*, members(name)")
             .eq("period_id", str(period_id))
             .eq("end_group", group_name)
@@ -347,8 +349,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         if not member_ids or not period_ids:
             return []
 
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select(
                 "period_id, member_id, end_rank, "
                 "daily_contribution, daily_merit, daily_assist, daily_donation, end_power"
@@ -374,8 +376,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
         """
         from collections import Counter
 
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("end_group")
             .eq("period_id", str(period_id))
             .execute()
@@ -410,8 +412,8 @@ class MemberPeriodMetricsRepository(SupabaseRepository[MemberPeriodMetrics]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select(
                 "member_id, end_group, end_rank, end_power, rank_change, "
                 "daily_contribution, daily_merit, daily_assist, daily_donation, "
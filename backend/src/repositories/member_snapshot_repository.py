@@ -322,9 +322,6 @@ class MemberSnapshotRepository(SupabaseRepository[MemberSnapshot]):
         """
         Get member snapshots closest before or on target date for given alliance and season.
 
-        Queries member_snapshots and joins with csv_uploads to filter by season,
-        then finds the upload closest to but not after the target date.
-
         Args:
             alliance_id: Alliance UUID
             season_id: Season UUID
@@ -332,10 +329,30 @@ class MemberSnapshotRepository(SupabaseRepository[MemberSnapshot]):
 
         Returns:
             List of MemberSnapshot models from the closest upload, empty if none found
+        """
+        (snapshots,) = await self.get_closest_to_dates(alliance_id, season_id, [target_date])
+        return snapshots
+
+    async def get_closest_to_dates(
+        self, alliance_id: UUID, season_id: UUID, target_dates: list[datetime]
+    ) -> list[list[MemberSnapshot]]:
+        """
+        Get member snapshots closest before or on each target date in two queries.
+
+        Resolves the closest csv_upload for every date from a single uploads
+        query, then fetches the snapshots of all resolved uploads at once.
+
+        Args:
+            alliance_id: Alliance UUID
+            season_id: Season UUID
+            target_dates: Target datetimes (before or on each date)
+
+        Returns:
+            One snapshot list per target date, in the same order; empty if none found
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        # First, find the csv_upload closest to target_date for this season
+        # First, list the season's csv_uploads once for every target date
         upload_result = await self._execute_async(
             lambda: self.client.from_("csv_uploads")
             .select("id, created_at")
@@ -345,37 +362,44 @@ class MemberSnapshotRepository(SupabaseRepository[MemberSnapshot]):
 
         uploads = self._handle_supabase_result(upload_result, allow_empty=True)
         if not uploads:
-            return []
+            return [[] for _ in target_dates]
 
-        # Filter to only uploads before or on target_date
-        target_ts = (
-            target_date.replace(tzinfo=UTC)
-            if target_date.tzinfo is None
-            else target_date
-        )
-
-        valid_uploads = [
-            u for u in uploads
-            if datetime.fromisoformat(u["created_at"].replace("Z", "+00:00")) <= target_ts
+        upload_times = [
+            (str(UUID(u["id"])), datetime.fromisoformat(u["created_at"].replace("Z", "+00:00")))
+            for u in uploads
         ]
 
-        if not valid_uploads:
-            return []
-
-        # Find upload closest to target_date (latest before or on target)
-        closest_upload = max(
-            valid_uploads,
-            key=lambda u: datetime.fromisoformat(u["created_at"].replace("Z", "+00:00")),
-        )
-
-        # Now get all member snapshots for this upload and alliance
+        # Find upload closest to each target date (latest before or on target)
+        closest_upload_ids: list[str | None] = []
+        for target_date in target_dates:
+            target_ts = (
+                target_date.replace(tzinfo=UTC)
+                if target_date.tzinfo is None
+                else target_date
+            )
+            valid_uploads = [(uid, ts) for uid, ts in upload_times if ts <= target_ts]
+            closest_upload_ids.append(
+                max(valid_uploads, key=lambda u: u[1])[0] if valid_uploads else None
+            )
+
+        upload_ids = list(dict.fromkeys(uid for uid in closest_upload_ids if uid))
+        if not upload_ids:
+            return [[] for _ in target_dates]
+
+        # Now get member snapshots for all resolved uploads in one query
         result = await self._execute_async(
             lambda: self.client.from_(self.table_name)
             .select("*")
-            .eq("csv_upload_id", closest_upload["id"])
+            .in_("csv_upload_id", upload_ids)
             .eq("alliance_id", str(alliance_id))
             .execute()
         )
 
-        data_list = self._handle_supabase_result(result, allow_empty=True)
-        return self._build_models(data_list)
+        snapshots = self._build_models(
+            self._handle_supabase_result(result, allow_empty=True)
+        )
+        by_upload: dict[str, list[MemberSnapshot]] = {uid: [] for uid in upload_ids}
+        for snapshot in snapshots:
+            by_upload[str(snapshot.csv_upload_id)].append(snapshot)
+
+        return [by_upload[uid] if uid else [] for uid in closest_upload_ids]
@@ -122,6 +122,31 @@ class PendingInvitationRepository(SupabaseRepository[PendingInvitation]):
         data_dict = self._handle_supabase_result(result, expect_single=True)
         return self._build_model(data_dict)
 
+    async def mark_many_as_accepted(self, invitation_ids: list[UUID]) -> int:
+        """
+        Mark multiple invitations as accepted in a single update.
+
+        Args:
+            invitation_ids: Invitation UUIDs
+
+        Returns:
+            Number of invitations updated
+
+        Raises:
+            HTTPException: If update fails
+        """
+        if not invitation_ids:
+            return 0
+
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
+            .update({"status": "accepted", "accepted_at": "now()"})
+            .in_("id", [str(invitation_id) for invitation_id in invitation_ids])
+            .execute()
+        )
+        data_list = self._handle_supabase_result(result, allow_empty=True)
+        return len(data_list)
+
     async def revoke_invitation(self, invitation_id: UUID) -> bool:
         """
         Revoke (cancel) a pending invitation.
@@ -31,8 +31,8 @@ class PeriodRepository(SupabaseRepository[Period]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("*")
             .eq("season_id", str(season_id))
             .order("period_number")
@@ -54,8 +54,8 @@ class PeriodRepository(SupabaseRepository[Period]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("*")
             .eq("end_upload_id", str(end_upload_id))
             .execute()
@@ -80,7 +80,9 @@ class PeriodRepository(SupabaseRepository[Period]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = self.client.from_(self.table_name).insert(period_data).execute()
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name).insert(period_data).execute()
+        )
         data = self._handle_supabase_result(result, expect_single=True)
         return self._build_model(data)
 
@@ -96,8 +98,8 @@ class PeriodRepository(SupabaseRepository[Period]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .delete()
             .eq("season_id", str(season_id))
             .execute()
@@ -117,8 +119,8 @@ class PeriodRepository(SupabaseRepository[Period]):
 
         符合 CLAUDE.md 🔴: Uses _handle_supabase_result()
         """
-        result = (
-            self.client.from_(self.table_name)
+        result = await self._execute_async(
+            lambda: self.client.from_(self.table_name)
             .select("period_number")
             .eq("season_id", str(season_id))
             .order("period_number", desc=True)
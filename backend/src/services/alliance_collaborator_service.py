@@ -7,7 +7,9 @@ Alliance Collaborator Service
 - 🟡 Exception chaining with 'from e'
 """
 
+import asyncio
 import logging
+import time
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -17,10 +19,15 @@ from src.repositories.alliance_collaborator_repository import (
     AllianceCollaboratorRepository,
 )
 from src.repositories.pending_invitation_repository import PendingInvitationRepository
+from src.services.alliance_service import invalidate_user_alliance
 from src.services.permission_service import PermissionService
 
 logger = logging.getLogger(__name__)
 
+# User emails rarely change; cache Supabase Auth lookups for 5 minutes
+USER_EMAIL_CACHE_TTL_SECONDS = 300
+USER_EMAIL_CACHE_MAX_ENTRIES = 4096
+
 
 class AllianceCollaboratorService:
     """
@@ -37,6 +44,7 @@ class AllianceCollaboratorService:
         self._invitation_repo = PendingInvitationRepository()
         self._permission_service = PermissionService()
         self._supabase = get_supabase_client()
+        self._email_cache: dict[UUID, tuple[str, float]] = {}
 
     async def add_collaborator_by_email(
         self, current_user_id: UUID, alliance_id: UUID, email: str
@@ -70,7 +78,7 @@ class AllianceCollaboratorService:
             )
 
             # 2. Look up user by email in auth.users
-            result = self._supabase.auth.admin.list_users()
+            result = await asyncio.to_thread(self._supabase.auth.admin.list_users)
             users_list = result.users if hasattr(result, 'users') else result
             users_array = list(users_list)
             target_user = next((u for u in users_array if u.email == email), None)
@@ -189,9 +197,12 @@ class AllianceCollaboratorService:
                 )
 
             # 4. Remove collaborator
-            return await self._collaborator_repo.remove_collaborator(
+            removed = await self._collaborator_repo.remove_collaborator(
                 alliance_id, target_user_id
             )
+            self._permission_service.invalidate_user_role(alliance_id, target_user_id)
+            invalidate_user_alliance(alliance_id, target_user_id)
+            return removed
 
         except HTTPException:
             raise
@@ -268,6 +279,7 @@ class AllianceCollaboratorService:
             updated_collaborator = await self._collaborator_repo.update_role(
                 alliance_id, target_user_id, new_role
             )
+            self._permission_service.invalidate_user_role(alliance_id, target_user_id)
 
             return {
                 "id": str(updated_collaborator.id),
@@ -288,6 +300,10 @@ class AllianceCollaboratorService:
         """
         Get user email from Supabase Auth.
 
+        Successful lookups are cached per user for USER_EMAIL_CACHE_TTL_SECONDS.
+        The Supabase Auth admin API is synchronous, so the call runs in a
+        worker thread to keep the event loop free.
+
         Args:
             user_id: User UUID
 
@@ -296,13 +312,34 @@ class AllianceCollaboratorService:
 
         符合 CLAUDE.md 🔴: Service layer handles external API calls
         """
+        cached = self._email_cache.get(user_id)
+        if cached and time.time() - cached[1] < USER_EMAIL_CACHE_TTL_SECONDS:
+            return cached[0]
+
         try:
-            user_response = self._supabase.auth.admin.get_user_by_id(str(user_id))
-            return user_response.user.email if user_response and user_response.user else None
+            user_response = await asyncio.to_thread(
+                self._supabase.auth.admin.get_user_by_id, str(user_id)
+            )
+            email = user_response.user.email if user_response and user_response.user else None
         except Exception as e:
             logger.error(f"Failed to get user email for {user_id}: {e}")
             return None
 
+        if email:
+            self._remember_email(user_id, email)
+        return email
+
+    def _remember_email(self, user_id: UUID, email: str) -> None:
+        """Cache a user's email, pruning expired entries once the cache is full"""
+        now = time.time()
+        if len(self._email_cache) >= USER_EMAIL_CACHE_MAX_ENTRIES:
+            self._email_cache = {
+                key: (cached_email, cached_at)
+                for key, (cached_email, cached_at) in self._email_cache.items()
+                if now - cached_at < USER_EMAIL_CACHE_TTL_SECONDS
+            }
+        self._email_cache[user_id] = (email, now)
+
     async def process_pending_invitations(self, user_id: UUID, email: str) -> int:
         """
         Process all pending invitations for a newly registered user.
@@ -330,42 +367,31 @@ class AllianceCollaboratorService:
                 return 0
 
             logger.info(f"Found {len(pending_invitations)} pending invitation(s) for: {email}")
-            processed_count = 0
-
-            # 2. Process each invitation
-            for invitation in pending_invitations:
-                try:
-                    logger.debug(f"Processing invitation to alliance_id: {invitation.alliance_id}")
-
-                    # Check if already a collaborator (prevent duplicates)
-                    is_existing = await self._collaborator_repo.is_collaborator(
-                        invitation.alliance_id, user_id
-                    )
-
-                    if is_existing:
-                        logger.warning("User already a collaborator, marking invitation as accepted")
-                        await self._invitation_repo.mark_as_accepted(invitation.id)
-                        processed_count += 1
-                        continue
-
-                    # Add user as collaborator
-                    logger.debug(f"Adding user as collaborator with role: {invitation.role}")
-                    await self._collaborator_repo.add_collaborator(
-                        alliance_id=invitation.alliance_id,
-                        user_id=user_id,
-                        role=invitation.role,
-                        invited_by=invitation.invited_by,
-                    )
 
-                    # Mark invitation as accepted
-                    await self._invitation_repo.mark_as_accepted(invitation.id)
-                    processed_count += 1
-                    logger.debug("Successfully processed invitation")
+            # 2. Find alliances the user already belongs to (prevent duplicates)
+            alliance_ids = list(dict.fromkeys(inv.alliance_id for inv in pending_invitations))
+            existing_alliance_ids = await self._collaborator_repo.get_member_alliance_ids(
+                user_id, alliance_ids
+            )
 
-                except Exception as e:
-                    logger.error(f"Failed to process invitation: {e}")
-                    # Continue processing other invitations even if one fails
+            # 3. Add user to all remaining alliances in one insert
+            #    (first invitation per alliance wins if duplicates exist)
+            new_memberships: dict[UUID, tuple[UUID, str, UUID | None]] = {}
+            for invitation in pending_invitations:
+                if invitation.alliance_id in existing_alliance_ids:
                     continue
+                new_memberships.setdefault(
+                    invitation.alliance_id,
+                    (invitation.alliance_id, invitation.role, invitation.invited_by),
+                )
+            await self._collaborator_repo.add_collaborators(
+                user_id, list(new_memberships.values())
+            )
+
+            # 4. Mark every invitation as accepted in one update
+            processed_count = await self._invitation_repo.mark_many_as_accepted(
+                [invitation.id for invitation in pending_invitations]
+            )
 
             logger.info(f"Processed {processed_count}/{len(pending_invitations)} invitations")
             return processed_count
@@ -405,59 +431,75 @@ class AllianceCollaboratorService:
                 alliance_id
             )
 
-            # Enrich with user metadata from Supabase Auth
-            enriched_collaborators = []
-            for collab in collaborators:
-                user_id = collab.get("user_id")
-                if not user_id:
-                    enriched_collaborators.append(collab)
-                    continue
-
-                try:
-                    user_response = self._supabase.auth.admin.get_user_by_id(str(user_id))
-
-                    # Handle different response formats from Supabase Auth
-                    user = None
-                    if hasattr(user_response, 'user'):
-                        user = user_response.user
-                    elif isinstance(user_response, dict) and 'user' in user_response:
-                        user = user_response['user']
-                    else:
-                        user = user_response
+            # Enrich with user metadata from Supabase Auth (lookups run concurrently)
+            return list(
+                await asyncio.gather(
+                    *(self._enrich_collaborator(collab) for collab in collaborators)
+                )
+            )
 
-                    if user:
-                        # Extract email
-                        email = getattr(user, 'email', None) if hasattr(user, 'email') else user.get('email')
-                        if email:
-                            collab["user_email"] = email
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to get alliance collaborators",
+            ) from e
 
-                        # Extract user metadata (full_name, avatar_url)
-                        user_metadata = None
-                        if hasattr(user, 'user_metadata'):
-                            user_metadata = user.user_metadata
-                        elif isinstance(user, dict) and 'user_metadata' in user:
-                            user_metadata = user['user_metadata']
+    async def _enrich_collaborator(self, collab: dict) -> dict:
+        """
+        Add email, full name and avatar from Supabase Auth to a collaborator row.
 
-                        if user_metadata and isinstance(user_metadata, dict):
-                            full_name = user_metadata.get("full_name") or user_metadata.get("name")
-                            avatar_url = user_metadata.get("avatar_url") or user_metadata.get("picture")
+        Found emails also seed the get_user_email() cache.
 
-                            if full_name:
-                                collab["user_full_name"] = full_name
-                            if avatar_url:
-                                collab["user_avatar_url"] = avatar_url
+        Args:
+            collab: Collaborator row from the repository
 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch user metadata for {user_id}: {e}")
+        Returns:
+            dict: The same row with user_email/user_full_name/user_avatar_url when available
+        """
+        user_id = collab.get("user_id")
+        if not user_id:
+            return collab
 
-                enriched_collaborators.append(collab)
+        try:
+            user_response = await asyncio.to_thread(
+                self._supabase.auth.admin.get_user_by_id, str(user_id)
+            )
 
-            return enriched_collaborators
+            # Handle different response formats from Supabase Auth
+            user = None
+            if hasattr(user_response, 'user'):
+                user = user_response.user
+            elif isinstance(user_response, dict) and 'user' in user_response:
+                user = user_response['user']
+            else:
+                user = user_response
+
+            if user:
+                # Extract email
+                email = getattr(user, 'email', None) if hasattr(user, 'email') else user.get('email')
+                if email:
+                    collab["user_email"] = email
+                    self._remember_email(UUID(str(user_id)), email)
+
+                # Extract user metadata (full_name, avatar_url)
+                user_metadata = None
+                if hasattr(user, 'user_metadata'):
+                    user_metadata = user.user_metadata
+                elif isinstance(user, dict) and 'user_metadata' in user:
+                    user_metadata = user['user_metadata']
+
+                if user_metadata and isinstance(user_metadata, dict):
+                    full_name = user_metadata.get("full_name") or user_metadata.get("name")
+                    avatar_url = user_metadata.get("avatar_url") or user_metadata.get("picture")
+
+                    if full_name:
+                        collab["user_full_name"] = full_name
+                    if avatar_url:
+                        collab["user_avatar_url"] = avatar_url
 
-        except HTTPException:
-            raise
         except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to get alliance collaborators",
-            ) from e
+            logger.warning(f"Failed to fetch user metadata for {user_id}: {e}")
+
+        return collab
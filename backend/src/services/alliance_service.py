@@ -7,6 +7,7 @@ Alliance Service Layer
 - No direct database calls
 """
 
+import time
 from uuid import UUID
 
 from src.models.alliance import Alliance, AllianceCreate, AllianceUpdate
@@ -14,8 +15,59 @@ from src.repositories.alliance_collaborator_repository import (
     AllianceCollaboratorRepository,
 )
 from src.repositories.alliance_repository import AllianceRepository
+from src.services.battle_event_service import invalidate_cached_events
+from src.services.line_binding_service import invalidate_cached_group_bindings
 from src.services.permission_service import PermissionService
 
+# Every Web App request resolves the caller's alliance; memoize found alliances
+# briefly. Module-level so membership/subscription changes elsewhere can drop it.
+USER_ALLIANCE_CACHE_TTL_SECONDS = 10
+USER_ALLIANCE_CACHE_MAX_ENTRIES = 10_000
+_user_alliance_cache: dict[UUID, tuple[Alliance, float]] = {}
+# alliance_id -> cached user_ids, so invalidation touches only that alliance's members
+_alliance_user_ids: dict[UUID, set[UUID]] = {}
+
+
+def invalidate_user_alliance(alliance_id: UUID, user_id: UUID | None = None) -> None:
+    """
+    Drop cached alliances after a membership or alliance change
+
+    Args:
+        alliance_id: Alliance UUID
+        user_id: User whose membership changed, or None for every member of the alliance
+    """
+    user_ids = _alliance_user_ids.get(alliance_id, set())
+    for key in list(user_ids) if user_id is None else [user_id]:
+        _forget_user_alliance(key)
+
+
+def _forget_user_alliance(user_id: UUID) -> None:
+    """Remove one user's cached alliance and its index entry"""
+    cached = _user_alliance_cache.pop(user_id, None)
+    if cached is None:
+        return
+    alliance_id = cached[0].id
+    user_ids = _alliance_user_ids.get(alliance_id)
+    if user_ids is not None:
+        user_ids.discard(user_id)
+        if not user_ids:
+            del _alliance_user_ids[alliance_id]
+
+
+def _remember_user_alliance(user_id: UUID, alliance: Alliance) -> None:
+    """Cache a user's alliance, pruning expired entries when full"""
+    now = time.time()
+    _forget_user_alliance(user_id)
+    if len(_user_alliance_cache) >= USER_ALLIANCE_CACHE_MAX_ENTRIES:
+        for key in [
+            k
+            for k, (_, cached_at) in _user_alliance_cache.items()
+            if now - cached_at >= USER_ALLIANCE_CACHE_TTL_SECONDS
+        ]:
+            _forget_user_alliance(key)
+    _user_alliance_cache[user_id] = (alliance, now)
+    _alliance_user_ids.setdefault(alliance.id, set()).add(user_id)
+
 
 class AllianceService:
     """
@@ -41,9 +93,18 @@ class AllianceService:
             Alliance instance or None if not found
 
         Note:
-            Changed from get_by_user_id() to get_by_collaborator()
+            Found alliances are cached for USER_ALLIANCE_CACHE_TTL_SECONDS. "No alliance"
+            is never cached so a newly created/joined alliance shows up immediately;
+            removals and updates call invalidate_user_alliance().
         """
-        return await self._repo.get_by_collaborator(user_id)
+        cached = _user_alliance_cache.get(user_id)
+        if cached and time.time() - cached[1] < USER_ALLIANCE_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        alliance = await self._repo.get_by_collaborator(user_id)
+        if alliance:
+            _remember_user_alliance(user_id, alliance)
+        return alliance
 
     async def create_alliance(self, user_id: UUID, alliance_data: AllianceCreate) -> Alliance:
         """
@@ -119,7 +180,9 @@ class AllianceService:
         # Update only provided fields
         update_data = alliance_data.model_dump(exclude_unset=True)
 
-        return await self._repo.update(alliance.id, update_data)
+        updated = await self._repo.update(alliance.id, update_data)
+        invalidate_user_alliance(alliance.id)
+        return updated
 
     async def delete_alliance(self, user_id: UUID) -> bool:
         """
@@ -153,4 +216,14 @@ class AllianceService:
         )
 
         # Delete alliance (collaborators will be deleted via CASCADE)
-        return await self._repo.delete(alliance.id)
+        deleted = await self._repo.delete(alliance.id)
+        self._permission_service.invalidate_user_role(alliance.id)
+        invalidate_user_alliance(alliance.id)
+        # Seasons, battle events and the LINE group binding go with it via CASCADE
+        # (local import: season_service → subscription_service imports this module)
+        from src.services.season_service import invalidate_cached_seasons
+
+        invalidate_cached_seasons(alliance.id)
+        invalidate_cached_events(alliance_id=alliance.id)
+        invalidate_cached_group_bindings(alliance.id)
+        return deleted
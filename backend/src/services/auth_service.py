@@ -6,6 +6,7 @@ Provides high-performance JWT validation with caching and proper error handling.
 
 import time
 from functools import lru_cache
+from uuid import UUID
 
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
@@ -89,11 +90,16 @@ class AuthService:
             TokenInvalidError: If token is invalid
             TokenExpiredError: If token is expired
         """
-        # Check cache first
-        cache_key = token[:50]  # Use first 50 chars as cache key
+        # Check cache first - keyed by the full token, since a prefix is
+        # shared by every token with the same header
+        cache_key = token
         if cache_key in self._token_cache:
             cached_claims, cached_at = self._token_cache[cache_key]
             if time.time() - cached_at < self._cache_ttl:
+                # Expiration is never trusted from the cache
+                if cached_claims.is_expired:
+                    del self._token_cache[cache_key]
+                    raise TokenExpiredError("Token has expired")
                 return cached_claims
             else:
                 # Remove expired cache entry
@@ -175,6 +181,39 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             ) from e
 
+    def authenticate_user_id_only(self, authorization: str | None) -> UUID:
+        """
+        Authenticate user and return only the user ID.
+
+        Skips building the AuthenticatedUser model for callers that only
+        need the subject claim.
+
+        Args:
+            authorization: Authorization header value
+
+        Returns:
+            User ID from the token subject claim
+
+        Raises:
+            HTTPException: If authentication fails
+        """
+        try:
+            token = self._extract_token(authorization)
+            return self._validate_jwt_token(token).sub
+
+        except TokenExpiredError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token expired",
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from e
+        except TokenInvalidError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            ) from e
+
     def authenticate_user_session(self, authorization: str | None) -> UserSession:
         """
         Authenticate user and return full session information.
@@ -14,6 +14,8 @@ Battle Event Service
 - NO direct database calls (delegates to repositories)
 """
 
+import asyncio
+import time
 from uuid import UUID
 
 from src.models.battle_event import (
@@ -36,6 +38,76 @@ from src.repositories.csv_upload_repository import CsvUploadRepository
 from src.repositories.member_snapshot_repository import MemberSnapshotRepository
 from src.services.permission_service import PermissionService
 
+# Completed event analytics only change when the event is reprocessed or deleted
+EVENT_ANALYTICS_CACHE_TTL_SECONDS = 300
+# Entries hold every member row of an event, so keep only the recently viewed few
+EVENT_ANALYTICS_CACHE_MAX_ENTRIES = 100
+# An event never moves between alliances, but it can be removed by a season or
+# alliance cascade; the TTL bounds how long a missed invalidation can last
+EVENT_ALLIANCE_CACHE_TTL_SECONDS = 300
+EVENT_ALLIANCE_CACHE_MAX_ENTRIES = 10_000
+
+EventAnalyticsData = tuple[BattleEvent, EventSummary, list[BattleEventMetricsWithMember]]
+
+# Module-level so SeasonService/AllianceService cascades can drop entries.
+# event_id -> (alliance_id, season_id, cached_at)
+_event_alliance_cache: dict[UUID, tuple[UUID, UUID, float]] = {}
+_analytics_cache: dict[UUID, tuple[EventAnalyticsData, float]] = {}
+
+
+def invalidate_cached_events(
+    alliance_id: UUID | None = None, season_id: UUID | None = None
+) -> None:
+    """
+    Drop cached event data after a season or alliance is deleted
+
+    Events are removed by CASCADE in those cases, bypassing delete_event().
+
+    Args:
+        alliance_id: Deleted alliance UUID
+        season_id: Deleted season UUID
+    """
+    for event_id, (event_alliance_id, event_season_id, _) in list(
+        _event_alliance_cache.items()
+    ):
+        if event_alliance_id == alliance_id or event_season_id == season_id:
+            del _event_alliance_cache[event_id]
+
+    for event_id, ((event, _, _), _) in list(_analytics_cache.items()):
+        if event.alliance_id == alliance_id or event.season_id == season_id:
+            del _analytics_cache[event_id]
+
+
+def _remember_event_alliance(event: BattleEvent) -> None:
+    """Cache the alliance/season an event belongs to, pruning expired entries when full"""
+    now = time.time()
+    if len(_event_alliance_cache) >= EVENT_ALLIANCE_CACHE_MAX_ENTRIES:
+        for event_id in [
+            k
+            for k, (_, _, cached_at) in _event_alliance_cache.items()
+            if now - cached_at >= EVENT_ALLIANCE_CACHE_TTL_SECONDS
+        ]:
+            del _event_alliance_cache[event_id]
+    _event_alliance_cache[event.id] = (event.alliance_id, event.season_id, now)
+
+
+def _remember_analytics(data: EventAnalyticsData) -> None:
+    """Cache a completed event's analytics, pruning expired then oldest entries when full"""
+    event_id = data[0].id
+    now = time.time()
+    _analytics_cache.pop(event_id, None)
+    if len(_analytics_cache) >= EVENT_ANALYTICS_CACHE_MAX_ENTRIES:
+        for key in [
+            k
+            for k, (_, cached_at) in _analytics_cache.items()
+            if now - cached_at >= EVENT_ANALYTICS_CACHE_TTL_SECONDS
+        ]:
+            del _analytics_cache[key]
+    while len(_analytics_cache) >= EVENT_ANALYTICS_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so the first key is the oldest entry
+        del _analytics_cache[next(iter(_analytics_cache))]
+    _analytics_cache[event_id] = (data, now)
+
 
 class BattleEventService:
     """Service for battle event management and analytics"""
@@ -61,20 +133,59 @@ class BattleEventService:
         Returns:
             UUID: The alliance_id if access is granted
 
+        Raises:
+            ValueError: If event not found
+            PermissionError: If user is not a member of the alliance
+
+        Note:
+            The event → alliance mapping is cached for EVENT_ALLIANCE_CACHE_TTL_SECONDS,
+            so with PermissionService's role cache repeat checks need no queries.
+        """
+        cached = _event_alliance_cache.get(event_id)
+        if cached and time.time() - cached[2] < EVENT_ALLIANCE_CACHE_TTL_SECONDS:
+            alliance_id = cached[0]
+        else:
+            alliance_id = (await self._load_event(event_id)).alliance_id
+
+        await self._require_membership(user_id, alliance_id)
+        return alliance_id
+
+    async def get_event_for_user(self, user_id: UUID, event_id: UUID) -> BattleEvent:
+        """
+        Get a battle event after verifying the user's access to it.
+
+        Unlike verify_user_access followed by get_event, the event row is read
+        once and used for both the access check and the result.
+
+        Args:
+            user_id: User UUID
+            event_id: Event UUID
+
+        Returns:
+            Battle event
+
         Raises:
             ValueError: If event not found
             PermissionError: If user is not a member of the alliance
         """
+        event = await self._load_event(event_id)
+        await self._require_membership(user_id, event.alliance_id)
+        return event
+
+    async def _load_event(self, event_id: UUID) -> BattleEvent:
+        """Fetch an event, remember its alliance, and raise if missing"""
         event = await self._event_repo.get_by_id(event_id)
         if not event:
             raise ValueError("Event not found")
+        _remember_event_alliance(event)
+        return event
 
-        role = await self._permission_service.get_user_role(user_id, event.alliance_id)
+    async def _require_membership(self, user_id: UUID, alliance_id: UUID) -> None:
+        """Raise PermissionError unless the user belongs to the alliance"""
+        role = await self._permission_service.get_user_role(user_id, alliance_id)
         if role is None:
             raise PermissionError("You are not a member of this alliance")
 
-        return event.alliance_id
-
     async def create_event(self, event_data: BattleEventCreate) -> BattleEvent:
         """
         Create a new battle event.
@@ -184,6 +295,8 @@ class BattleEventService:
         if not event:
             raise ValueError(f"Event {event_id} not found")
 
+        _analytics_cache.pop(event_id, None)
+
         # Verify subscription: trial or paid subscription required
         await self._permission_service.require_active_subscription(
             event.alliance_id, "process battle event snapshots"
@@ -303,7 +416,9 @@ class BattleEventService:
             await self._metrics_repo.create_batch(metrics_list)
 
         # 7. Update event status to completed
-        return await self._event_repo.update_status(event_id, EventStatus.COMPLETED)
+        completed = await self._event_repo.update_status(event_id, EventStatus.COMPLETED)
+        _analytics_cache.pop(event_id, None)
+        return completed
 
     async def get_event_metrics(
         self, event_id: UUID
@@ -319,6 +434,88 @@ class BattleEventService:
         """
         return await self._metrics_repo.get_by_event_with_member_and_group(event_id)
 
+    async def get_event_analytics_data(
+        self, event_id: UUID
+    ) -> tuple[BattleEvent | None, EventSummary, list[BattleEventMetricsWithMember]]:
+        """
+        Get event, summary and metrics for the analytics view.
+
+        The three reads run concurrently. Results for completed events are
+        cached for EVENT_ANALYTICS_CACHE_TTL_SECONDS and invalidated when the
+        event is reprocessed or deleted, or its season/alliance is deleted.
+
+        Args:
+            event_id: Event UUID
+
+        Returns:
+            Tuple of (event or None if not found, summary, metrics)
+        """
+        cached = _analytics_cache.get(event_id)
+        if cached and time.time() - cached[1] < EVENT_ANALYTICS_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        event, summary, metrics = await asyncio.gather(
+            self.get_event(event_id),
+            self.get_event_summary(event_id),
+            self.get_event_metrics(event_id),
+        )
+        if event and event.status == EventStatus.COMPLETED:
+            _remember_analytics((event, summary, metrics))
+        return event, summary, metrics
+
+    async def get_events_analytics_data_for_user(
+        self, user_id: UUID, event_ids: list[UUID]
+    ) -> list[EventAnalyticsData]:
+        """
+        Get analytics data for several events with batched reads.
+
+        Events and metrics are each loaded with one query for all requested
+        events (cached completed events are skipped); summaries are derived
+        from the metrics in memory. Membership is checked once per alliance.
+
+        Args:
+            user_id: User UUID
+            event_ids: Event UUIDs (duplicates are collapsed)
+
+        Returns:
+            List of (event, summary, metrics) in the order of first request
+
+        Raises:
+            ValueError: If any event is not found
+            PermissionError: If user is not a member of every event's alliance
+        """
+        unique_ids = list(dict.fromkeys(event_ids))
+        now = time.time()
+
+        data_by_id: dict[UUID, EventAnalyticsData] = {}
+        for event_id in unique_ids:
+            cached = _analytics_cache.get(event_id)
+            if cached and now - cached[1] < EVENT_ANALYTICS_CACHE_TTL_SECONDS:
+                data_by_id[event_id] = cached[0]
+
+        missing_ids = [event_id for event_id in unique_ids if event_id not in data_by_id]
+        events, metrics_by_event = await asyncio.gather(
+            self._event_repo.get_by_ids(missing_ids),
+            self._metrics_repo.get_by_events_with_member_and_group(missing_ids),
+        )
+        if len(events) != len(missing_ids):
+            raise ValueError("Event not found")
+
+        for event in events:
+            _remember_event_alliance(event)
+            metrics = metrics_by_event[event.id]
+            data = (event, self._summarize_metrics(metrics), metrics)
+            data_by_id[event.id] = data
+            if event.status == EventStatus.COMPLETED:
+                _remember_analytics(data)
+
+        alliance_ids = {data[0].alliance_id for data in data_by_id.values()}
+        await asyncio.gather(
+            *(self._require_membership(user_id, alliance_id) for alliance_id in alliance_ids)
+        )
+
+        return [data_by_id[event_id] for event_id in unique_ids]
+
     async def get_event_summary(self, event_id: UUID) -> EventSummary:
         """
         Get summary statistics for an event.
@@ -342,7 +539,19 @@ class BattleEventService:
             EventSummary with all stats
         """
         metrics = await self._metrics_repo.get_by_event_with_member(event_id)
+        return self._summarize_metrics(metrics)
+
+    @staticmethod
+    def _summarize_metrics(metrics: list[BattleEventMetricsWithMember]) -> EventSummary:
+        """
+        Aggregate member metrics into event summary statistics.
 
+        Args:
+            metrics: All member metrics of one event
+
+        Returns:
+            EventSummary with all stats
+        """
         if not metrics:
             return EventSummary(
                 total_members=0,
@@ -429,6 +638,8 @@ class BattleEventService:
         )
 
         # Metrics are deleted via CASCADE
+        _event_alliance_cache.pop(event_id, None)
+        _analytics_cache.pop(event_id, None)
         return await self._event_repo.delete(event_id)
 
     async def get_latest_completed_event_for_alliance(
@@ -463,19 +674,15 @@ class BattleEventService:
         Returns:
             EventGroupAnalytics with group stats and top members,
             or None if event not found
-        """
-        event = await self._event_repo.get_by_id(event_id)
-        if not event:
-            return None
 
-        # Get all metrics with group info
-        metrics = await self._metrics_repo.get_by_event_with_member_and_group(event_id)
-        if not metrics:
+        Note:
+            Event, summary and metrics come from get_event_analytics_data, so they
+            are read concurrently and completed events are served from its cache.
+        """
+        event, summary, metrics = await self.get_event_analytics_data(event_id)
+        if not event or not metrics:
             return None
 
-        # Get overall summary
-        summary = await self._calculate_event_summary(event_id)
-
         # Group metrics by group_name
         groups: dict[str, list[BattleEventMetricsWithMember]] = {}
         for m in metrics:
@@ -18,7 +18,8 @@ class CSVParserService:
 
     # Filename pattern: 同盟統計2025年10月09日10时13分09秒.csv
     FILENAME_PATTERN = re.compile(
-        r"同盟統計(\d{4})年(\d{2})月(\d{2})日(\d{2})时(\d{2})分(\d{2})秒\.csv"
+        r"同盟統計(\d{4})年(\d{2})月(\d{2})日(\d{2})时(\d{2})分(\d{2})秒\.csv",
+        re.IGNORECASE,
     )
 
     # Field name mapping: internal_name -> list of possible CSV column names
@@ -124,23 +125,23 @@ class CSVParserService:
         if csv_content.startswith('\ufeff'):
             csv_content = csv_content[1:]
 
-        # Read CSV and strip whitespace from field names
-        lines = csv_content.splitlines()
-        if not lines:
+        # Parse straight from the decoded text; no intermediate line list or
+        # rebuilt CSV string, so only one extra buffer is held per upload
+        reader = csv.reader(StringIO(csv_content))
+        header = next(reader, None)
+        if not header:
             raise ValueError("CSV file is empty")
 
         # Strip whitespace from header
-        header = [field.strip() for field in lines[0].split(',')]
-
-        # Create new CSV content with cleaned header
-        cleaned_csv = ','.join(header) + '\n' + '\n'.join(lines[1:])
-
-        reader = csv.DictReader(StringIO(cleaned_csv))
+        field_names = [field.strip() for field in header]
 
         members = []
-        for row in reader:
+        for values in reader:
+            if not values:
+                continue  # Skip blank lines
+
             # Strip whitespace from all values
-            row = {k.strip(): v.strip() for k, v in row.items()}
+            row = {k: v.strip() for k, v in zip(field_names, values, strict=False)}
 
             # Get group name and handle "未分組" as None
             group_value = cls._get_field_value(row, "group_name", required=False)
@@ -7,6 +7,7 @@ CSV Upload Service
 - Implements complete CSV upload workflow
 """
 
+import asyncio
 from datetime import datetime
 from uuid import UUID
 
@@ -22,6 +23,7 @@ from src.repositories.member_repository import MemberRepository
 from src.repositories.member_snapshot_repository import MemberSnapshotRepository
 from src.repositories.season_repository import SeasonRepository
 from src.services.csv_parser_service import CSVParserService
+from src.services.hegemony_weight_service import invalidate_cached_hegemony
 from src.services.period_metrics_service import PeriodMetricsService
 from src.services.permission_service import PermissionService
 
@@ -113,9 +115,9 @@ class CSVUploadService:
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e)) from e
 
-        # Step 3: Parse CSV content
+        # Step 3: Parse CSV content (CPU-bound; keep it off the event loop)
         try:
-            members_data = self._parser.parse_csv_content(csv_content)
+            members_data = await asyncio.to_thread(self._parser.parse_csv_content, csv_content)
         except Exception as e:
             raise HTTPException(
                 status_code=400, detail=f"Failed to parse CSV content: {str(e)}"
@@ -191,6 +193,9 @@ class CSVUploadService:
 
         snapshots = await self._snapshot_repo.create_batch(snapshots_data)
 
+        # Hegemony weights cascade with a replaced upload; scores read the snapshots
+        invalidate_cached_hegemony(season_id)
+
         # Step 8: For 'regular' uploads only - calculate period metrics
         total_periods = 0
         if upload_type == "regular":
@@ -289,5 +294,7 @@ class CSVUploadService:
             user_id, season.alliance_id, "delete CSV uploads"
         )
 
-        # Delete upload (CASCADE will delete snapshots)
-        return await self._csv_upload_repo.delete(upload_id)
+        # Delete upload (CASCADE will delete snapshots and hegemony weights)
+        deleted = await self._csv_upload_repo.delete(upload_id)
+        invalidate_cached_hegemony(upload.season_id)
+        return deleted
@@ -14,6 +14,8 @@ Donation Service
 - Public methods for permission checking (no private member access from API layer)
 """
 
+import asyncio
+import time
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -31,6 +33,9 @@ from src.repositories.donation_target_repository import DonationTargetRepository
 from src.repositories.member_snapshot_repository import MemberSnapshotRepository
 from src.services.permission_service import PermissionService
 
+# Donation lists only change on create/delete; serve repeat reads from memory
+DONATION_LIST_CACHE_TTL_SECONDS = 60
+
 
 class DonationService:
     """Service for donation event management"""
@@ -41,6 +46,7 @@ class DonationService:
         self._target_repo = DonationTargetRepository()
         self._snapshot_repo = MemberSnapshotRepository()
         self._permission_service = PermissionService()
+        self._list_cache: dict[tuple[UUID, UUID], tuple[list[Donation], float]] = {}
 
     async def require_alliance_access(self, user_id: UUID, alliance_id: UUID) -> None:
         """
@@ -76,12 +82,15 @@ class DonationService:
             PermissionError: If user lacks access
             SubscriptionExpiredError: If trial/subscription has expired
         """
+        donation = await self._get_donation_or_404(donation_id)
+        await self.require_alliance_access(user_id, donation.alliance_id)
+        return donation
+
+    async def _get_donation_or_404(self, donation_id: UUID) -> Donation:
+        """Fetch a donation event or raise 404"""
         donation = await self._donation_repo.get_by_id(donation_id)
         if not donation:
             raise HTTPException(status_code=404, detail="Donation event not found")
-        await self._permission_service.require_write_permission(
-            user_id, donation.alliance_id, "manage donation events"
-        )
         return donation
 
     async def get_donations_by_alliance_and_season(
@@ -90,6 +99,9 @@ class DonationService:
         """
         Get all donation events for an alliance in a season
 
+        Results are cached per (alliance, season) for DONATION_LIST_CACHE_TTL_SECONDS
+        and invalidated when a donation in that season is created or deleted.
+
         Args:
             alliance_id: Alliance UUID
             season_id: Season UUID
@@ -97,9 +109,43 @@ class DonationService:
         Returns:
             List of donation events
         """
-        return await self._donation_repo.get_by_alliance_and_season(
+        key = (alliance_id, season_id)
+        cached = self._list_cache.get(key)
+        if cached and time.time() - cached[1] < DONATION_LIST_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        donations = await self._donation_repo.get_by_alliance_and_season(
             alliance_id, season_id
         )
+        self._list_cache[key] = (donations, time.time())
+        return donations
+
+    async def get_donations_for_user(
+        self, user_id: UUID, alliance_id: UUID, season_id: UUID
+    ) -> list[Donation]:
+        """
+        Get donation events for an alliance season after verifying access.
+
+        The access check and the list query are independent, so they run
+        concurrently; the list is only returned if the check passes.
+
+        Args:
+            user_id: User UUID
+            alliance_id: Alliance UUID
+            season_id: Season UUID
+
+        Returns:
+            List of donation events
+
+        Raises:
+            PermissionError: If user lacks access
+            SubscriptionExpiredError: If trial/subscription has expired
+        """
+        _, donations = await asyncio.gather(
+            self.require_alliance_access(user_id, alliance_id),
+            self.get_donations_by_alliance_and_season(alliance_id, season_id),
+        )
+        return donations
 
     async def create_donation(self, donation_data: DonationCreate) -> Donation:
         """
@@ -111,7 +157,9 @@ class DonationService:
         Returns:
             Created donation event
         """
-        return await self._donation_repo.create(donation_data)
+        donation = await self._donation_repo.create(donation_data)
+        self._list_cache.pop((donation_data.alliance_id, donation_data.season_id), None)
+        return donation
 
     async def get_donation_with_info(
         self, donation_id: UUID, target_amount: int | None = None
@@ -130,10 +178,42 @@ class DonationService:
         Returns:
             Donation with member donation details
         """
-        donation = await self._donation_repo.get_by_id(donation_id)
-        if not donation:
-            raise HTTPException(status_code=404, detail="Donation event not found")
+        donation = await self._get_donation_or_404(donation_id)
+        return await self._build_donation_with_info(donation, target_amount)
+
+    async def get_donation_with_info_for_user(
+        self, user_id: UUID, donation_id: UUID, target_amount: int | None = None
+    ) -> DonationWithInfo:
+        """
+        Get donation event with member donation info after verifying access.
+
+        The donation is fetched once; the access check and the snapshot
+        queries then run concurrently.
+
+        Args:
+            user_id: User UUID
+            donation_id: Donation UUID
+            target_amount: Optional override for REGULAR type only; ignored for PENALTY
+
+        Returns:
+            Donation with member donation details
 
+        Raises:
+            HTTPException: If donation not found
+            PermissionError: If user lacks access
+            SubscriptionExpiredError: If trial/subscription has expired
+        """
+        donation = await self._get_donation_or_404(donation_id)
+        _, donation_with_info = await asyncio.gather(
+            self.require_alliance_access(user_id, donation.alliance_id),
+            self._build_donation_with_info(donation, target_amount),
+        )
+        return donation_with_info
+
+    async def _build_donation_with_info(
+        self, donation: Donation, target_amount: int | None
+    ) -> DonationWithInfo:
+        """Calculate per-member donation info for an already fetched donation"""
         is_regular = donation.type == DonationType.REGULAR
         is_penalty = donation.type == DonationType.PENALTY
         effective_target = (
@@ -145,22 +225,21 @@ class DonationService:
         # Check if this is a retrospective donation (created after deadline)
         is_retrospective = donation.created_at > donation.deadline
 
-        # Get snapshots closest to creation_time and deadline
+        # Get snapshots closest to creation_time and deadline in one batch
         if is_retrospective:
             start_snapshots = []
+            end_snapshots = await self._snapshot_repo.get_closest_to_date(
+                alliance_id=donation.alliance_id,
+                season_id=donation.season_id,
+                target_date=donation.deadline,
+            )
         else:
-            start_snapshots = await self._snapshot_repo.get_closest_to_date(
+            start_snapshots, end_snapshots = await self._snapshot_repo.get_closest_to_dates(
                 alliance_id=donation.alliance_id,
                 season_id=donation.season_id,
-                target_date=donation.created_at,
+                target_dates=[donation.created_at, donation.deadline],
             )
 
-        end_snapshots = await self._snapshot_repo.get_closest_to_date(
-            alliance_id=donation.alliance_id,
-            season_id=donation.season_id,
-            target_date=donation.deadline,
-        )
-
         if not end_snapshots:
             return DonationWithInfo(**donation.model_dump(), member_info=[])
 
@@ -172,7 +251,7 @@ class DonationService:
         member_info_list: list[DonationMemberInfo] = []
 
         if is_penalty:
-            overrides = await self._target_repo.get_by_donation_event(donation_id)
+            overrides = await self._target_repo.get_by_donation_event(donation.id)
             member_source = {
                 ov.member_id: end_snapshot_map.get(ov.member_id)
                 for ov in overrides
@@ -226,10 +305,25 @@ class DonationService:
             donation_id, donation.alliance_id, member_id, target_amount
         )
 
+    async def set_member_target_overrides(
+        self,
+        donation_id: UUID,
+        targets: list[tuple[UUID, int]],
+        user_id: UUID,
+    ) -> list[DonationTarget]:
+        """Set or update many per-member target overrides in one upsert"""
+        donation = await self.verify_donation_access(user_id, donation_id)
+        # Last entry wins when a member appears twice (one row per conflict key)
+        deduped = list(dict(targets).items())
+        return await self._target_repo.upsert_targets(
+            donation_id, donation.alliance_id, deduped
+        )
+
     async def delete_donation(self, donation_id: UUID, user_id: UUID) -> None:
         """Delete a donation event after access check"""
-        await self.verify_donation_access(user_id, donation_id)
+        donation = await self.verify_donation_access(user_id, donation_id)
         await self._donation_repo.delete(donation_id)
+        self._list_cache.pop((donation.alliance_id, donation.season_id), None)
 
     async def delete_member_target_override(
         self, donation_id: UUID, member_id: UUID, user_id: UUID
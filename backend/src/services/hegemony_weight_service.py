@@ -7,6 +7,7 @@ Follows CLAUDE.md 🔴: Service layer orchestrates repositories, no direct datab
 
 import asyncio
 import logging
+import time
 from decimal import Decimal
 from uuid import UUID
 
@@ -34,6 +35,25 @@ from src.services.permission_service import PermissionService
 
 logger = logging.getLogger(__name__)
 
+# Weights and score previews are read far more often than weights are edited
+HEGEMONY_CACHE_TTL_SECONDS = 30
+
+# Per-season caches: {season_id: (value, cached_at)}. Module-level so CSV upload
+# changes (weights cascade with uploads, scores come from snapshots) can drop them.
+_weights_cache: dict[UUID, tuple[list[HegemonyWeightWithSnapshot], float]] = {}
+_scores_cache: dict[UUID, tuple[list[HegemonyScorePreview], float]] = {}
+
+
+def invalidate_cached_hegemony(season_id: UUID) -> None:
+    """
+    Drop cached weights and scores after a season's weights or snapshots change
+
+    Args:
+        season_id: Season UUID
+    """
+    _weights_cache.pop(season_id, None)
+    _scores_cache.pop(season_id, None)
+
 
 class HegemonyWeightService:
     """Service for hegemony weight configuration and score calculation"""
@@ -48,6 +68,18 @@ class HegemonyWeightService:
         self._collaborator_repo = AllianceCollaboratorRepository()
         self._permission_service = PermissionService()
 
+    async def _get_cached_season_weights(
+        self, season_id: UUID
+    ) -> list[HegemonyWeightWithSnapshot]:
+        """Get weights with snapshot info, cached per season for HEGEMONY_CACHE_TTL_SECONDS"""
+        cached = _weights_cache.get(season_id)
+        if cached and time.time() - cached[1] < HEGEMONY_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        weights = await self._weight_repo.get_with_snapshot_info(season_id)
+        _weights_cache[season_id] = (weights, time.time())
+        return weights
+
     async def _verify_season_access(
         self, user_id: UUID, season_id: UUID, required_roles: list[str]
     ) -> tuple:
@@ -124,7 +156,7 @@ class HegemonyWeightService:
         """
         # All members can view weights
         await self._verify_season_access(user_id, season_id, ['owner', 'collaborator', 'member'])
-        return await self._weight_repo.get_with_snapshot_info(season_id)
+        return await self._get_cached_season_weights(season_id)
 
     async def get_weights_summary(
         self, user_id: UUID, season_id: UUID
@@ -139,8 +171,11 @@ class HegemonyWeightService:
         Returns:
             SnapshotWeightsSummary with validation status
         """
-        weights = await self.get_season_weights(user_id, season_id)
-        season = await self._season_repo.get_by_id(season_id)
+        # The access check already loads the season; reuse it for the name
+        season, _ = await self._verify_season_access(
+            user_id, season_id, ['owner', 'collaborator', 'member']
+        )
+        weights = await self._get_cached_season_weights(season_id)
 
         total_weight_sum = sum(w.snapshot_weight for w in weights)
         is_valid = abs(total_weight_sum - Decimal("1.0")) < Decimal("0.0001")
@@ -211,6 +246,7 @@ class HegemonyWeightService:
                 )
                 created_weights.append(weight)
 
+            invalidate_cached_hegemony(season_id)
             return created_weights
 
         except Exception as e:
@@ -252,7 +288,7 @@ class HegemonyWeightService:
         if not upload or upload.season_id != season_id:
             raise ValueError("Invalid CSV upload ID for this season")
 
-        return await self._weight_repo.create_with_alliance(
+        weight = await self._weight_repo.create_with_alliance(
             alliance_id=alliance.id,
             season_id=season_id,
             csv_upload_id=data.csv_upload_id,
@@ -262,6 +298,8 @@ class HegemonyWeightService:
             weight_donation=data.weight_donation,
             snapshot_weight=data.snapshot_weight,
         )
+        invalidate_cached_hegemony(season_id)
+        return weight
 
     async def _verify_weight_access(
         self, user_id: UUID, weight_id: UUID, action: str
@@ -330,7 +368,7 @@ class HegemonyWeightService:
         Raises:
             HTTPException 403: If user doesn't have permission
         """
-        _, alliance_id = await self._verify_weight_access(
+        weight, alliance_id = await self._verify_weight_access(
             user_id, weight_id, "update hegemony weights"
         )
 
@@ -339,7 +377,7 @@ class HegemonyWeightService:
             alliance_id, "update hegemony weights"
         )
 
-        return await self._weight_repo.update_weights(
+        updated = await self._weight_repo.update_weights(
             weight_id=weight_id,
             weight_contribution=data.weight_contribution,
             weight_merit=data.weight_merit,
@@ -347,6 +385,8 @@ class HegemonyWeightService:
             weight_donation=data.weight_donation,
             snapshot_weight=data.snapshot_weight,
         )
+        invalidate_cached_hegemony(weight.season_id)
+        return updated
 
     async def delete_weight(self, user_id: UUID, weight_id: UUID) -> bool:
         """
@@ -364,7 +404,7 @@ class HegemonyWeightService:
         Raises:
             HTTPException 403: If user doesn't have permission
         """
-        _, alliance_id = await self._verify_weight_access(
+        weight, alliance_id = await self._verify_weight_access(
             user_id, weight_id, "delete hegemony weights"
         )
 
@@ -373,7 +413,9 @@ class HegemonyWeightService:
             alliance_id, "delete hegemony weights"
         )
 
-        return await self._weight_repo.delete(weight_id)
+        deleted = await self._weight_repo.delete(weight_id)
+        invalidate_cached_hegemony(weight.season_id)
+        return deleted
 
     async def calculate_hegemony_scores(
         self, user_id: UUID, season_id: UUID, limit: int = 20
@@ -404,10 +446,15 @@ class HegemonyWeightService:
         Performance: Optimized to avoid N+1 queries by fetching all snapshots at once
         """
         # All members can view scores
-        _, alliance = await self._verify_season_access(user_id, season_id, ['owner', 'collaborator', 'member'])
+        await self._verify_season_access(user_id, season_id, ['owner', 'collaborator', 'member'])
+
+        # The full ranking is cached per season; limit only slices it
+        cached = _scores_cache.get(season_id)
+        if cached and time.time() - cached[1] < HEGEMONY_CACHE_TTL_SECONDS:
+            return cached[0][:limit]
 
         # Get all weight configurations for this season
-        weights = await self._weight_repo.get_with_snapshot_info(season_id)
+        weights = await self._get_cached_season_weights(season_id)
         if not weights:
             raise ValueError("No weight configurations found. Please initialize weights first.")
 
@@ -473,7 +520,7 @@ class HegemonyWeightService:
 
         # Build preview results
         previews = []
-        for rank, member_data in enumerate(member_scores[:limit], start=1):
+        for rank, member_data in enumerate(member_scores, start=1):
             previews.append(
                 HegemonyScorePreview(
                     member_id=member_data["member_id"],
@@ -484,4 +531,5 @@ class HegemonyWeightService:
                 )
             )
 
-        return previews
+        _scores_cache[season_id] = (previews, time.time())
+        return previews[:limit]
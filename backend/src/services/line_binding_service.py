@@ -12,7 +12,9 @@ Business logic for LINE Bot integration:
 - Exception handling with proper chaining
 """
 
+import asyncio
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -37,6 +39,8 @@ from src.models.line_binding import (
     RegisterMemberResponse,
 )
 from src.repositories.line_binding_repository import LineBindingRepository
+from src.repositories.season_repository import SeasonRepository
+from src.services.analytics_service import AnalyticsService
 
 # Constants
 BINDING_CODE_LENGTH = 6
@@ -44,6 +48,47 @@ BINDING_CODE_EXPIRY_MINUTES = 5
 MAX_CODES_PER_HOUR = 3
 # Remove confusing characters: 0, O, I, 1
 BINDING_CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+# In-process caches for hot webhook lookups
+GROUP_BOUND_CACHE_TTL_SECONDS = 300
+LIFF_NOTIFICATION_SKIP_TTL_SECONDS = 60
+LIFF_NOTIFICATION_SKIP_MAX_ENTRIES = 10_000
+CUSTOM_COMMAND_CACHE_TTL_SECONDS = 300
+CUSTOM_COMMAND_CACHE_MAX_PER_ALLIANCE = 256
+
+# Module-level so AllianceService can drop entries when an alliance is deleted.
+# line_group_id -> (bound alliance_id or None, cached_at)
+_group_alliance_cache: dict[str, tuple[UUID | None, float]] = {}
+# (line_group_id, line_user_id) -> cached_at of a "don't notify" result
+_notification_skip_cache: dict[tuple[str, str], float] = {}
+# alliance_id -> trigger_keyword -> (enabled command or None, cached_at)
+_custom_command_cache: dict[
+    UUID, dict[str, tuple[LineCustomCommandResponse | None, float]]
+] = {}
+
+
+def invalidate_cached_group_bindings(alliance_id: UUID) -> None:
+    """
+    Drop cached LINE group data after an alliance is deleted
+
+    The group binding and custom commands are removed by CASCADE in that case,
+    bypassing unbind_group() and the custom command endpoints.
+
+    Args:
+        alliance_id: Deleted alliance UUID
+    """
+    group_ids = {
+        line_group_id
+        for line_group_id, (bound_alliance_id, _) in _group_alliance_cache.items()
+        if bound_alliance_id == alliance_id
+    }
+    for line_group_id in group_ids:
+        del _group_alliance_cache[line_group_id]
+
+    for cache_key in list(_notification_skip_cache):
+        if cache_key[0] in group_ids:
+            del _notification_skip_cache[cache_key]
+
+    _custom_command_cache.pop(alliance_id, None)
 
 
 class LineBindingService:
@@ -51,6 +96,8 @@ class LineBindingService:
 
     def __init__(self, repository: LineBindingRepository | None = None):
         self.repository = repository or LineBindingRepository()
+        self._season_repo = SeasonRepository()
+        self._analytics_service = AnalyticsService()
 
     # =========================================================================
     # Binding Code Operations (Web App)
@@ -75,9 +122,11 @@ class LineBindingService:
             HTTPException 400: If alliance already has active LINE group binding
             HTTPException 429: If rate limit exceeded
         """
-        # Check if alliance already has active binding
-        existing_binding = await self.repository.get_active_group_binding_by_alliance(
-            alliance_id
+        # Existing binding check and rate limit count are independent reads
+        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+        existing_binding, recent_count = await asyncio.gather(
+            self.repository.get_active_group_binding_by_alliance(alliance_id),
+            self.repository.count_recent_codes(alliance_id, one_hour_ago),
         )
         if existing_binding:
             raise HTTPException(
@@ -86,10 +135,6 @@ class LineBindingService:
             )
 
         # Rate limiting: max 3 codes per hour
-        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-        recent_count = await self.repository.count_recent_codes(
-            alliance_id, one_hour_ago
-        )
         if recent_count >= MAX_CODES_PER_HOUR:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -132,17 +177,15 @@ class LineBindingService:
         Returns:
             LineBindingStatusResponse with binding info or pending code
         """
-        # Check for active group binding
-        group_binding = await self.repository.get_active_group_binding_by_alliance(
-            alliance_id
+        # 🟡 Fetch binding, member count and pending code concurrently;
+        # each is a single cheap query and only one branch uses each result
+        group_binding, member_count, pending_code = await asyncio.gather(
+            self.repository.get_active_group_binding_by_alliance(alliance_id),
+            self.repository.count_member_bindings_by_alliance(alliance_id),
+            self.repository.get_pending_code_by_alliance(alliance_id),
         )
 
         if group_binding:
-            # Get member count
-            member_count = await self.repository.count_member_bindings_by_alliance(
-                alliance_id
-            )
-
             return LineBindingStatusResponse(
                 is_bound=True,
                 binding=LineGroupBindingResponse(
@@ -158,9 +201,6 @@ class LineBindingService:
                 pending_code=None
             )
 
-        # Check for pending code
-        pending_code = await self.repository.get_pending_code_by_alliance(alliance_id)
-
         if pending_code:
             return LineBindingStatusResponse(
                 is_bound=False,
@@ -200,6 +240,7 @@ class LineBindingService:
             )
 
         await self.repository.deactivate_group_binding(group_binding.id)
+        _group_alliance_cache.pop(group_binding.line_group_id, None)
 
     async def refresh_group_info(self, alliance_id: UUID) -> LineGroupBindingResponse:
         """
@@ -227,8 +268,11 @@ class LineBindingService:
                 detail="No active LINE group binding found"
             )
 
-        # Fetch group info from LINE API
-        group_info = get_group_info(group_binding.line_group_id)
+        # Fetch group info from LINE API (blocking SDK call) alongside member count
+        group_info, member_count = await asyncio.gather(
+            asyncio.to_thread(get_group_info, group_binding.line_group_id),
+            self.repository.count_member_bindings_by_alliance(alliance_id),
+        )
 
         if not group_info or not group_info.name:
             raise HTTPException(
@@ -243,11 +287,6 @@ class LineBindingService:
             group_picture_url=group_info.picture_url
         )
 
-        # Get member count
-        member_count = await self.repository.count_member_bindings_by_alliance(
-            alliance_id
-        )
-
         return LineGroupBindingResponse(
             id=updated_binding.id,
             alliance_id=updated_binding.alliance_id,
@@ -370,6 +409,7 @@ class LineBindingService:
 
         # Mark code as used
         await self.repository.mark_code_used(binding_code.id)
+        _group_alliance_cache.pop(line_group_id, None)
 
         return True, "綁定成功！", binding_code.alliance_id
 
@@ -618,30 +658,36 @@ class LineBindingService:
             True if notification should be sent
         """
         # Check if group is bound
-        group_binding = await self.repository.get_group_binding_by_line_group_id(
-            line_group_id
-        )
-        if not group_binding:
+        alliance_id = await self.get_bound_alliance_id(line_group_id)
+        if alliance_id is None:
             return False
 
-        # Check if user already registered
-        is_registered = await self.repository.is_user_registered_in_group(
-            line_group_id=line_group_id,
-            line_user_id=line_user_id
-        )
-        if is_registered:
-            return False
+        # 🟡 Recent "don't notify" results are reused for a short TTL so chatty
+        # users don't cost two queries per message
+        cache_key = (line_group_id, line_user_id)
+        cached_at = _notification_skip_cache.get(cache_key)
+        if cached_at is not None:
+            if time.time() - cached_at < LIFF_NOTIFICATION_SKIP_TTL_SECONDS:
+                return False
+            del _notification_skip_cache[cache_key]
 
-        # Check if user has been notified within cooldown period
+        # Registration and cooldown checks are independent; run them in one round
         cooldown_threshold = datetime.now(UTC) - timedelta(
             minutes=self.NOTIFICATION_COOLDOWN_MINUTES
         )
-        has_been_notified = await self.repository.has_user_been_notified_since(
-            line_group_id=line_group_id,
-            line_user_id=line_user_id,
-            since=cooldown_threshold
+        is_registered, has_been_notified = await asyncio.gather(
+            self.repository.is_user_registered_in_alliance(
+                alliance_id=alliance_id,
+                line_user_id=line_user_id
+            ),
+            self.repository.has_user_been_notified_since(
+                line_group_id=line_group_id,
+                line_user_id=line_user_id,
+                since=cooldown_threshold
+            ),
         )
-        if has_been_notified:
+        if is_registered or has_been_notified:
+            self._remember_notification_skip(cache_key)
             return False
 
         return True
@@ -662,6 +708,20 @@ class LineBindingService:
             line_group_id=line_group_id,
             line_user_id=line_user_id
         )
+        self._remember_notification_skip((line_group_id, line_user_id))
+
+    def _remember_notification_skip(self, cache_key: tuple[str, str]) -> None:
+        """Cache a "don't notify" result, pruning expired entries once the cache is full"""
+        now = time.time()
+        if len(_notification_skip_cache) >= LIFF_NOTIFICATION_SKIP_MAX_ENTRIES:
+            expired = [
+                key
+                for key, cached_at in _notification_skip_cache.items()
+                if now - cached_at >= LIFF_NOTIFICATION_SKIP_TTL_SECONDS
+            ]
+            for key in expired:
+                del _notification_skip_cache[key]
+        _notification_skip_cache[cache_key] = now
 
     async def list_custom_commands(self, alliance_id: UUID) -> list[LineCustomCommandResponse]:
         commands = await self.repository.list_custom_commands(alliance_id)
@@ -691,6 +751,7 @@ class LineBindingService:
             is_enabled=data.is_enabled,
             created_by=user_id
         )
+        _custom_command_cache.pop(alliance_id, None)
         return self._to_custom_command_response(command)
 
     async def update_custom_command(
@@ -720,6 +781,7 @@ class LineBindingService:
 
         update_data["updated_at"] = datetime.now(UTC).isoformat()
         updated = await self.repository.update_custom_command(command_id, update_data)
+        _custom_command_cache.pop(alliance_id, None)
         return self._to_custom_command_response(updated)
 
     async def delete_custom_command(self, alliance_id: UUID, command_id: UUID) -> None:
@@ -731,26 +793,41 @@ class LineBindingService:
             )
 
         await self.repository.delete_custom_command(command_id)
+        _custom_command_cache.pop(alliance_id, None)
 
     async def get_custom_command_response(
         self,
         line_group_id: str,
         trigger_keyword: str
     ) -> LineCustomCommandResponse | None:
-        group_binding = await self.repository.get_group_binding_by_line_group_id(
-            line_group_id
-        )
-        if not group_binding:
+        """
+        Get the enabled custom command a group member triggered
+
+        🟡 Commands are edited rarely but triggered often, so lookups (including
+        misses) are cached per alliance and dropped on create/update/delete.
+        """
+        alliance_id = await self.get_bound_alliance_id(line_group_id)
+        if alliance_id is None:
             return None
 
+        alliance_commands = _custom_command_cache.setdefault(alliance_id, {})
+        cached = alliance_commands.get(trigger_keyword)
+        if cached is not None:
+            response, cached_at = cached
+            if time.time() - cached_at < CUSTOM_COMMAND_CACHE_TTL_SECONDS:
+                return response
+
         command = await self.repository.get_custom_command_by_trigger(
-            group_binding.alliance_id,
+            alliance_id,
             trigger_keyword
         )
-        if not command:
-            return None
+        response = self._to_custom_command_response(command) if command else None
 
-        return self._to_custom_command_response(command)
+        # Unknown keywords are user input; reset instead of growing without bound
+        if len(alliance_commands) >= CUSTOM_COMMAND_CACHE_MAX_PER_ALLIANCE:
+            alliance_commands.clear()
+        alliance_commands[trigger_keyword] = (response, time.time())
+        return response
 
     def _to_custom_command_response(
         self,
@@ -776,10 +853,22 @@ class LineBindingService:
         Returns:
             True if group is bound
         """
+        return await self.get_bound_alliance_id(line_group_id) is not None
+
+    async def get_bound_alliance_id(self, line_group_id: str) -> UUID | None:
+        """Get the alliance a group is bound to (cached, including unbound results)"""
+        cached = _group_alliance_cache.get(line_group_id)
+        if cached is not None:
+            alliance_id, cached_at = cached
+            if time.time() - cached_at < GROUP_BOUND_CACHE_TTL_SECONDS:
+                return alliance_id
+
         group_binding = await self.repository.get_group_binding_by_line_group_id(
             line_group_id
         )
-        return group_binding is not None
+        alliance_id = group_binding.alliance_id if group_binding else None
+        _group_alliance_cache[line_group_id] = (alliance_id, time.time())
+        return alliance_id
 
     # =========================================================================
     # Performance Analytics Operations (LIFF)
@@ -805,10 +894,6 @@ class LineBindingService:
         Raises:
             HTTPException 404: If group not bound or game_id not found
         """
-        # Lazy import to avoid circular dependency
-        from src.repositories.season_repository import SeasonRepository
-        from src.services.analytics_service import AnalyticsService
-
         # Find alliance by group ID
         group_binding = await self.repository.get_group_binding_by_line_group_id(
             line_group_id
@@ -844,8 +929,7 @@ class LineBindingService:
             )
 
         # Get active season
-        season_repo = SeasonRepository()
-        active_season = await season_repo.get_active_season(alliance_id)
+        active_season = await self._season_repo.get_active_season(alliance_id)
 
         if not active_season:
             return MemberPerformanceResponse(
@@ -853,11 +937,8 @@ class LineBindingService:
                 game_id=game_id
             )
 
-        # Get analytics data
-        analytics_service = AnalyticsService()
-
         # Get member trend data
-        trend_data = await analytics_service.get_member_trend(
+        trend_data = await self._analytics_service.get_member_trend(
             member_id=member_id,
             season_id=active_season.id
         )
@@ -870,7 +951,7 @@ class LineBindingService:
             )
 
         # Get season summary
-        season_summary = await analytics_service.get_season_summary(
+        season_summary = await self._analytics_service.get_season_summary(
             member_id=member_id,
             season_id=active_season.id
         )
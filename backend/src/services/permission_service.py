@@ -21,7 +21,9 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -34,6 +36,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Roles change rarely; memoize found roles briefly. Module-level so every
+# PermissionService instance (one per service) shares and invalidates it.
+USER_ROLE_CACHE_TTL_SECONDS = 30
+_role_cache: dict[tuple[UUID, UUID], tuple[str, float]] = {}
+
 
 class PermissionService:
     """
@@ -78,9 +85,21 @@ class PermissionService:
 
         Raises:
             RuntimeError: If repository operation fails
+
+        Note:
+            Found roles are cached for USER_ROLE_CACHE_TTL_SECONDS. Non-membership
+            is never cached so newly added collaborators get access immediately;
+            removals and role changes call invalidate_user_role().
         """
+        key = (user_id, alliance_id)
+        cached = _role_cache.get(key)
+        if cached and time.time() - cached[1] < USER_ROLE_CACHE_TTL_SECONDS:
+            return cached[0]
+
         try:
             role = await self._collaborator_repo.get_collaborator_role(alliance_id, user_id)
+            if role:
+                _role_cache[key] = (role, time.time())
             return role
         except ValueError:
             return None
@@ -92,6 +111,18 @@ class PermissionService:
             )
             raise RuntimeError(f"Failed to get user role: {type(e).__name__}") from e
 
+    def invalidate_user_role(self, alliance_id: UUID, user_id: UUID | None = None) -> None:
+        """
+        Drop cached roles after a membership change
+
+        Args:
+            alliance_id: Alliance UUID
+            user_id: User whose role changed, or None for every member of the alliance
+        """
+        for key in [k for k in _role_cache if k[1] == alliance_id]:
+            if user_id is None or key[0] == user_id:
+                del _role_cache[key]
+
     async def check_permission(
         self,
         user_id: UUID,
@@ -267,11 +298,19 @@ class PermissionService:
             ...     "upload CSV data"
             ... )
         """
-        # Step 1: Check role (must be owner or collaborator)
-        await self.require_owner_or_collaborator(user_id, alliance_id, action)
+        # Both checks are independent reads; run them in one round trip of latency
+        role_outcome, subscription_outcome = await asyncio.gather(
+            # Step 1: Check role (must be owner or collaborator)
+            self.require_owner_or_collaborator(user_id, alliance_id, action),
+            # Step 2: Check subscription (must be active)
+            self._subscription_service.require_write_access(alliance_id, action),
+            return_exceptions=True,
+        )
 
-        # Step 2: Check subscription (must be active)
-        await self._subscription_service.require_write_access(alliance_id, action)
+        # Role errors take precedence so non-members never see subscription state
+        for outcome in (role_outcome, subscription_outcome):
+            if isinstance(outcome, BaseException):
+                raise outcome
 
     async def require_active_subscription(
         self,
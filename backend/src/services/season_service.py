@@ -8,16 +8,49 @@ Season Service Layer - Season Purchase System
 """
 
 import logging
+import time
 from uuid import UUID
 
 from src.models.season import Season, SeasonActivateResponse, SeasonCreate, SeasonUpdate
 from src.repositories.alliance_repository import AllianceRepository
 from src.repositories.season_repository import SeasonRepository
+from src.services.battle_event_service import invalidate_cached_events
 from src.services.permission_service import PermissionService
 from src.services.subscription_service import SubscriptionService
 
 logger = logging.getLogger(__name__)
 
+# A season never moves between alliances, but it can be removed by an alliance
+# cascade; the TTL bounds how long a missed invalidation can last. Module-level
+# so AllianceService.delete_alliance() can drop an alliance's entries.
+SEASON_ALLIANCE_CACHE_TTL_SECONDS = 300
+SEASON_ALLIANCE_CACHE_MAX_ENTRIES = 10_000
+_season_alliance_cache: dict[UUID, tuple[UUID, float]] = {}
+
+
+def invalidate_cached_seasons(alliance_id: UUID) -> None:
+    """
+    Drop cached season → alliance mappings after an alliance is deleted
+
+    Args:
+        alliance_id: Deleted alliance UUID
+    """
+    for season_id in [k for k, (a, _) in _season_alliance_cache.items() if a == alliance_id]:
+        del _season_alliance_cache[season_id]
+
+
+def _remember_season_alliance(season_id: UUID, alliance_id: UUID) -> None:
+    """Cache the alliance a season belongs to, pruning expired entries when full"""
+    now = time.time()
+    if len(_season_alliance_cache) >= SEASON_ALLIANCE_CACHE_MAX_ENTRIES:
+        for key in [
+            k
+            for k, (_, cached_at) in _season_alliance_cache.items()
+            if now - cached_at >= SEASON_ALLIANCE_CACHE_TTL_SECONDS
+        ]:
+            del _season_alliance_cache[key]
+    _season_alliance_cache[season_id] = (alliance_id, now)
+
 
 class SeasonService:
     """
@@ -53,16 +86,26 @@ class SeasonService:
         Raises:
             ValueError: If season not found
             PermissionError: If user is not a member of the alliance
-        """
-        season = await self._repo.get_by_id(season_id)
-        if not season:
-            raise ValueError("Season not found")
 
-        role = await self._permission_service.get_user_role(user_id, season.alliance_id)
+        Note:
+            The season → alliance mapping is cached for SEASON_ALLIANCE_CACHE_TTL_SECONDS,
+            so with PermissionService's role cache repeat checks need no queries.
+        """
+        cached = _season_alliance_cache.get(season_id)
+        if cached and time.time() - cached[1] < SEASON_ALLIANCE_CACHE_TTL_SECONDS:
+            alliance_id = cached[0]
+        else:
+            season = await self._repo.get_by_id(season_id)
+            if not season:
+                raise ValueError("Season not found")
+            alliance_id = season.alliance_id
+            _remember_season_alliance(season_id, alliance_id)
+
+        role = await self._permission_service.get_user_role(user_id, alliance_id)
         if role is None:
             raise PermissionError("You are not a member of this alliance")
 
-        return season.alliance_id
+        return alliance_id
 
     async def get_seasons(self, user_id: UUID, activated_only: bool = False) -> list[Season]:
         """
@@ -306,6 +349,9 @@ class SeasonService:
         # Verify write permission (role check)
         await self._permission_service.require_role_permission(user_id, season.alliance_id)
 
+        _season_alliance_cache.pop(season_id, None)
+        # Battle events are removed by CASCADE
+        invalidate_cached_events(season_id=season_id)
         return await self._repo.delete(season_id)
 
     async def set_current_season(self, user_id: UUID, season_id: UUID) -> Season:
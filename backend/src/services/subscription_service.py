@@ -14,6 +14,7 @@ from uuid import UUID
 from src.core.exceptions import SubscriptionExpiredError
 from src.models.alliance import Alliance, SubscriptionStatusResponse
 from src.repositories.alliance_repository import AllianceRepository
+from src.services.alliance_service import invalidate_user_alliance
 
 logger = logging.getLogger(__name__)
 
@@ -359,6 +360,7 @@ class SubscriptionService:
         await self._alliance_repo.update(
             alliance_id, {"used_seasons": new_used}
         )
+        invalidate_user_alliance(alliance_id)
 
         remaining = alliance.purchased_seasons - new_used
         logger.info(
@@ -398,6 +400,7 @@ class SubscriptionService:
             updates["subscription_status"] = "active"
 
         await self._alliance_repo.update(alliance_id, updates)
+        invalidate_user_alliance(alliance_id)
 
         new_available = new_purchased - alliance.used_seasons
         logger.info(
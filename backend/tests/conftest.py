@@ -84,6 +84,43 @@ def csv_content_with_bom() -> str:
 張飛, 1, 15000, 85000, 320, 5000, 150000, 850000, 3200, 50000, 125000, 徐州, 前鋒隊"""
 
 
+# =============================================================================
+# Process-wide Cache Isolation
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def clear_role_cache():
+    """Reset the module-level service caches between tests"""
+    from src.services import (
+        alliance_service,
+        battle_event_service,
+        hegemony_weight_service,
+        line_binding_service,
+        permission_service,
+        season_service,
+    )
+
+    caches = [
+        permission_service._role_cache,
+        alliance_service._user_alliance_cache,
+        alliance_service._alliance_user_ids,
+        season_service._season_alliance_cache,
+        battle_event_service._event_alliance_cache,
+        battle_event_service._analytics_cache,
+        hegemony_weight_service._weights_cache,
+        hegemony_weight_service._scores_cache,
+        line_binding_service._group_alliance_cache,
+        line_binding_service._notification_skip_cache,
+        line_binding_service._custom_command_cache,
+    ]
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 # =============================================================================
 # Mock Repository Fixtures
 # =============================================================================
@@ -0,0 +1 @@
+"""Core utility unit tests"""
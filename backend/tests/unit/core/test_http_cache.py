@@ -0,0 +1,99 @@
+"""
+Unit Tests for HTTP cache helpers
+
+Tests cover:
+1. ETag generation (make_etag)
+2. Conditional JSON responses with If-None-Match (conditional_json_response)
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Coverage: happy path + edge cases
+"""
+
+from fastapi import Request
+
+from src.core.utils.http_cache import conditional_json_response, make_etag
+
+
+def build_request(if_none_match: str | None = None) -> Request:
+    """Factory for a minimal GET request with optional If-None-Match"""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestMakeEtag:
+    """Tests for make_etag function"""
+
+    def test_should_return_quoted_stable_etag(self):
+        """Should return the same quoted tag for identical bodies"""
+        # Act
+        etag = make_etag(b'{"role":"owner"}')
+
+        # Assert
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag(b'{"role":"owner"}')
+
+    def test_should_differ_for_different_bodies(self):
+        """Should return different tags for different bodies"""
+        assert make_etag(b'{"role":"owner"}') != make_etag(b'{"role":"member"}')
+
+
+class TestConditionalJsonResponse:
+    """Tests for conditional_json_response function"""
+
+    def test_should_return_body_with_cache_headers(self):
+        """Should serialize content and attach ETag + private Cache-Control"""
+        # Act
+        response = conditional_json_response(build_request(), {"role": "owner"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.body == b'{"role":"owner"}'
+        assert response.headers["cache-control"] == "private, max-age=5"
+        assert response.headers["etag"] == make_etag(b'{"role":"owner"}')
+
+    def test_should_send_no_cache_when_max_age_is_zero(self):
+        """Should require revalidation instead of a freshness window"""
+        # Act
+        response = conditional_json_response(build_request(), {"role": "owner"}, max_age=0)
+
+        # Assert
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert response.headers["etag"] == make_etag(b'{"role":"owner"}')
+
+    def test_should_return_304_when_etag_matches(self):
+        """Should return empty 304 when If-None-Match matches current ETag"""
+        # Arrange
+        etag = make_etag(b'{"role":"owner"}')
+
+        # Act
+        response = conditional_json_response(build_request(etag), {"role": "owner"})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+    def test_should_match_weak_and_listed_etags(self):
+        """Should accept weak validators and comma-separated lists"""
+        # Arrange
+        etag = make_etag(b'{"role":"owner"}')
+
+        # Act
+        response = conditional_json_response(
+            build_request(f'"stale", W/{etag}'), {"role": "owner"}
+        )
+
+        # Assert
+        assert response.status_code == 304
+
+    def test_should_return_200_when_etag_is_stale(self):
+        """Should return full body when If-None-Match does not match"""
+        # Act
+        response = conditional_json_response(build_request('"stale"'), {"role": "owner"})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.body == b'{"role":"owner"}'
@@ -0,0 +1,310 @@
+"""
+Unit Tests for AllianceCollaboratorService
+
+Tests cover:
+1. User email lookup with TTL cache (get_user_email)
+2. Batched pending invitation processing (process_pending_invitations)
+3. Collaborator enrichment from Supabase Auth (get_alliance_collaborators)
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Mocked repository dependencies
+- Coverage: happy path + edge cases + error cases
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.pending_invitation import PendingInvitation
+from src.services.alliance_collaborator_service import AllianceCollaboratorService
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def user_id() -> UUID:
+    """Fixed user UUID for testing"""
+    return UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+def mock_supabase() -> MagicMock:
+    """Create mock Supabase client"""
+    return MagicMock()
+
+
+@pytest.fixture
+def collaborator_service(mock_supabase: MagicMock) -> AllianceCollaboratorService:
+    """Create AllianceCollaboratorService with mocked dependencies"""
+    with patch(
+        "src.services.alliance_collaborator_service.get_supabase_client",
+        return_value=mock_supabase,
+    ):
+        service = AllianceCollaboratorService()
+    service._collaborator_repo = MagicMock()
+    service._invitation_repo = MagicMock()
+    service._permission_service = MagicMock()
+    return service
+
+
+def set_user_email(mock_supabase: MagicMock, email: str | None) -> None:
+    """Configure the Supabase Auth admin lookup response"""
+    response = MagicMock()
+    response.user.email = email
+    mock_supabase.auth.admin.get_user_by_id.return_value = response
+
+
+def create_invitation(alliance_id: UUID, role: str = "member") -> PendingInvitation:
+    """Factory for pending invitation test data"""
+    now = datetime.now()
+    return PendingInvitation(
+        id=uuid4(),
+        alliance_id=alliance_id,
+        invited_email="user@example.com",
+        invited_by=uuid4(),
+        role=role,
+        invitation_token=uuid4(),
+        invited_at=now,
+        expires_at=now,
+        status="pending",
+    )
+
+
+# =============================================================================
+# Tests for get_user_email
+# =============================================================================
+
+
+class TestGetUserEmail:
+    """Tests for get_user_email method"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_email_from_supabase_auth(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+    ):
+        """Should return the email reported by Supabase Auth"""
+        # Arrange
+        set_user_email(mock_supabase, "user@example.com")
+
+        # Act
+        result = await collaborator_service.get_user_email(user_id)
+
+        # Assert
+        assert result == "user@example.com"
+        mock_supabase.auth.admin.get_user_by_id.assert_called_once_with(str(user_id))
+
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_lookups_from_cache(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+    ):
+        """Should only call Supabase Auth once within the cache TTL"""
+        # Arrange
+        set_user_email(mock_supabase, "user@example.com")
+
+        # Act
+        first = await collaborator_service.get_user_email(user_id)
+        second = await collaborator_service.get_user_email(user_id)
+
+        # Assert
+        assert first == second == "user@example.com"
+        mock_supabase.auth.admin.get_user_by_id.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_missing_email(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+    ):
+        """Should retry the lookup when no email was found"""
+        # Arrange
+        set_user_email(mock_supabase, None)
+
+        # Act
+        await collaborator_service.get_user_email(user_id)
+        await collaborator_service.get_user_email(user_id)
+
+        # Assert
+        assert mock_supabase.auth.admin.get_user_by_id.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_when_lookup_fails(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+    ):
+        """Should swallow Supabase errors and return None"""
+        # Arrange
+        mock_supabase.auth.admin.get_user_by_id.side_effect = Exception("network")
+
+        # Act
+        result = await collaborator_service.get_user_email(user_id)
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_should_prune_expired_entries_when_full(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Should drop expired emails instead of growing past the maximum"""
+        # Arrange
+        monkeypatch.setattr(
+            "src.services.alliance_collaborator_service.USER_EMAIL_CACHE_MAX_ENTRIES", 1
+        )
+        collaborator_service._email_cache[uuid4()] = ("old@example.com", 0.0)
+        set_user_email(mock_supabase, "user@example.com")
+
+        # Act
+        await collaborator_service.get_user_email(user_id)
+
+        # Assert
+        assert list(collaborator_service._email_cache) == [user_id]
+
+
+# =============================================================================
+# Tests for process_pending_invitations
+# =============================================================================
+
+
+class TestProcessPendingInvitations:
+    """Tests for process_pending_invitations method"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_zero_when_no_invitations(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        user_id: UUID,
+    ):
+        """Should skip all writes when nothing is pending"""
+        # Arrange
+        collaborator_service._invitation_repo.get_pending_by_email = AsyncMock(
+            return_value=[]
+        )
+        collaborator_service._collaborator_repo.add_collaborators = AsyncMock()
+
+        # Act
+        result = await collaborator_service.process_pending_invitations(
+            user_id, "user@example.com"
+        )
+
+        # Assert
+        assert result == 0
+        collaborator_service._collaborator_repo.add_collaborators.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_should_batch_inserts_and_skip_existing_memberships(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        user_id: UUID,
+    ):
+        """Should insert only new memberships and accept all invitations at once"""
+        # Arrange
+        existing, fresh = uuid4(), uuid4()
+        invitations = [create_invitation(existing), create_invitation(fresh, role="collaborator")]
+        collaborator_service._invitation_repo.get_pending_by_email = AsyncMock(
+            return_value=invitations
+        )
+        collaborator_service._collaborator_repo.get_member_alliance_ids = AsyncMock(
+            return_value={existing}
+        )
+        collaborator_service._collaborator_repo.add_collaborators = AsyncMock()
+        collaborator_service._invitation_repo.mark_many_as_accepted = AsyncMock(
+            return_value=2
+        )
+
+        # Act
+        result = await collaborator_service.process_pending_invitations(
+            user_id, "user@example.com"
+        )
+
+        # Assert
+        assert result == 2
+        collaborator_service._collaborator_repo.add_collaborators.assert_awaited_once_with(
+            user_id, [(fresh, "collaborator", invitations[1].invited_by)]
+        )
+        collaborator_service._invitation_repo.mark_many_as_accepted.assert_awaited_once_with(
+            [inv.id for inv in invitations]
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_return_zero_when_batch_fails(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        user_id: UUID,
+    ):
+        """Should swallow errors since this runs as a background step"""
+        # Arrange
+        collaborator_service._invitation_repo.get_pending_by_email = AsyncMock(
+            return_value=[create_invitation(uuid4())]
+        )
+        collaborator_service._collaborator_repo.get_member_alliance_ids = AsyncMock(
+            side_effect=Exception("db down")
+        )
+
+        # Act
+        result = await collaborator_service.process_pending_invitations(
+            user_id, "user@example.com"
+        )
+
+        # Assert
+        assert result == 0
+
+
+# =============================================================================
+# Tests for get_alliance_collaborators
+# =============================================================================
+
+
+class TestGetAllianceCollaborators:
+    """Tests for collaborator enrichment"""
+
+    @pytest.mark.asyncio
+    async def test_should_enrich_each_collaborator_and_seed_email_cache(
+        self,
+        collaborator_service: AllianceCollaboratorService,
+        mock_supabase: MagicMock,
+        user_id: UUID,
+    ):
+        """Should look up every collaborator once and reuse emails afterwards"""
+        # Arrange
+        alliance_id = uuid4()
+        other_user_id = uuid4()
+        set_user_email(mock_supabase, "user@example.com")
+        collaborator_service._collaborator_repo.is_collaborator = AsyncMock(return_value=True)
+        collaborator_service._collaborator_repo.get_alliance_collaborators = AsyncMock(
+            return_value=[
+                {"user_id": str(user_id), "role": "owner"},
+                {"user_id": str(other_user_id), "role": "member"},
+                {"user_id": None, "role": "member"},
+            ]
+        )
+
+        # Act
+        result = await collaborator_service.get_alliance_collaborators(user_id, alliance_id)
+        email = await collaborator_service.get_user_email(other_user_id)
+
+        # Assert
+        assert [c.get("user_email") for c in result] == [
+            "user@example.com",
+            "user@example.com",
+            None,
+        ]
+        assert email == "user@example.com"
+        assert mock_supabase.auth.admin.get_user_by_id.call_count == 2
@@ -20,7 +20,8 @@ from uuid import UUID
 import pytest
 
 from src.models.alliance import Alliance, AllianceCreate, AllianceUpdate
-from src.services.alliance_service import AllianceService
+from src.services import alliance_service as alliance_service_module
+from src.services.alliance_service import AllianceService, invalidate_user_alliance
 
 # =============================================================================
 # Fixtures
@@ -136,6 +137,75 @@ class TestGetUserAlliance:
         # Assert
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_lookups_from_cache(
+        self,
+        alliance_service: AllianceService,
+        mock_alliance_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should query the repository once for back-to-back requests"""
+        # Arrange
+        mock_alliance_repo.get_by_collaborator = AsyncMock(
+            return_value=create_mock_alliance(alliance_id)
+        )
+
+        # Act
+        await alliance_service.get_user_alliance(user_id)
+        result = await alliance_service.get_user_alliance(user_id)
+
+        # Assert
+        assert result.id == alliance_id
+        mock_alliance_repo.get_by_collaborator.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_refetch_after_membership_invalidated(
+        self,
+        alliance_service: AllianceService,
+        mock_alliance_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should not keep serving an alliance the user was removed from"""
+        # Arrange
+        mock_alliance_repo.get_by_collaborator = AsyncMock(
+            return_value=create_mock_alliance(alliance_id)
+        )
+        await alliance_service.get_user_alliance(user_id)
+
+        # Act
+        invalidate_user_alliance(alliance_id, user_id)
+        mock_alliance_repo.get_by_collaborator = AsyncMock(return_value=None)
+        result = await alliance_service.get_user_alliance(user_id)
+
+        # Assert
+        assert result is None
+
+
+    @pytest.mark.asyncio
+    async def test_should_drop_every_member_when_alliance_invalidated(
+        self,
+        alliance_service: AllianceService,
+        mock_alliance_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should clear all of an alliance's cached members and its index entry"""
+        # Arrange
+        other_user_id = UUID("44444444-4444-4444-4444-444444444444")
+        mock_alliance_repo.get_by_collaborator = AsyncMock(
+            return_value=create_mock_alliance(alliance_id)
+        )
+        await alliance_service.get_user_alliance(user_id)
+        await alliance_service.get_user_alliance(other_user_id)
+
+        # Act
+        invalidate_user_alliance(alliance_id)
+
+        # Assert
+        assert alliance_service_module._user_alliance_cache == {}
+        assert alliance_service_module._alliance_user_ids == {}
 
 # =============================================================================
 # Tests for create_alliance
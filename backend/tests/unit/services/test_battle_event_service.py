@@ -0,0 +1,490 @@
+"""
+Unit Tests for BattleEventService
+
+Tests cover:
+1. Analytics data caching for completed events (get_event_analytics_data)
+2. Cache invalidation on delete
+3. Single-read access check (get_event_for_user)
+4. Batched analytics for several events (get_events_analytics_data_for_user)
+5. Group analytics reuse of cached event data (get_event_group_analytics)
+6. Event → alliance caching and cascade invalidation (verify_user_access)
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Mocked repository dependencies
+- Coverage: happy path + edge cases + error cases
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.battle_event import BattleEvent, EventStatus
+from src.models.battle_event_metrics import BattleEventMetricsWithMember
+from src.services import battle_event_service
+from src.services.battle_event_service import BattleEventService, invalidate_cached_events
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def user_id() -> UUID:
+    """Fixed user UUID for testing"""
+    return UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+def alliance_id() -> UUID:
+    """Fixed alliance UUID for testing"""
+    return UUID("22222222-2222-2222-2222-222222222222")
+
+
+@pytest.fixture
+def mock_event_repo() -> MagicMock:
+    """Create mock battle event repository"""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_metrics_repo() -> MagicMock:
+    """Create mock battle event metrics repository"""
+    repo = MagicMock()
+    repo.get_by_event_with_member = AsyncMock(return_value=[])
+    repo.get_by_event_with_member_and_group = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.fixture
+def event_service(
+    mock_event_repo: MagicMock, mock_metrics_repo: MagicMock
+) -> BattleEventService:
+    """Create BattleEventService with mocked dependencies"""
+    service = BattleEventService()
+    service._event_repo = mock_event_repo
+    service._metrics_repo = mock_metrics_repo
+    service._permission_service = MagicMock()
+    service._permission_service.require_active_subscription = AsyncMock()
+    return service
+
+
+def create_mock_event(
+    alliance_id: UUID, status: EventStatus = EventStatus.COMPLETED
+) -> BattleEvent:
+    """Factory for battle event test data"""
+    return BattleEvent(
+        id=uuid4(),
+        alliance_id=alliance_id,
+        season_id=uuid4(),
+        name="赤壁之戰",
+        before_upload_id=None,
+        after_upload_id=None,
+        status=status,
+        created_at=datetime.now(),
+        created_by=None,
+    )
+
+
+# =============================================================================
+# Tests for get_event_analytics_data
+# =============================================================================
+
+
+class TestGetEventAnalyticsData:
+    """Tests for analytics data caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_serve_completed_event_from_cache(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        mock_metrics_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should query the repositories once for a completed event"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+
+        # Act
+        first = await event_service.get_event_analytics_data(event.id)
+        second = await event_service.get_event_analytics_data(event.id)
+
+        # Assert
+        assert first == second
+        assert first[0] == event
+        mock_event_repo.get_by_id.assert_awaited_once()
+        mock_metrics_repo.get_by_event_with_member_and_group.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_event_still_analyzing(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should refetch while the event has not finished processing"""
+        # Arrange
+        event = create_mock_event(alliance_id, status=EventStatus.ANALYZING)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+
+        # Act
+        await event_service.get_event_analytics_data(event.id)
+        await event_service.get_event_analytics_data(event.id)
+
+        # Assert
+        assert mock_event_repo.get_by_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_event_when_not_found(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+    ):
+        """Should report a missing event without caching it"""
+        # Arrange
+        mock_event_repo.get_by_id = AsyncMock(return_value=None)
+
+        # Act
+        event, _, metrics = await event_service.get_event_analytics_data(uuid4())
+
+        # Assert
+        assert event is None
+        assert metrics == []
+        assert battle_event_service._analytics_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_on_delete(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should drop cached analytics when the event is deleted"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        mock_event_repo.delete = AsyncMock(return_value=True)
+        await event_service.get_event_analytics_data(event.id)
+
+        # Act
+        await event_service.delete_event(event.id)
+
+        # Assert
+        assert event.id not in battle_event_service._analytics_cache
+
+    @pytest.mark.asyncio
+    async def test_should_evict_oldest_entry_when_full(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        alliance_id: UUID,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Should keep at most EVENT_ANALYTICS_CACHE_MAX_ENTRIES events"""
+        # Arrange
+        monkeypatch.setattr(battle_event_service, "EVENT_ANALYTICS_CACHE_MAX_ENTRIES", 2)
+        events = [create_mock_event(alliance_id) for _ in range(3)]
+        mock_event_repo.get_by_id = AsyncMock(side_effect=events)
+
+        # Act
+        for event in events:
+            await event_service.get_event_analytics_data(event.id)
+
+        # Assert
+        assert list(battle_event_service._analytics_cache) == [events[1].id, events[2].id]
+
+    @pytest.mark.asyncio
+    async def test_should_drop_cache_when_season_is_deleted(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should stop serving an event removed by a season cascade"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        await event_service.get_event_analytics_data(event.id)
+
+        # Act
+        invalidate_cached_events(season_id=event.season_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=None)
+        cached_event, _, _ = await event_service.get_event_analytics_data(event.id)
+
+        # Assert
+        assert cached_event is None
+
+
+# =============================================================================
+# Tests for get_event_for_user
+# =============================================================================
+
+
+class TestGetEventForUser:
+    """Tests for fetching an event together with its access check"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_event_with_single_read(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should load the event once and check membership of its alliance"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        event_service._permission_service.get_user_role = AsyncMock(return_value="member")
+
+        # Act
+        result = await event_service.get_event_for_user(user_id, event.id)
+
+        # Assert
+        assert result == event
+        mock_event_repo.get_by_id.assert_awaited_once_with(event.id)
+        event_service._permission_service.get_user_role.assert_awaited_once_with(
+            user_id, alliance_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_user_not_member(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should raise PermissionError for non-members"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        event_service._permission_service.get_user_role = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(PermissionError):
+            await event_service.get_event_for_user(user_id, event.id)
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_event_not_found(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        user_id: UUID,
+    ):
+        """Should raise ValueError for a missing event"""
+        # Arrange
+        mock_event_repo.get_by_id = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Event not found"):
+            await event_service.get_event_for_user(user_id, uuid4())
+
+
+# =============================================================================
+# Tests for get_events_analytics_data_for_user
+# =============================================================================
+
+
+class TestGetEventsAnalyticsDataForUser:
+    """Tests for batched multi-event analytics"""
+
+    @pytest.mark.asyncio
+    async def test_should_load_all_events_with_one_query_each(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        mock_metrics_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should batch reads and check membership once per alliance"""
+        # Arrange
+        first, second = create_mock_event(alliance_id), create_mock_event(alliance_id)
+        mock_event_repo.get_by_ids = AsyncMock(return_value=[second, first])
+        mock_metrics_repo.get_by_events_with_member_and_group = AsyncMock(
+            return_value={first.id: [], second.id: []}
+        )
+        event_service._permission_service.get_user_role = AsyncMock(return_value="member")
+
+        # Act
+        result = await event_service.get_events_analytics_data_for_user(
+            user_id, [first.id, second.id, first.id]
+        )
+
+        # Assert
+        assert [data[0] for data in result] == [first, second]
+        assert result[0][1].total_members == 0
+        mock_event_repo.get_by_ids.assert_awaited_once_with([first.id, second.id])
+        mock_metrics_repo.get_by_events_with_member_and_group.assert_awaited_once_with(
+            [first.id, second.id]
+        )
+        event_service._permission_service.get_user_role.assert_awaited_once_with(
+            user_id, alliance_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_any_event_missing(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        mock_metrics_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should raise ValueError if one of the events does not exist"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_ids = AsyncMock(return_value=[event])
+        mock_metrics_repo.get_by_events_with_member_and_group = AsyncMock(
+            return_value={event.id: []}
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Event not found"):
+            await event_service.get_events_analytics_data_for_user(
+                user_id, [event.id, uuid4()]
+            )
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_user_not_member(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        mock_metrics_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should deny the whole batch if any alliance is inaccessible"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_ids = AsyncMock(return_value=[event])
+        mock_metrics_repo.get_by_events_with_member_and_group = AsyncMock(
+            return_value={event.id: []}
+        )
+        event_service._permission_service.get_user_role = AsyncMock(return_value=None)
+
+        # Act & Assert
+        with pytest.raises(PermissionError):
+            await event_service.get_events_analytics_data_for_user(user_id, [event.id])
+
+
+# =============================================================================
+# Tests for get_event_group_analytics
+# =============================================================================
+
+
+class TestGetEventGroupAnalytics:
+    """Tests for group analytics built on cached event data"""
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_cached_analytics_data(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        mock_metrics_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should not re-read a completed event already loaded for analytics"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        metric = BattleEventMetricsWithMember(
+            id=uuid4(),
+            event_id=event.id,
+            member_id=uuid4(),
+            alliance_id=alliance_id,
+            start_snapshot_id=None,
+            end_snapshot_id=None,
+            created_at=datetime.now(),
+            member_name="張飛",
+            group_name="前鋒隊",
+            merit_diff=1000,
+            participated=True,
+        )
+        mock_metrics_repo.get_by_event_with_member_and_group = AsyncMock(return_value=[metric])
+        await event_service.get_event_analytics_data(event.id)
+
+        # Act
+        result = await event_service.get_event_group_analytics(event.id)
+
+        # Assert
+        assert [m.member_name for m in result.top_members] == ["張飛"]
+        mock_event_repo.get_by_id.assert_awaited_once()
+        mock_metrics_repo.get_by_event_with_member_and_group.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_return_none_without_metrics(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        alliance_id: UUID,
+    ):
+        """Should return None when the event has no member metrics"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+
+        # Act
+        result = await event_service.get_event_group_analytics(event.id)
+
+        # Assert
+        assert result is None
+
+
+# =============================================================================
+# Tests for verify_user_access
+# =============================================================================
+
+
+class TestVerifyUserAccess:
+    """Tests for cached event → alliance access checks"""
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_cached_alliance_for_repeat_checks(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should load the event once across repeated access checks"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        event_service._permission_service.get_user_role = AsyncMock(return_value="member")
+
+        # Act
+        await event_service.verify_user_access(user_id, event.id)
+        result = await event_service.verify_user_access(user_id, event.id)
+
+        # Assert
+        assert result == alliance_id
+        mock_event_repo.get_by_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_raise_after_alliance_cascade(
+        self,
+        event_service: BattleEventService,
+        mock_event_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should report a missing event once its alliance was deleted"""
+        # Arrange
+        event = create_mock_event(alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=event)
+        event_service._permission_service.get_user_role = AsyncMock(return_value="member")
+        await event_service.verify_user_access(user_id, event.id)
+
+        # Act
+        invalidate_cached_events(alliance_id=alliance_id)
+        mock_event_repo.get_by_id = AsyncMock(return_value=None)
+
+        # Assert
+        with pytest.raises(ValueError, match="Event not found"):
+            await event_service.verify_user_access(user_id, event.id)
@@ -74,6 +74,17 @@ class TestExtractDatetimeFromFilename:
         # Assert
         assert result == datetime(2025, 1, 5, 5, 5, 5)
 
+    def test_should_extract_datetime_when_uppercase_extension(self):
+        """Uppercase .CSV extension should parse like .csv"""
+        # Arrange
+        filename = "同盟統計2025年10月09日10时13分09秒.CSV"
+
+        # Act
+        result = CSVParserService.extract_datetime_from_filename(filename)
+
+        # Assert
+        assert result == datetime(2025, 10, 9, 10, 13, 9)
+
     # =========================================================================
     # Error Case Tests
     # =========================================================================
@@ -14,6 +14,7 @@ Tests cover:
 - Coverage: happy path + edge cases + error cases
 """
 
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID, uuid4
@@ -23,6 +24,7 @@ from fastapi import HTTPException
 
 from src.models.csv_upload import CsvUpload
 from src.models.season import Season
+from src.services import hegemony_weight_service
 from src.services.csv_upload_service import CSVUploadService
 
 # =============================================================================
@@ -526,6 +528,38 @@ class TestDeleteUpload:
         )
         mock_csv_upload_repo.delete.assert_called_once_with(upload_id)
 
+    @pytest.mark.asyncio
+    async def test_should_drop_cached_hegemony_data_for_season(
+        self,
+        csv_upload_service: CSVUploadService,
+        mock_csv_upload_repo: MagicMock,
+        mock_season_repo: MagicMock,
+        mock_permission_service: MagicMock,
+        user_id: UUID,
+        season_id: UUID,
+        alliance_id: UUID,
+        upload_id: UUID,
+    ):
+        """Should invalidate weights/scores that cascaded with the upload"""
+        # Arrange
+        hegemony_weight_service._weights_cache[season_id] = ([], time.time())
+        hegemony_weight_service._scores_cache[season_id] = ([], time.time())
+        mock_csv_upload_repo.get_by_id = AsyncMock(
+            return_value=create_mock_upload(upload_id, season_id, alliance_id)
+        )
+        mock_season_repo.get_by_id = AsyncMock(
+            return_value=create_mock_season(season_id, alliance_id)
+        )
+        mock_permission_service.require_write_permission = AsyncMock()
+        mock_csv_upload_repo.delete = AsyncMock(return_value=True)
+
+        # Act
+        await csv_upload_service.delete_upload(user_id, upload_id)
+
+        # Assert
+        assert season_id not in hegemony_weight_service._weights_cache
+        assert season_id not in hegemony_weight_service._scores_cache
+
     @pytest.mark.asyncio
     async def test_should_raise_404_when_upload_not_found(
         self,
@@ -0,0 +1,327 @@
+"""
+Unit Tests for DonationService
+
+Tests cover:
+1. Donation list caching (get_donations_by_alliance_and_season)
+2. Cache invalidation on create/delete
+3. Member donation calculation from batched snapshots (get_donation_with_info)
+4. Concurrent access check + list fetch (get_donations_for_user)
+5. Bulk target overrides (set_member_target_overrides)
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Mocked repository dependencies
+- Coverage: happy path + edge cases + error cases
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.donation import Donation, DonationCreate, DonationType
+from src.models.member_snapshot import MemberSnapshot
+from src.services.donation_service import DonationService
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def user_id() -> UUID:
+    """Fixed user UUID for testing"""
+    return UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+def alliance_id() -> UUID:
+    """Fixed alliance UUID for testing"""
+    return UUID("22222222-2222-2222-2222-222222222222")
+
+
+@pytest.fixture
+def season_id() -> UUID:
+    """Fixed season UUID for testing"""
+    return UUID("33333333-3333-3333-3333-333333333333")
+
+
+@pytest.fixture
+def mock_donation_repo() -> MagicMock:
+    """Create mock donation repository"""
+    return MagicMock()
+
+
+@pytest.fixture
+def donation_service(mock_donation_repo: MagicMock) -> DonationService:
+    """Create DonationService with mocked dependencies"""
+    service = DonationService()
+    service._donation_repo = mock_donation_repo
+    service._target_repo = MagicMock()
+    service._snapshot_repo = MagicMock()
+    service._permission_service = MagicMock()
+    service._permission_service.require_write_permission = AsyncMock()
+    return service
+
+
+def create_mock_donation(
+    alliance_id: UUID, season_id: UUID, deadline: datetime | None = None
+) -> Donation:
+    """Factory for donation test data"""
+    now = datetime.now()
+    return Donation(
+        id=uuid4(),
+        alliance_id=alliance_id,
+        season_id=season_id,
+        title="Weekly donation",
+        type=DonationType.REGULAR,
+        deadline=deadline or now,
+        target_amount=1000,
+        created_by=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def create_mock_snapshot(
+    member_id: UUID, alliance_id: UUID, csv_upload_id: UUID, total_donation: int
+) -> MemberSnapshot:
+    """Factory for member snapshot test data"""
+    return MemberSnapshot(
+        id=uuid4(),
+        csv_upload_id=csv_upload_id,
+        member_id=member_id,
+        alliance_id=alliance_id,
+        created_at=datetime.now(),
+        member_name="張飛",
+        state="益州",
+        contribution_rank=1,
+        power_value=1000,
+        total_donation=total_donation,
+    )
+
+
+# =============================================================================
+# Tests for get_donations_by_alliance_and_season
+# =============================================================================
+
+
+class TestGetDonationsByAllianceAndSeason:
+    """Tests for donation list caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_reads_from_cache(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should query the repository once within the cache TTL"""
+        # Arrange
+        donations = [create_mock_donation(alliance_id, season_id)]
+        mock_donation_repo.get_by_alliance_and_season = AsyncMock(return_value=donations)
+
+        # Act
+        first = await donation_service.get_donations_by_alliance_and_season(
+            alliance_id, season_id
+        )
+        second = await donation_service.get_donations_by_alliance_and_season(
+            alliance_id, season_id
+        )
+
+        # Assert
+        assert first == second == donations
+        mock_donation_repo.get_by_alliance_and_season.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_on_create(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should refetch the list after a donation is created in the season"""
+        # Arrange
+        created = create_mock_donation(alliance_id, season_id)
+        mock_donation_repo.get_by_alliance_and_season = AsyncMock(return_value=[])
+        mock_donation_repo.create = AsyncMock(return_value=created)
+        await donation_service.get_donations_by_alliance_and_season(alliance_id, season_id)
+
+        # Act
+        await donation_service.create_donation(
+            DonationCreate(
+                title="Weekly donation",
+                type=DonationType.REGULAR,
+                deadline=datetime.now(),
+                season_id=season_id,
+                alliance_id=alliance_id,
+                created_by=user_id,
+            )
+        )
+        await donation_service.get_donations_by_alliance_and_season(alliance_id, season_id)
+
+        # Assert
+        assert mock_donation_repo.get_by_alliance_and_season.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_on_delete(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should refetch the list after a donation is deleted"""
+        # Arrange
+        donation = create_mock_donation(alliance_id, season_id)
+        mock_donation_repo.get_by_alliance_and_season = AsyncMock(return_value=[donation])
+        mock_donation_repo.get_by_id = AsyncMock(return_value=donation)
+        mock_donation_repo.delete = AsyncMock()
+        await donation_service.get_donations_by_alliance_and_season(alliance_id, season_id)
+
+        # Act
+        await donation_service.delete_donation(donation.id, user_id)
+        await donation_service.get_donations_by_alliance_and_season(alliance_id, season_id)
+
+        # Assert
+        assert mock_donation_repo.get_by_alliance_and_season.await_count == 2
+
+
+# =============================================================================
+# Tests for get_donation_with_info
+# =============================================================================
+
+
+class TestGetDonationWithInfo:
+    """Tests for member donation calculation"""
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_start_and_end_snapshots_in_one_batch(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should diff total_donation between the two batched snapshot sets"""
+        # Arrange
+        member_id = uuid4()
+        donation = create_mock_donation(
+            alliance_id, season_id, deadline=datetime.now() + timedelta(days=7)
+        )
+        mock_donation_repo.get_by_id = AsyncMock(return_value=donation)
+        donation_service._snapshot_repo.get_closest_to_dates = AsyncMock(
+            return_value=[
+                [create_mock_snapshot(member_id, alliance_id, uuid4(), 500)],
+                [create_mock_snapshot(member_id, alliance_id, uuid4(), 1200)],
+            ]
+        )
+
+        # Act
+        result = await donation_service.get_donation_with_info(donation.id)
+
+        # Assert
+        donation_service._snapshot_repo.get_closest_to_dates.assert_awaited_once_with(
+            alliance_id=alliance_id,
+            season_id=season_id,
+            target_dates=[donation.created_at, donation.deadline],
+        )
+        assert len(result.member_info) == 1
+        assert result.member_info[0].donated_amount == 700
+        assert result.member_info[0].target_amount == 1000
+
+
+# =============================================================================
+# Tests for get_donations_for_user
+# =============================================================================
+
+
+class TestGetDonationsForUser:
+    """Tests for concurrent access check + list fetch"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_list_when_access_granted(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should return donations after the permission check passes"""
+        # Arrange
+        donations = [create_mock_donation(alliance_id, season_id)]
+        mock_donation_repo.get_by_alliance_and_season = AsyncMock(return_value=donations)
+
+        # Act
+        result = await donation_service.get_donations_for_user(
+            user_id, alliance_id, season_id
+        )
+
+        # Assert
+        assert result == donations
+        donation_service._permission_service.require_write_permission.assert_awaited_once_with(
+            user_id, alliance_id, "manage donation events"
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_raise_when_access_denied(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should propagate PermissionError instead of returning data"""
+        # Arrange
+        mock_donation_repo.get_by_alliance_and_season = AsyncMock(return_value=[])
+        donation_service._permission_service.require_write_permission = AsyncMock(
+            side_effect=PermissionError("denied")
+        )
+
+        # Act & Assert
+        with pytest.raises(PermissionError):
+            await donation_service.get_donations_for_user(user_id, alliance_id, season_id)
+
+
+# =============================================================================
+# Tests for set_member_target_overrides
+# =============================================================================
+
+
+class TestSetMemberTargetOverrides:
+    """Tests for bulk per-member target overrides"""
+
+    @pytest.mark.asyncio
+    async def test_should_upsert_all_targets_once_with_last_value_winning(
+        self,
+        donation_service: DonationService,
+        mock_donation_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should send a single upsert with one row per member"""
+        # Arrange
+        donation = create_mock_donation(alliance_id, season_id)
+        member_a, member_b = uuid4(), uuid4()
+        mock_donation_repo.get_by_id = AsyncMock(return_value=donation)
+        donation_service._target_repo.upsert_targets = AsyncMock(return_value=[])
+
+        # Act
+        await donation_service.set_member_target_overrides(
+            donation.id,
+            [(member_a, 100), (member_b, 200), (member_a, 300)],
+            user_id,
+        )
+
+        # Assert
+        donation_service._target_repo.upsert_targets.assert_awaited_once_with(
+            donation.id, alliance_id, [(member_a, 300), (member_b, 200)]
+        )
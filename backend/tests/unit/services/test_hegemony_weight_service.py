@@ -0,0 +1,201 @@
+"""
+Unit Tests for HegemonyWeightService
+
+Tests cover:
+1. Season weight caching (get_season_weights)
+2. Score preview caching across limits (calculate_hegemony_scores)
+3. Cache invalidation on weight update
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Mocked repository dependencies
+- Coverage: happy path + edge cases + error cases
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.hegemony_weight import HegemonyWeightUpdate, HegemonyWeightWithSnapshot
+from src.models.member_snapshot import MemberSnapshot
+from src.services.hegemony_weight_service import HegemonyWeightService
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def user_id() -> UUID:
+    """Fixed user UUID for testing"""
+    return UUID("11111111-1111-1111-1111-111111111111")
+
+
+@pytest.fixture
+def alliance_id() -> UUID:
+    """Fixed alliance UUID for testing"""
+    return UUID("22222222-2222-2222-2222-222222222222")
+
+
+@pytest.fixture
+def season_id() -> UUID:
+    """Fixed season UUID for testing"""
+    return UUID("33333333-3333-3333-3333-333333333333")
+
+
+@pytest.fixture
+def mock_weight_repo() -> MagicMock:
+    """Create mock hegemony weight repository"""
+    return MagicMock()
+
+
+@pytest.fixture
+def weight_service(mock_weight_repo: MagicMock, alliance_id: UUID) -> HegemonyWeightService:
+    """Create HegemonyWeightService with mocked dependencies and access checks"""
+    service = HegemonyWeightService()
+    service._weight_repo = mock_weight_repo
+    service._snapshot_repo = MagicMock()
+    service._permission_service = MagicMock()
+    service._permission_service.require_active_subscription = AsyncMock()
+    service._verify_season_access = AsyncMock(return_value=(MagicMock(), MagicMock()))
+    service._verify_weight_access = AsyncMock()
+    return service
+
+
+def create_weight(alliance_id: UUID, season_id: UUID) -> HegemonyWeightWithSnapshot:
+    """Factory for hegemony weight test data"""
+    now = datetime.now()
+    return HegemonyWeightWithSnapshot(
+        id=uuid4(),
+        alliance_id=alliance_id,
+        season_id=season_id,
+        csv_upload_id=uuid4(),
+        weight_contribution=Decimal("0.25"),
+        weight_merit=Decimal("0.25"),
+        weight_assist=Decimal("0.25"),
+        weight_donation=Decimal("0.25"),
+        snapshot_weight=Decimal("1.0"),
+        created_at=now,
+        updated_at=now,
+        snapshot_date=now,
+        snapshot_filename="同盟統計2025年10月09日10时13分09秒.csv",
+        total_members=2,
+    )
+
+
+def create_snapshot(
+    alliance_id: UUID, csv_upload_id: UUID, name: str, merit: int
+) -> MemberSnapshot:
+    """Factory for member snapshot test data"""
+    return MemberSnapshot(
+        id=uuid4(),
+        csv_upload_id=csv_upload_id,
+        member_id=uuid4(),
+        alliance_id=alliance_id,
+        created_at=datetime.now(),
+        member_name=name,
+        state="益州",
+        contribution_rank=1,
+        power_value=1000,
+        total_merit=merit,
+    )
+
+
+# =============================================================================
+# Tests for get_season_weights
+# =============================================================================
+
+
+class TestGetSeasonWeights:
+    """Tests for season weight caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_reads_from_cache(
+        self,
+        weight_service: HegemonyWeightService,
+        mock_weight_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should query the repository once but check access every time"""
+        # Arrange
+        weights = [create_weight(alliance_id, season_id)]
+        mock_weight_repo.get_with_snapshot_info = AsyncMock(return_value=weights)
+
+        # Act
+        first = await weight_service.get_season_weights(user_id, season_id)
+        second = await weight_service.get_season_weights(user_id, season_id)
+
+        # Assert
+        assert first == second == weights
+        mock_weight_repo.get_with_snapshot_info.assert_awaited_once()
+        assert weight_service._verify_season_access.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_on_update(
+        self,
+        weight_service: HegemonyWeightService,
+        mock_weight_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should refetch weights after one of the season's weights is updated"""
+        # Arrange
+        weight = create_weight(alliance_id, season_id)
+        mock_weight_repo.get_with_snapshot_info = AsyncMock(return_value=[weight])
+        mock_weight_repo.update_weights = AsyncMock(return_value=weight)
+        weight_service._verify_weight_access = AsyncMock(return_value=(weight, alliance_id))
+        await weight_service.get_season_weights(user_id, season_id)
+
+        # Act
+        await weight_service.update_weight(
+            user_id, weight.id, HegemonyWeightUpdate(snapshot_weight=Decimal("0.5"))
+        )
+        await weight_service.get_season_weights(user_id, season_id)
+
+        # Assert
+        assert mock_weight_repo.get_with_snapshot_info.await_count == 2
+
+
+# =============================================================================
+# Tests for calculate_hegemony_scores
+# =============================================================================
+
+
+class TestCalculateHegemonyScores:
+    """Tests for score preview caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_cached_ranking_for_different_limits(
+        self,
+        weight_service: HegemonyWeightService,
+        mock_weight_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+        season_id: UUID,
+    ):
+        """Should compute the ranking once and slice it per limit"""
+        # Arrange
+        weight = create_weight(alliance_id, season_id)
+        mock_weight_repo.get_with_snapshot_info = AsyncMock(return_value=[weight])
+        weight_service._snapshot_repo.get_by_uploads_batch = AsyncMock(
+            return_value=[
+                create_snapshot(alliance_id, weight.csv_upload_id, "張飛", 100),
+                create_snapshot(alliance_id, weight.csv_upload_id, "關羽", 400),
+            ]
+        )
+
+        # Act
+        top_one = await weight_service.calculate_hegemony_scores(user_id, season_id, limit=1)
+        top_all = await weight_service.calculate_hegemony_scores(user_id, season_id, limit=20)
+
+        # Assert
+        assert [p.member_name for p in top_one] == ["關羽"]
+        assert [p.member_name for p in top_all] == ["關羽", "張飛"]
+        assert [p.rank for p in top_all] == [1, 2]
+        weight_service._snapshot_repo.get_by_uploads_batch.assert_awaited_once()
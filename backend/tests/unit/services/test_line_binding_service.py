@@ -0,0 +1,255 @@
+"""
+Unit Tests for LineBindingService
+
+Tests cover:
+1. Group bound lookup caching (is_group_bound)
+2. Cache invalidation on unbind
+3. Short-lived "don't notify" caching (should_send_liff_notification)
+4. Custom command lookup caching (get_custom_command_response)
+
+符合 test-writing skill 規範:
+- AAA pattern (Arrange-Act-Assert)
+- Mocked repository dependencies
+- Coverage: happy path + edge cases + error cases
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.models.line_binding import LineCustomCommand, LineGroupBinding
+from src.services.line_binding_service import (
+    LineBindingService,
+    invalidate_cached_group_bindings,
+)
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def alliance_id() -> UUID:
+    """Fixed alliance UUID for testing"""
+    return UUID("22222222-2222-2222-2222-222222222222")
+
+
+@pytest.fixture
+def line_group_id() -> str:
+    """Fixed LINE group ID for testing"""
+    return "C1234567890abcdef"
+
+
+@pytest.fixture
+def mock_repository() -> MagicMock:
+    """Create mock LINE binding repository"""
+    return MagicMock()
+
+
+@pytest.fixture
+def binding_service(mock_repository: MagicMock) -> LineBindingService:
+    """Create LineBindingService with mocked repository"""
+    return LineBindingService(repository=mock_repository)
+
+
+def create_group_binding(alliance_id: UUID, line_group_id: str) -> LineGroupBinding:
+    """Factory for group binding test data"""
+    now = datetime.now()
+    return LineGroupBinding(
+        id=uuid4(),
+        alliance_id=alliance_id,
+        line_group_id=line_group_id,
+        bound_by_line_user_id="U1234567890abcdef",
+        bound_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+# =============================================================================
+# Tests for is_group_bound
+# =============================================================================
+
+
+class TestIsGroupBound:
+    """Tests for group bound lookup caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_cache_unbound_group(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        line_group_id: str,
+    ):
+        """Should query the repository once for repeated unbound lookups"""
+        # Arrange
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(return_value=None)
+
+        # Act
+        first = await binding_service.is_group_bound(line_group_id)
+        second = await binding_service.is_group_bound(line_group_id)
+
+        # Assert
+        assert first is False
+        assert second is False
+        mock_repository.get_group_binding_by_line_group_id.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_on_unbind(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        alliance_id: UUID,
+        line_group_id: str,
+    ):
+        """Should refetch after the group is unbound"""
+        # Arrange
+        binding = create_group_binding(alliance_id, line_group_id)
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(return_value=binding)
+        mock_repository.get_active_group_binding_by_alliance = AsyncMock(return_value=binding)
+        mock_repository.deactivate_group_binding = AsyncMock()
+        assert await binding_service.is_group_bound(line_group_id) is True
+
+        # Act
+        await binding_service.unbind_group(alliance_id)
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(return_value=None)
+        result = await binding_service.is_group_bound(line_group_id)
+
+        # Assert
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_cache_when_alliance_deleted(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        alliance_id: UUID,
+        line_group_id: str,
+    ):
+        """Should refetch after the alliance and its binding are deleted"""
+        # Arrange
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(
+            return_value=create_group_binding(alliance_id, line_group_id)
+        )
+        assert await binding_service.is_group_bound(line_group_id) is True
+
+        # Act
+        invalidate_cached_group_bindings(alliance_id)
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(return_value=None)
+        result = await binding_service.is_group_bound(line_group_id)
+
+        # Assert
+        assert result is False
+
+
+# =============================================================================
+# Tests for should_send_liff_notification
+# =============================================================================
+
+
+class TestShouldSendLiffNotification:
+    """Tests for LIFF notification checks"""
+
+    @pytest.mark.asyncio
+    async def test_should_skip_queries_for_recently_registered_user(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        alliance_id: UUID,
+        line_group_id: str,
+    ):
+        """Should reuse a negative result instead of querying again"""
+        # Arrange
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(
+            return_value=create_group_binding(alliance_id, line_group_id)
+        )
+        mock_repository.is_user_registered_in_alliance = AsyncMock(return_value=True)
+        mock_repository.has_user_been_notified_since = AsyncMock(return_value=False)
+
+        # Act
+        first = await binding_service.should_send_liff_notification(line_group_id, "U1")
+        second = await binding_service.should_send_liff_notification(line_group_id, "U1")
+
+        # Assert
+        assert first is False
+        assert second is False
+        mock_repository.is_user_registered_in_alliance.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_notify_unregistered_user(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        alliance_id: UUID,
+        line_group_id: str,
+    ):
+        """Should return True when registered/notified checks both pass"""
+        # Arrange
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(
+            return_value=create_group_binding(alliance_id, line_group_id)
+        )
+        mock_repository.is_user_registered_in_alliance = AsyncMock(return_value=False)
+        mock_repository.has_user_been_notified_since = AsyncMock(return_value=False)
+
+        # Act
+        result = await binding_service.should_send_liff_notification(line_group_id, "U1")
+
+        # Assert
+        assert result is True
+        mock_repository.is_user_registered_in_alliance.assert_awaited_once_with(
+            alliance_id=alliance_id, line_user_id="U1"
+        )
+
+
+# =============================================================================
+# Tests for get_custom_command_response
+# =============================================================================
+
+
+class TestGetCustomCommandResponse:
+    """Tests for custom command lookup caching"""
+
+    @pytest.mark.asyncio
+    async def test_should_cache_command_until_commands_change(
+        self,
+        binding_service: LineBindingService,
+        mock_repository: MagicMock,
+        alliance_id: UUID,
+        line_group_id: str,
+    ):
+        """Should query once per keyword and refetch after a delete"""
+        # Arrange
+        now = datetime.now()
+        command = LineCustomCommand(
+            id=uuid4(),
+            alliance_id=alliance_id,
+            command_name="規則",
+            trigger_keyword="/規則",
+            response_message="請遵守盟規",
+            is_enabled=True,
+            created_by=uuid4(),
+            created_at=now,
+            updated_at=now,
+        )
+        mock_repository.get_group_binding_by_line_group_id = AsyncMock(
+            return_value=create_group_binding(alliance_id, line_group_id)
+        )
+        mock_repository.get_custom_command_by_trigger = AsyncMock(return_value=command)
+        mock_repository.get_custom_command_by_id = AsyncMock(return_value=command)
+        mock_repository.delete_custom_command = AsyncMock()
+
+        # Act
+        first = await binding_service.get_custom_command_response(line_group_id, "/規則")
+        second = await binding_service.get_custom_command_response(line_group_id, "/規則")
+        cached_lookup = mock_repository.get_custom_command_by_trigger
+        await binding_service.delete_custom_command(alliance_id, command.id)
+        mock_repository.get_custom_command_by_trigger = AsyncMock(return_value=None)
+        after_delete = await binding_service.get_custom_command_response(line_group_id, "/規則")
+
+        # Assert
+        assert first == second
+        cached_lookup.assert_awaited_once()
+        assert first.response_message == "請遵守盟規"
+        assert after_delete is None
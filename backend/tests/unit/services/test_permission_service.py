@@ -6,6 +6,7 @@ Tests cover:
 2. Permission checking (check_permission)
 3. Permission enforcement (require_permission, require_owner, etc.)
 4. Error handling and edge cases
+5. Role cache and invalidation
 
 符合 test-writing skill 規範:
 - AAA pattern (Arrange-Act-Assert)
@@ -18,6 +19,7 @@ from uuid import UUID
 
 import pytest
 
+from src.core.exceptions import SubscriptionExpiredError
 from src.services.permission_service import PermissionService
 
 
@@ -161,6 +163,71 @@ class TestGetUserRole:
         assert "Failed to get user role" in str(exc_info.value)
 
 
+class TestUserRoleCache:
+    """Tests for the shared role cache in get_user_role"""
+
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_lookups_from_cache(
+        self,
+        permission_service: PermissionService,
+        mock_collaborator_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should query the repository once for a found role"""
+        # Arrange
+        mock_collaborator_repo.get_collaborator_role = AsyncMock(return_value="owner")
+
+        # Act
+        await permission_service.get_user_role(user_id, alliance_id)
+        result = await permission_service.get_user_role(user_id, alliance_id)
+
+        # Assert
+        assert result == "owner"
+        mock_collaborator_repo.get_collaborator_role.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_non_membership(
+        self,
+        permission_service: PermissionService,
+        mock_collaborator_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should re-query when the user was not a member"""
+        # Arrange
+        mock_collaborator_repo.get_collaborator_role = AsyncMock(return_value=None)
+
+        # Act
+        await permission_service.get_user_role(user_id, alliance_id)
+        await permission_service.get_user_role(user_id, alliance_id)
+
+        # Assert
+        assert mock_collaborator_repo.get_collaborator_role.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_refetch_after_invalidation(
+        self,
+        permission_service: PermissionService,
+        mock_collaborator_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should drop the cached role when membership changes"""
+        # Arrange
+        mock_collaborator_repo.get_collaborator_role = AsyncMock(
+            side_effect=["collaborator", "member"]
+        )
+        await permission_service.get_user_role(user_id, alliance_id)
+
+        # Act
+        PermissionService().invalidate_user_role(alliance_id, user_id)
+        result = await permission_service.get_user_role(user_id, alliance_id)
+
+        # Assert
+        assert result == "member"
+
+
 class TestCheckPermission:
     """Tests for PermissionService.check_permission"""
 
@@ -521,3 +588,47 @@ class TestRequireWritePermission:
         mock_subscription_service.require_write_access.assert_called_once_with(
             alliance_id, "upload CSV"
         )
+
+    @pytest.mark.asyncio
+    async def test_should_raise_role_error_before_subscription_error(
+        self,
+        mock_collaborator_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should report the role failure when both checks fail concurrently"""
+        # Arrange
+        mock_subscription_service = MagicMock()
+        mock_subscription_service.require_write_access = AsyncMock(
+            side_effect=SubscriptionExpiredError("subscription expired")
+        )
+
+        service = PermissionService(subscription_service=mock_subscription_service)
+        service._collaborator_repo = mock_collaborator_repo
+        mock_collaborator_repo.get_collaborator_role = AsyncMock(return_value="member")
+
+        # Act & Assert
+        with pytest.raises(PermissionError):
+            await service.require_write_permission(user_id, alliance_id, "upload CSV")
+
+    @pytest.mark.asyncio
+    async def test_should_raise_subscription_error_when_role_passes(
+        self,
+        mock_collaborator_repo: MagicMock,
+        user_id: UUID,
+        alliance_id: UUID,
+    ):
+        """Should surface the subscription failure for an authorized role"""
+        # Arrange
+        mock_subscription_service = MagicMock()
+        mock_subscription_service.require_write_access = AsyncMock(
+            side_effect=SubscriptionExpiredError("subscription expired")
+        )
+
+        service = PermissionService(subscription_service=mock_subscription_service)
+        service._collaborator_repo = mock_collaborator_repo
+        mock_collaborator_repo.get_collaborator_role = AsyncMock(return_value="owner")
+
+        # Act & Assert
+        with pytest.raises(SubscriptionExpiredError):
+            await service.require_write_permission(user_id, alliance_id, "upload CSV")